@@ -10,6 +10,7 @@ from wisp_framework.lifecycle import (
     create_bot_context,
     create_feature_flags,
     create_services,
+    event_loop_factory,
 )
 from wisp_framework.logging import setup_logging
 from wisp_framework.modules.core_admin import CoreAdminModule
@@ -64,7 +65,7 @@ def main() -> None:
             await bot.start(config.discord_token)
 
         # Run bot
-        asyncio.run(run())
+        asyncio.run(run(), loop_factory=event_loop_factory(config))
 
     except Exception as e:
         logger.error(f"Failed to start bot: {e}", exc_info=True)
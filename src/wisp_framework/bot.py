@@ -55,6 +55,15 @@ class WispBot(commands.Bot):
             pipeline=self.pipeline,
         )
 
+    @property
+    def user_count(self) -> int:
+        """Number of cached users.
+
+        ``Client.users`` copies the user cache into a list, so callers on hot
+        paths should cache the result (``/botinfo`` reuses it for 30 seconds).
+        """
+        return len(self.users)
+
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
         self.started_at = datetime.utcnow()
@@ -192,6 +192,11 @@ class AppConfig:
         """Logging level."""
         return os.getenv("LOG_LEVEL", "INFO").upper()
 
+    @property
+    def log_format(self) -> str:
+        """Log output format ("text" or "json")."""
+        return os.getenv("LOG_FORMAT", "text").lower()
+
     @property
     def logging_level(self) -> str:
         """Logging level (alias for log_level for backward compatibility)."""
@@ -202,6 +207,11 @@ class AppConfig:
         """Whether to sync commands on startup."""
         return self._get_bool("SYNC_ON_STARTUP", True)
 
+    @property
+    def use_uvloop(self) -> bool:
+        """Whether to run on uvloop when it is installed."""
+        return self._get_bool("USE_UVLOOP", True)
+
     @property
     def owner_id(self) -> int | None:
         """Bot owner Discord user ID (optional)."""
@@ -236,6 +246,11 @@ class AppConfig:
         """Default welcome channel ID (optional)."""
         return self._get_int("WELCOME_CHANNEL_ID")
 
+    @property
+    def welcome_channel_per_guild(self) -> bool:
+        """Whether per-guild GuildConfig welcome channels override WELCOME_CHANNEL_ID."""
+        return self._get_bool("WELCOME_CHANNEL_PER_GUILD", True)
+
     @property
     def sentry_dsn(self) -> str | None:
         """Sentry DSN for error tracking (optional)."""
@@ -267,6 +282,11 @@ class AppConfig:
         """Database connection pool recycle time in seconds."""
         return self._get_int("DB_POOL_RECYCLE") or self._get_int("DB_POOL_RECYCLE_SECONDS", 3600) or 3600
 
+    @property
+    def db_query_cache_size(self) -> int:
+        """Number of compiled SQL statements the engine keeps cached."""
+        return self._get_int("DB_QUERY_CACHE_SIZE", 1200) or 1200
+
     @property
     def db_echo_sql(self) -> bool:
         """Whether to echo SQL queries (useful for debugging)."""
@@ -2,6 +2,9 @@
 
 import logging
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from wisp_framework.config import AppConfig
@@ -12,6 +15,32 @@ from wisp_framework.services.base import ServiceContainer
 if TYPE_CHECKING:
     from wisp_framework.policy.engine import PolicyEngine
 
+# Database session shared by every handler of the event being routed; set via
+# event_session() by EventRouter.route for the duration of the event
+_event_session_var: ContextVar[Any | None] = ContextVar("wisp_event_session", default=None)
+
+
+def current_event_session() -> Any | None:
+    """Get the database session of the event being routed, if any."""
+    return _event_session_var.get()
+
+
+@contextmanager
+def event_session(session: Any | None) -> Iterator[Any | None]:
+    """Share a database session with every handler of the event being routed.
+
+    Args:
+        session: Session returned by ``current_event_session()`` inside the block
+
+    Yields:
+        The session
+    """
+    token = _event_session_var.set(session)
+    try:
+        yield session
+    finally:
+        _event_session_var.reset(token)
+
 
 class BotContext:
     """Context object passed to modules with services and configuration."""
@@ -33,6 +62,8 @@ class WispContext(BotContext):
 
     This context is created for every command, event, or job execution.
     It provides request_id tracking, bound logger, and lazy handles to services.
+    The request_id and guild data service are only created when first used, so
+    handlers that never touch them don't pay for them.
     """
 
     def __init__(
@@ -60,8 +91,11 @@ class WispContext(BotContext):
             guild_data: Optional guild data service
             feature_flags: Optional feature flags instance
         """
-        super().__init__(config, services, guild_data)
-        self.request_id = request_id or str(uuid.uuid4())
+        # BotContext.__init__ would build a GuildDataService eagerly
+        self.config = config
+        self.services = services
+        self._guild_data = guild_data
+        self._request_id = request_id
         self.invocation_type = invocation_type
         self.guild_id = guild_id
         self.channel_id = channel_id
@@ -71,6 +105,28 @@ class WispContext(BotContext):
         self._db_session: Any | None = None
         self._policy: PolicyEngine | None = None
 
+    @property
+    def request_id(self) -> str:
+        """Get the request ID, generating one on first access."""
+        if not self._request_id:
+            self._request_id = str(uuid.uuid4())
+        return self._request_id
+
+    @request_id.setter
+    def request_id(self, value: str) -> None:
+        self._request_id = value
+
+    @property
+    def guild_data(self) -> GuildDataService:
+        """Get the guild data service, creating one on first access."""
+        if self._guild_data is None:
+            self._guild_data = GuildDataService(self.services.get("db"))
+        return self._guild_data
+
+    @guild_data.setter
+    def guild_data(self, value: GuildDataService) -> None:
+        self._guild_data = value
+
     @property
     def bound_logger(self) -> logging.Logger:
         """Get logger bound with request_id context."""
@@ -82,7 +138,9 @@ class WispContext(BotContext):
 
     @property
     def db_session(self) -> Any:
-        """Get lazy database session handle."""
+        """Get lazy database session handle (the routed event's session if there is one)."""
+        if self._db_session is None:
+            self._db_session = _event_session_var.get()
         if self._db_session is None:
             db_service = self.services.get("db")
             if db_service and hasattr(db_service, "session_factory"):
@@ -6,7 +6,14 @@ from collections.abc import Awaitable, Callable
 from typing import Any, Protocol
 
 from wisp_framework.context import WispContext
-from wisp_framework.exceptions import WispError, map_error_to_response
+from wisp_framework.exceptions import (
+    PermissionError,
+    RateLimitedError,
+    WispError,
+    map_error_to_response,
+)
+from wisp_framework.observability.metrics import normalize_metric_name, record_command_metric
+from wisp_framework.ratelimit.limiter import TokenBucketLimiter, get_rate_limit_key
 
 logger = logging.getLogger(__name__)
 
@@ -106,12 +113,8 @@ class PolicyMiddleware:
         # Check policy
         result = await ctx.policy.check(capability, ctx)
         if not result.allowed:
-            from wisp_framework.exceptions import PermissionError
-
             ctx.bound_logger.warning(f"Policy check failed: {result.reason}")
             if ctx.metrics:
-                from wisp_framework.observability.metrics import record_command_metric
-
                 record_command_metric(ctx.metrics, ctx.invocation_type, "permission_denied")
             raise PermissionError(
                 safe_message="You don't have permission to perform this action.",
@@ -144,14 +147,9 @@ class RateLimitMiddleware:
             # Try to get from services
             cache_service = ctx.services.get("cache")
             if cache_service:
-                from wisp_framework.ratelimit.limiter import TokenBucketLimiter, get_rate_limit_key
-
                 self._limiter = TokenBucketLimiter(cache_service)
 
         if self._limiter:
-            from wisp_framework.exceptions import RateLimitedError
-            from wisp_framework.ratelimit.limiter import get_rate_limit_key
-
             # Check rate limit for user
             key = get_rate_limit_key(ctx, "user")
             allowed, remaining = await self._limiter.check(key, limit=10, window=60)
@@ -159,8 +157,6 @@ class RateLimitMiddleware:
             if not allowed:
                 ctx.bound_logger.warning(f"Rate limit exceeded for {key}")
                 if ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(ctx.metrics, ctx.invocation_type, "rate_limited")
                 raise RateLimitedError(
                     safe_message="You're being rate limited. Please try again later.",
@@ -223,6 +219,20 @@ class MetricsMiddleware:
             metric_name: Optional metric name (defaults to invocation_type)
         """
         self.metric_name = metric_name
+        # (duration, success, error) metric names per base name, built on first use
+        self._names: dict[str, tuple[str, str, str]] = {}
+
+    def _metric_names(self, ctx: WispContext) -> tuple[str, str, str]:
+        """Get the duration/success/error metric names for this execution."""
+        base = self.metric_name or ctx.invocation_type
+        names = self._names.get(base)
+        if names is None:
+            names = self._names[base] = (
+                normalize_metric_name(base, "duration"),
+                normalize_metric_name(base, "success"),
+                normalize_metric_name(base, "error"),
+            )
+        return names
 
     async def before(self, ctx: WispContext) -> None:
         """Record start time."""
@@ -231,22 +241,18 @@ class MetricsMiddleware:
     async def after(self, ctx: WispContext, result: Any) -> None:
         """Record success metrics."""
         if ctx.metrics:
-            from wisp_framework.observability.metrics import normalize_metric_name
-
             duration = time.time() - getattr(ctx, "_pipeline_start_time", 0)
-            metric_name = self.metric_name or ctx.invocation_type
-            ctx.metrics.timing(normalize_metric_name(metric_name, "duration"), duration)
-            ctx.metrics.increment(normalize_metric_name(metric_name, "success"))
+            duration_name, success_name, _ = self._metric_names(ctx)
+            ctx.metrics.timing(duration_name, duration)
+            ctx.metrics.increment(success_name)
 
     async def on_error(self, ctx: WispContext, exc: Exception) -> Exception | None:
         """Record error metrics."""
         if ctx.metrics:
-            from wisp_framework.observability.metrics import normalize_metric_name
-
             duration = time.time() - getattr(ctx, "_pipeline_start_time", 0)
-            metric_name = self.metric_name or ctx.invocation_type
-            ctx.metrics.timing(normalize_metric_name(metric_name, "duration"), duration)
-            ctx.metrics.increment(normalize_metric_name(metric_name, "error"))
+            duration_name, _, error_name = self._metric_names(ctx)
+            ctx.metrics.timing(duration_name, duration)
+            ctx.metrics.increment(error_name)
         return exc
 
 
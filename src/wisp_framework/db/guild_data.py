@@ -1,15 +1,24 @@
 """GuildDataService for easy per-guild data storage."""
 
 import logging
+from itertools import batched
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import BigInteger, Text, cast, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from wisp_framework.db.models import GuildData
 from wisp_framework.services.db import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Conflict target matching the uq_guild_data_guild_key_module unique index
+_GUILD_DATA_KEY = ["guild_id", "key", text("coalesce(module_name, '')")]
+
+# Rows per INSERT in bulk writes, keeping each statement well under
+# PostgreSQL's 32767 bind parameter limit
+_BULK_INSERT_ROWS = 1000
+
 
 class GuildDataService:
     """Service for storing and retrieving per-guild data."""
@@ -90,6 +99,79 @@ class GuildDataService:
             except Exception as e:
                 logger.warning(f"Database set failed: {e}, using memory cache only")
 
+    async def increment(
+        self,
+        guild_id: int,
+        key: str,
+        delta: int = 1,
+        module_name: str | None = None,
+    ) -> int:
+        """Atomically increment an integer counter for a guild.
+
+        Returns:
+            The new counter value
+        """
+        counts = await self.bulk_increment([guild_id], key, module_name=module_name, delta=delta)
+        return counts[guild_id]
+
+    async def bulk_increment(
+        self,
+        guild_ids: list[int],
+        key: str,
+        module_name: str | None = None,
+        delta: int = 1,
+    ) -> dict[int, int]:
+        """Atomically increment an integer counter for several guilds.
+
+        Issues INSERT ... ON CONFLICT DO UPDATE ... RETURNING in chunks of
+        ``_BULK_INSERT_ROWS`` within one transaction, so missing counters start
+        at ``delta`` and concurrent increments are never lost.
+
+        Returns:
+            Mapping of guild ID to the new counter value
+        """
+        counts: dict[int, int] = {}
+
+        # Try database
+        if guild_ids and self._db_service and self._db_service.session_factory:
+            try:
+                async with self._db_service.session_factory() as session:
+                    for chunk in batched(dict.fromkeys(guild_ids), _BULK_INSERT_ROWS, strict=False):
+                        stmt = pg_insert(GuildData).values([
+                            {
+                                "guild_id": guild_id,
+                                "key": key,
+                                "value": delta,
+                                "module_name": module_name,
+                            }
+                            for guild_id in chunk
+                        ])
+                        stmt = stmt.on_conflict_do_update(
+                            index_elements=_GUILD_DATA_KEY,
+                            set_={
+                                "value": func.to_jsonb(
+                                    cast(cast(GuildData.value, Text), BigInteger) + delta
+                                ),
+                                "updated_at": func.now(),
+                            },
+                        ).returning(GuildData.guild_id, GuildData.value)
+                        db_result = await session.execute(stmt)
+                        counts.update(db_result.tuples())
+                    await session.commit()
+            except Exception as e:
+                logger.warning(f"Database bulk_increment failed: {e}, using memory cache")
+                counts = {}
+
+        # Fall back to memory cache
+        if not counts:
+            for guild_id in guild_ids:
+                current = self._memory_cache.get((guild_id, key, module_name)) or 0
+                counts[guild_id] = current + delta
+
+        for guild_id, value in counts.items():
+            self._memory_cache[(guild_id, key, module_name)] = value
+        return counts
+
     async def delete(
         self,
         guild_id: int,
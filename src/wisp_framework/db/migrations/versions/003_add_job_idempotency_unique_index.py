@@ -0,0 +1,38 @@
+"""Add partial unique index on active job idempotency keys
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: str = '002'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Drop duplicate active jobs (keeping the newest) before enforcing uniqueness;
+    # finished jobs are history and may share a key
+    op.execute(sa.text(
+        "DELETE FROM jobs a USING jobs b "
+        "WHERE a.idempotency_key = b.idempotency_key AND a.id < b.id "
+        "AND a.status IN ('pending', 'running') AND b.status IN ('pending', 'running')"
+    ))
+    # Only one pending/running job may hold a given idempotency key
+    op.create_index(
+        'uq_jobs_active_idempotency_key',
+        'jobs',
+        ['idempotency_key'],
+        unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_jobs_active_idempotency_key', table_name='jobs')
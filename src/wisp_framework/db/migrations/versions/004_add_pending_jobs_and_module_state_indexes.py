@@ -0,0 +1,41 @@
+"""Add pending jobs partial index and module state uniqueness
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: str = '003'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Index only pending jobs so polling ignores completed/dead-letter history
+    op.create_index(
+        'ix_jobs_pending_next_run_at',
+        'jobs',
+        ['next_run_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+    # Drop duplicate module states (keeping the newest row) before enforcing uniqueness
+    op.execute(sa.text(
+        "DELETE FROM module_states a USING module_states b "
+        "WHERE a.guild_id = b.guild_id AND a.module_name = b.module_name AND a.id < b.id"
+    ))
+    op.create_unique_constraint(
+        'uq_module_states_guild_module', 'module_states', ['guild_id', 'module_name']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_module_states_guild_module', 'module_states', type_='unique')
+    op.drop_index('ix_jobs_pending_next_run_at', table_name='jobs')
@@ -0,0 +1,36 @@
+"""Add guild data key uniqueness
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: str = '004'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Drop duplicate keys (keeping the newest row) before enforcing uniqueness
+    op.execute(sa.text(
+        "DELETE FROM guild_data a USING guild_data b "
+        "WHERE a.guild_id = b.guild_id AND a.key = b.key "
+        "AND a.module_name IS NOT DISTINCT FROM b.module_name AND a.id < b.id"
+    ))
+    # module_name is nullable; coalesce so NULL namespaces collide too
+    op.create_index(
+        'uq_guild_data_guild_key_module',
+        'guild_data',
+        ['guild_id', 'key', sa.text("coalesce(module_name, '')")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_guild_data_guild_key_module', table_name='guild_data')
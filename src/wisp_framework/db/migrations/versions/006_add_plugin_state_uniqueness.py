@@ -0,0 +1,36 @@
+"""Add plugin state uniqueness
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: str = '005'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Drop duplicate states (keeping the newest row) before enforcing uniqueness
+    op.execute(sa.text(
+        "DELETE FROM plugin_states a USING plugin_states b "
+        "WHERE a.plugin_name = b.plugin_name "
+        "AND a.guild_id IS NOT DISTINCT FROM b.guild_id AND a.id < b.id"
+    ))
+    # guild_id is NULL for global state; coalesce so global rows collide too
+    op.create_index(
+        'uq_plugin_states_plugin_guild',
+        'plugin_states',
+        ['plugin_name', sa.text("coalesce(guild_id, 0)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_plugin_states_plugin_guild', table_name='plugin_states')
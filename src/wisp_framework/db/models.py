@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import BigInteger, Boolean, DateTime, Integer, String
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Integer, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -31,6 +31,7 @@ class ModuleState(Base, TimestampMixin):
     enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     __table_args__ = (
+        UniqueConstraint("guild_id", "module_name", name="uq_module_states_guild_module"),
         {"comment": "Tracks which modules are enabled/disabled per guild"},
     )
 
@@ -49,6 +50,14 @@ class GuildData(Base, TimestampMixin):
     )
 
     __table_args__ = (
+        # One value per key and module namespace (enables ON CONFLICT upserts)
+        Index(
+            "uq_guild_data_guild_key_module",
+            "guild_id",
+            "key",
+            text("coalesce(module_name, '')"),
+            unique=True,
+        ),
         {"comment": "Generic key-value storage for per-guild data"},
     )
 
@@ -68,6 +77,13 @@ class PluginState(Base, TimestampMixin):
     loaded_at: Mapped[Any] = mapped_column(JSONB, nullable=True)
 
     __table_args__ = (
+        # One row per plugin and guild, global rows included (enables ON CONFLICT upserts)
+        Index(
+            "uq_plugin_states_plugin_guild",
+            "plugin_name",
+            text("coalesce(guild_id, 0)"),
+            unique=True,
+        ),
         {"comment": "Tracks plugin state per guild and globally"},
     )
 
@@ -107,5 +123,18 @@ class Job(Base, TimestampMixin):
     error_message: Mapped[str | None] = mapped_column(String(1000), nullable=True)
 
     __table_args__ = (
+        # Job polling only scans pending rows, so keep history out of the index
+        Index(
+            "ix_jobs_pending_next_run_at",
+            "next_run_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # At most one active job per idempotency key (enables ON CONFLICT enqueue)
+        Index(
+            "uq_jobs_active_idempotency_key",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
         {"comment": "Background jobs for durable task execution"},
     )
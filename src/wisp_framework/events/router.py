@@ -1,11 +1,12 @@
 """Event router for centralized event handling."""
 
+import contextlib
 import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
-from wisp_framework.context import WispContext
+from wisp_framework.context import WispContext, event_session
 from wisp_framework.core.pipeline import Pipeline, create_default_pipeline
 from wisp_framework.observability.metrics import record_event_metric
 
@@ -197,11 +198,41 @@ class EventRouter:
 
         ctx.bound_logger.debug(f"Routing event '{event_name}' to {len(enabled_handlers)} handler(s)")
 
+        # Handlers share one session (connected on first use) instead of each opening their own
+        db_service = ctx.services.get("db")
+        session_factory = db_service.session_factory if db_service else None
+        async with (session_factory() if session_factory else contextlib.nullcontext()) as session:
+            with event_session(session):
+                success_count, error_count = await self._run_handlers(
+                    event_name, event, ctx, enabled_handlers, session
+                )
+
+        # Record aggregate metrics
+        if ctx.metrics:
+            record_event_metric(ctx.metrics, event_name, "routed")
+            if success_count > 0:
+                record_event_metric(ctx.metrics, event_name, "success")
+            if error_count > 0:
+                record_event_metric(ctx.metrics, event_name, "error")
+
+    async def _run_handlers(
+        self,
+        event_name: str,
+        event: Any,
+        ctx: WispContext,
+        handlers: list[EventHandler],
+        session: Any | None,
+    ) -> tuple[int, int]:
+        """Run handlers for an event through the pipeline.
+
+        Returns:
+            Tuple of (success count, error count)
+        """
         # Route each handler through pipeline
         success_count = 0
         error_count = 0
 
-        for handler_obj in enabled_handlers:
+        for handler_obj in handlers:
             try:
                 # Set event_name in context for metrics (create a copy to avoid mutation)
                 handler_ctx = WispContext(
@@ -237,13 +268,12 @@ class EventRouter:
                     exc_info=True,
                 )
 
-        # Record aggregate metrics
-        if ctx.metrics:
-            record_event_metric(ctx.metrics, event_name, "routed")
-            if success_count > 0:
-                record_event_metric(ctx.metrics, event_name, "success")
-            if error_count > 0:
-                record_event_metric(ctx.metrics, event_name, "error")
+            # Handlers commit their own writes; end anything left open (such as a
+            # transaction aborted by a failed statement) so the next handler starts clean
+            if session is not None and session.in_transaction():
+                await session.rollback()
+
+        return success_count, error_count
 
     async def _should_process(self, event: Any, ctx: WispContext) -> bool:
         """Check if event should be processed based on filters.
@@ -111,6 +111,17 @@ class ValidationError(FrameworkError):
     pass
 
 
+# Default responses per error type, resolved by walking the exception's MRO.
+# WispError instances with a safe message always use their own message instead.
+_ERROR_RESPONSES: dict[type[Exception], tuple[str, bool]] = {
+    PermissionError: ("You don't have permission to perform this action.", True),
+    NotFoundError: ("The requested resource was not found.", True),
+    RateLimitedError: ("You're being rate limited. Please try again later.", True),
+    ExternalServiceError: ("An external service error occurred. Please try again later.", True),
+}
+_GENERIC_ERROR_RESPONSE = ("An error occurred while executing the command.", True)
+
+
 def map_error_to_response(error: Exception) -> tuple[str, bool]:
     """Map an exception to a user-friendly Discord response.
 
@@ -121,18 +132,13 @@ def map_error_to_response(error: Exception) -> tuple[str, bool]:
         Tuple of (message, ephemeral) where message is the user-facing message
         and ephemeral indicates if it should be sent as ephemeral
     """
-    if isinstance(error, WispError):
+    if isinstance(error, WispError) and error.safe_message:
         return (error.safe_message, True)
-    elif isinstance(error, PermissionError):
-        return ("You don't have permission to perform this action.", True)
-    elif isinstance(error, NotFoundError):
-        return ("The requested resource was not found.", True)
-    elif isinstance(error, RateLimitedError):
-        return ("You're being rate limited. Please try again later.", True)
-    elif isinstance(error, UserError):
-        return (str(error), True)
-    elif isinstance(error, ExternalServiceError):
-        return ("An external service error occurred. Please try again later.", True)
-    else:
-        # Generic error message for unexpected errors
-        return ("An error occurred while executing the command.", True)
+
+    for cls in type(error).__mro__:
+        response = _ERROR_RESPONSES.get(cls)
+        if response is not None:
+            return response
+
+    # Generic error message for unexpected errors
+    return _GENERIC_ERROR_RESPONSE
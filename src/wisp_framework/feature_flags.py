@@ -1,39 +1,140 @@
 """Feature flags for per-guild module enable/disable."""
 
 import logging
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from wisp_framework.db.models import ModuleState
+from wisp_framework.services.cache import CacheService
 from wisp_framework.services.db import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# Pub/sub channel used to drop cached flags in every process after a change
+INVALIDATION_CHANNEL = "feature_flags:invalidate"
+
+# How long a flag read from the database is served from memory while
+# invalidations are being received; bounds staleness if the listener stops
+_FLAG_CACHE_TTL = 60.0
+
+# Statements built once at import; SQLAlchemy caches their compiled form
+_MODULE_STATE_BY_KEY = select(ModuleState).where(
+    ModuleState.guild_id == bindparam("guild_id"),
+    ModuleState.module_name == bindparam("module_name"),
+)
+_MODULE_STATES_BY_GUILD = select(ModuleState).where(ModuleState.guild_id == bindparam("guild_id"))
+_MODULE_STATES_BY_GUILD_AND_NAMES = select(ModuleState).where(
+    ModuleState.guild_id == bindparam("guild_id"),
+    ModuleState.module_name.in_(bindparam("module_names", expanding=True)),
+)
+
 
 class FeatureFlags:
     """Manages feature flags (module enable/disable) per guild."""
 
-    def __init__(self, db_service: DatabaseService | None) -> None:
-        """Initialize feature flags."""
+    def __init__(
+        self,
+        db_service: DatabaseService | None,
+        cache_service: CacheService | None = None,
+    ) -> None:
+        """Initialize feature flags.
+
+        Args:
+            db_service: Database service for persisted module states
+            cache_service: Optional cache service used to broadcast invalidations
+                to other processes (requires the Redis backend)
+        """
         self._db_service = db_service
+        self._cache_service = cache_service
         self._memory_cache: dict[tuple[int, str], bool] = {}
+        # Resolved lazily: flags are created before the database service starts
+        self._session_factory: Any | None = None
+        self._subscribed = False
+        # True once invalidation messages are actually being received
+        self._invalidations_active = False
+        # Monotonic deadline until which a cached flag needs no database read
+        self._fresh_until: dict[tuple[int, str], float] = {}
+        # Bumped per invalidation, so reads that raced one aren't trusted
+        self._invalidation_seq = 0
+        # Tags our own invalidations so we don't act on them
+        self._instance_id = uuid.uuid4().hex
+
+    async def _ensure_subscribed(self) -> None:
+        """Subscribe to invalidation messages once the cache service is up."""
+        if self._subscribed or self._cache_service is None:
+            return
+        if not self._cache_service.initialized:
+            return
+        self._subscribed = True
+        self._invalidations_active = await self._cache_service.subscribe(
+            INVALIDATION_CHANNEL, self._handle_invalidation
+        )
+
+    def _handle_invalidation(self, message: str) -> None:
+        """Drop a cached flag named by a ``"{instance_id}:{guild_id}:{module_name}"`` message."""
+        origin, _, flag = message.partition(":")
+        if origin == self._instance_id:
+            # Our own change; the cache already holds the new value
+            return
+        guild_id, _, module_name = flag.partition(":")
+        try:
+            cache_key = (int(guild_id), module_name)
+        except ValueError:
+            logger.warning(f"Ignoring malformed feature flag invalidation: {message!r}")
+            return
+        self._memory_cache.pop(cache_key, None)
+        self._fresh_until.pop(cache_key, None)
+        self._invalidation_seq += 1
+
+    def _mark_fresh(self, cache_keys: Sequence[tuple[int, str]], seq: int) -> None:
+        """Serve these flags from memory until invalidated or the TTL expires.
+
+        Args:
+            cache_keys: Flags just read from or written to the database
+            seq: ``_invalidation_seq`` from before the database round trip
+        """
+        if self._invalidations_active and seq == self._invalidation_seq:
+            deadline = time.monotonic() + _FLAG_CACHE_TTL
+            for cache_key in cache_keys:
+                self._fresh_until[cache_key] = deadline
+
+    def _is_fresh(self, cache_key: tuple[int, str], now: float) -> bool:
+        """Whether a flag can be served from memory without a database read."""
+        return self._fresh_until.get(cache_key, 0.0) > now
+
+    def _get_session_factory(self) -> Any | None:
+        """Get the database session factory, caching it once available."""
+        sf = self._session_factory
+        if sf is None and self._db_service is not None:
+            sf = self._session_factory = self._db_service.session_factory
+        return sf
 
     async def is_enabled(
         self, guild_id: int, module_name: str, default: bool = True
     ) -> bool:
         """Check if a module is enabled for a guild."""
         cache_key = (guild_id, module_name)
+        if not self._subscribed:
+            await self._ensure_subscribed()
+        if self._is_fresh(cache_key, time.monotonic()):
+            return self._memory_cache.get(cache_key, default)
 
         # Try database first
-        if self._db_service and self._db_service.session_factory:
+        sf = self._get_session_factory()
+        if sf is not None:
+            seq = self._invalidation_seq
             try:
-                async with self._db_service.session_factory() as session:
-                    stmt = select(ModuleState).where(
-                        ModuleState.guild_id == guild_id,
-                        ModuleState.module_name == module_name,
+                async with sf() as session:
+                    result = await session.execute(
+                        _MODULE_STATE_BY_KEY,
+                        {"guild_id": guild_id, "module_name": module_name},
                     )
-                    result = await session.execute(stmt)
                     row = result.scalar_one_or_none()
+                    self._mark_fresh([cache_key], seq)
                     if row:
                         enabled = row.enabled
                         self._memory_cache[cache_key] = enabled
@@ -54,14 +155,15 @@ class FeatureFlags:
         self._memory_cache[cache_key] = enabled
 
         # Try database
-        if self._db_service and self._db_service.session_factory:
+        sf = self._get_session_factory()
+        if sf is not None:
+            seq = self._invalidation_seq
             try:
-                async with self._db_service.session_factory() as session:
-                    stmt = select(ModuleState).where(
-                        ModuleState.guild_id == guild_id,
-                        ModuleState.module_name == module_name,
+                async with sf() as session:
+                    result = await session.execute(
+                        _MODULE_STATE_BY_KEY,
+                        {"guild_id": guild_id, "module_name": module_name},
                     )
-                    result = await session.execute(stmt)
                     row = result.scalar_one_or_none()
 
                     if row:
@@ -77,17 +179,43 @@ class FeatureFlags:
                     await session.commit()
             except Exception as e:
                 logger.warning(f"Database set failed: {e}, using memory cache only")
+                self._fresh_until.pop(cache_key, None)
+            else:
+                self._mark_fresh([cache_key], seq)
+                # Let other processes drop their stale copy of this flag
+                if self._cache_service is not None:
+                    await self._ensure_subscribed()
+                    await self._cache_service.publish(
+                        INVALIDATION_CHANNEL, f"{self._instance_id}:{guild_id}:{module_name}"
+                    )
+
+    async def get_all_enabled(
+        self,
+        guild_id: int,
+        module_names: Sequence[str] | None = None,
+        default: bool = True,
+    ) -> dict[str, bool]:
+        """Get all module states for a guild.
+
+        Args:
+            guild_id: Guild ID
+            module_names: Restrict the lookup to these modules; the result then has
+                exactly one entry per name, using ``default`` for unset modules
+            default: Value for modules in ``module_names`` with no stored state
+        """
+        if module_names is not None:
+            return await self._get_enabled_for(guild_id, module_names, default)
 
-    async def get_all_enabled(self, guild_id: int) -> dict[str, bool]:
-        """Get all module states for a guild."""
         result: dict[str, bool] = {}
 
         # Try database first
-        if self._db_service and self._db_service.session_factory:
+        sf = self._get_session_factory()
+        if sf is not None:
             try:
-                async with self._db_service.session_factory() as session:
-                    stmt = select(ModuleState).where(ModuleState.guild_id == guild_id)
-                    db_result = await session.execute(stmt)
+                async with sf() as session:
+                    db_result = await session.execute(
+                        _MODULE_STATES_BY_GUILD, {"guild_id": guild_id}
+                    )
                     rows = db_result.scalars().all()
                     for row in rows:
                         result[row.module_name] = row.enabled
@@ -104,6 +232,41 @@ class FeatureFlags:
 
         return result
 
+    async def _get_enabled_for(
+        self, guild_id: int, module_names: Sequence[str], default: bool
+    ) -> dict[str, bool]:
+        """Look up states for known modules in one query, keyed by module name."""
+        memory_cache = self._memory_cache
+        found: dict[str, bool] = {}
+
+        if not self._subscribed:
+            await self._ensure_subscribed()
+        now = time.monotonic()
+        stale = [name for name in module_names if not self._is_fresh((guild_id, name), now)]
+
+        sf = self._get_session_factory()
+        if sf is not None and stale:
+            seq = self._invalidation_seq
+            try:
+                async with sf() as session:
+                    db_result = await session.execute(
+                        _MODULE_STATES_BY_GUILD_AND_NAMES,
+                        {"guild_id": guild_id, "module_names": stale},
+                    )
+                    for row in db_result.scalars():
+                        found[row.module_name] = row.enabled
+                        memory_cache[(guild_id, row.module_name)] = row.enabled
+                    self._mark_fresh([(guild_id, name) for name in stale], seq)
+            except Exception as e:
+                logger.warning(f"Database get_all failed: {e}, using memory cache")
+
+        found_get = found.get
+        cache_get = memory_cache.get
+        return {
+            name: found_get(name, cache_get((guild_id, name), default))
+            for name in module_names
+        }
+
     async def is_safe_mode(self) -> bool:
         """Check if safe mode is enabled (framework-level flag).
 
@@ -1,10 +1,12 @@
 """Job queue for enqueueing and managing background jobs."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Integer, bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from wisp_framework.db.models import Job
 from wisp_framework.services.base import BaseService
@@ -13,6 +15,22 @@ from wisp_framework.services.db import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+_ACTIVE_STATUSES = ("pending", "running")
+# Tries at inserting an idempotent job whose conflicting active job keeps finishing
+_ENQUEUE_ATTEMPTS = 3
+
+# Statements built once at import; SQLAlchemy caches their compiled form
+_JOB_BY_IDEMPOTENCY_KEY = select(Job).where(
+    Job.idempotency_key == bindparam("key"),
+    Job.status.in_(_ACTIVE_STATUSES),
+)
+_PENDING_JOBS = (
+    select(Job)
+    .where(Job.status == "pending", Job.next_run_at <= bindparam("now"))
+    .order_by(Job.next_run_at)
+    .limit(bindparam("limit", type_=Integer))
+)
+
 
 class JobQueue(BaseService):
     """Job queue for enqueueing and managing background jobs."""
@@ -27,17 +45,23 @@ class JobQueue(BaseService):
         super().__init__(config)
         self._db_service = db_service
         self._cache_service: CacheService | None = None
+        self._session_factory: Any | None = None
+        # Set whenever this process enqueues a job, so an idle runner can wake early
+        self.job_available = asyncio.Event()
 
     async def startup(self) -> None:
         """Start up the job queue."""
         # Get cache service if available
         # Cache service would be available via service container
         # For now, we'll get it lazily
+        # Resolve the session factory once; the database service starts before us
+        self._session_factory = self._db_service.session_factory if self._db_service else None
         self._mark_initialized()
         logger.info("Job queue started")
 
     async def shutdown(self) -> None:
         """Shut down the job queue."""
+        self._session_factory = None
         logger.info("Job queue shut down")
 
     async def enqueue(
@@ -52,43 +76,73 @@ class JobQueue(BaseService):
         Args:
             job_type: Type of job (e.g., "sync_data", "send_notification")
             payload: Job payload dictionary
-            idempotency_key: Optional idempotency key for deduplication
+            idempotency_key: Optional idempotency key for deduplication; if a
+                pending or running job holds this key it is returned instead of
+                enqueueing a new one
             delay_seconds: Optional delay before job runs
 
         Returns:
-            Created Job instance
+            Created Job instance, or the active job for the idempotency key
         """
-        if not self._db_service or not self._db_service.session_factory:
+        sf = self._session_factory
+        if sf is None:
             raise RuntimeError("Database service not available for job queue")
 
-        # Check for duplicate if idempotency_key provided
-        if idempotency_key:
-            existing = await self._find_by_idempotency_key(idempotency_key)
-            if existing and existing.status in ("pending", "running"):
-                logger.info(f"Job with idempotency_key '{idempotency_key}' already exists")
-                return existing
-
-        async with self._db_service.session_factory() as session:
-            next_run_at = datetime.utcnow() + timedelta(seconds=delay_seconds) if delay_seconds > 0 else datetime.utcnow()
-
-            job = Job(
-                job_type=job_type,
-                status="pending",
-                attempts=0,
-                max_attempts=3,
-                next_run_at=next_run_at,
-                idempotency_key=idempotency_key,
-                payload=payload,
+        next_run_at = datetime.now(UTC)
+        if delay_seconds > 0:
+            next_run_at += timedelta(seconds=delay_seconds)
+
+        values = {
+            "job_type": job_type,
+            "status": "pending",
+            "attempts": 0,
+            "max_attempts": 3,
+            "next_run_at": next_run_at,
+            "idempotency_key": idempotency_key,
+            "payload": payload,
+        }
+
+        if not idempotency_key:
+            async with sf() as session:
+                job = Job(**values)
+                session.add(job)
+                await session.commit()
+                await session.refresh(job)
+        else:
+            # Insert unless an active job already holds this key, in one round-trip
+            stmt = (
+                pg_insert(Job)
+                .values(**values)
+                .on_conflict_do_nothing(
+                    index_elements=["idempotency_key"],
+                    index_where=Job.status.in_(_ACTIVE_STATUSES),
+                )
+                .returning(Job)
             )
-            session.add(job)
-            await session.commit()
-            await session.refresh(job)
+            for _ in range(_ENQUEUE_ATTEMPTS):
+                async with sf() as session:
+                    result = await session.execute(stmt)
+                    job = result.scalar_one_or_none()
+                    await session.commit()
+                if job is not None:
+                    break
+
+                existing = await self._find_by_idempotency_key(idempotency_key)
+                if existing is not None:
+                    logger.info(f"Job with idempotency_key '{idempotency_key}' already exists")
+                    return existing
+                # The conflicting job finished in the meantime; try the insert again
+            else:
+                raise RuntimeError(
+                    f"Could not enqueue job with idempotency_key '{idempotency_key}'"
+                )
 
-            logger.info(f"Enqueued job {job.id} of type '{job_type}'")
-            return job
+        logger.info(f"Enqueued job {job.id} of type '{job_type}'")
+        self.job_available.set()
+        return job
 
     async def _find_by_idempotency_key(self, idempotency_key: str) -> Job | None:
-        """Find job by idempotency key.
+        """Find the active (pending or running) job for an idempotency key.
 
         Args:
             idempotency_key: Idempotency key
@@ -96,56 +150,91 @@ class JobQueue(BaseService):
         Returns:
             Job instance or None
         """
-        if not self._db_service or not self._db_service.session_factory:
+        sf = self._session_factory
+        if sf is None:
             return None
 
-        async with self._db_service.session_factory() as session:
-            stmt = select(Job).where(Job.idempotency_key == idempotency_key)
-            result = await session.execute(stmt)
+        async with sf() as session:
+            result = await session.execute(_JOB_BY_IDEMPOTENCY_KEY, {"key": idempotency_key})
             return result.scalar_one_or_none()
 
-    async def get_pending_jobs(self, limit: int = 10) -> list[Job]:
+    async def get_pending_jobs(self, limit: int = 10, now: datetime | None = None) -> list[Job]:
         """Get pending jobs ready to run.
 
         Args:
             limit: Maximum number of jobs to return
+            now: Reference time for due jobs (defaults to the current UTC time)
 
         Returns:
             List of Job instances
         """
-        if not self._db_service or not self._db_service.session_factory:
+        sf = self._session_factory
+        if sf is None:
             return []
 
-        async with self._db_service.session_factory() as session:
-            now = datetime.utcnow()
-            stmt = (
-                select(Job)
-                .where(
-                    Job.status == "pending",
-                    Job.next_run_at <= now,
-                )
-                .order_by(Job.next_run_at)
-                .limit(limit)
-            )
-            result = await session.execute(stmt)
+        if now is None:
+            now = datetime.now(UTC)
+
+        async with sf() as session:
+            result = await session.execute(_PENDING_JOBS, {"now": now, "limit": limit})
             return list(result.scalars().all())
 
-    async def mark_running(self, job: Job, worker_id: str) -> None:
+    async def _update_job(
+        self, job: Job, values: dict[str, Any], *conditions: Any
+    ) -> bool:
+        """Persist column changes for a job with a single UPDATE.
+
+        The job is typically detached (loaded by an earlier session), so this
+        skips re-attaching it to a session and mirrors the values onto it.
+
+        Args:
+            job: Job instance
+            values: Column values to write
+            *conditions: Only update if the row still matches these criteria
+
+        Returns:
+            True if the row was updated
+        """
+        sf = self._session_factory
+        if sf is None:
+            return False
+
+        stmt = update(Job).where(Job.id == job.id, *conditions)
+
+        async with sf() as session:
+            result = await session.execute(stmt.values(**values))
+            await session.commit()
+
+        if conditions and result.rowcount == 0:
+            return False
+
+        for key, value in values.items():
+            setattr(job, key, value)
+        return True
+
+    async def mark_running(self, job: Job, worker_id: str) -> bool:
         """Mark a job as running.
 
+        Only claims the job if the row is still the pending, due job that was
+        fetched: a copy held since then is stale once another worker has run
+        it, and claiming it would skip the retry backoff and roll back the
+        attempt count.
+
         Args:
             job: Job instance
             worker_id: Worker identifier
+
+        Returns:
+            True if this worker claimed the job
         """
-        if not self._db_service or not self._db_service.session_factory:
-            return
-
-        async with self._db_service.session_factory() as session:
-            job.status = "running"
-            job.locked_by = worker_id
-            job.locked_at = datetime.utcnow()
-            session.add(job)
-            await session.commit()
+        now = datetime.now(UTC)
+        return await self._update_job(
+            job,
+            {"status": "running", "locked_by": worker_id, "locked_at": now},
+            Job.status == "pending",
+            Job.attempts == job.attempts,
+            Job.next_run_at <= now,
+        )
 
     async def mark_completed(self, job: Job) -> None:
         """Mark a job as completed.
@@ -153,15 +242,7 @@ class JobQueue(BaseService):
         Args:
             job: Job instance
         """
-        if not self._db_service or not self._db_service.session_factory:
-            return
-
-        async with self._db_service.session_factory() as session:
-            job.status = "completed"
-            job.locked_by = None
-            job.locked_at = None
-            session.add(job)
-            await session.commit()
+        await self._update_job(job, {"status": "completed", "locked_by": None, "locked_at": None})
 
     async def mark_failed(self, job: Job, error_message: str) -> None:
         """Mark a job as failed.
@@ -170,22 +251,20 @@ class JobQueue(BaseService):
             job: Job instance
             error_message: Error message
         """
-        if not self._db_service or not self._db_service.session_factory:
-            return
-
-        async with self._db_service.session_factory() as session:
-            job.attempts += 1
-            job.error_message = error_message[:1000]  # Truncate if too long
-
-            if job.attempts >= job.max_attempts:
-                job.status = "dead_letter"
-            else:
-                # Schedule retry with exponential backoff
-                delay = 2 ** job.attempts  # 2, 4, 8 seconds
-                job.status = "pending"
-                job.next_run_at = datetime.utcnow() + timedelta(seconds=delay)
-                job.locked_by = None
-                job.locked_at = None
-
-            session.add(job)
-            await session.commit()
+        attempts = job.attempts + 1
+        values: dict[str, Any] = {
+            "attempts": attempts,
+            "error_message": error_message[:1000],  # Truncate if too long
+        }
+
+        if attempts >= job.max_attempts:
+            values["status"] = "dead_letter"
+        else:
+            # Schedule retry with exponential backoff
+            delay = 2 ** attempts  # 2, 4, 8 seconds
+            values["status"] = "pending"
+            values["next_run_at"] = datetime.now(UTC) + timedelta(seconds=delay)
+            values["locked_by"] = None
+            values["locked_at"] = None
+
+        await self._update_job(job, values)
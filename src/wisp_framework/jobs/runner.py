@@ -3,16 +3,25 @@
 import asyncio
 import logging
 import uuid
+from collections import OrderedDict, deque
 from collections.abc import Callable
+from datetime import UTC, datetime
 from typing import Any
 
+from wisp_framework.config import AppConfig
 from wisp_framework.context import WispContext
 from wisp_framework.db.models import Job
 from wisp_framework.jobs.queue import JobQueue
+from wisp_framework.observability.metrics import record_job_metric
 from wisp_framework.services.base import BaseService
 
 logger = logging.getLogger(__name__)
 
+_IDLE_BACKOFF_MIN = 1.0
+_IDLE_BACKOFF_MAX = 30.0
+# Guild contexts kept for fast handlers, least recently used evicted first
+_FAST_CONTEXTS_MAX = 64
+
 
 class JobRunner(BaseService):
     """Service for running background jobs."""
@@ -40,7 +49,16 @@ class JobRunner(BaseService):
         self._running = False
         self._task: asyncio.Task | None = None
         self._concurrency_limit = getattr(config, "job_concurrency_limit", 5)
-        self._running_jobs: set[int] = set()
+        self._inflight = 0
+        # Jobs fetched ahead of time so one query feeds several dispatch rounds
+        self._prefetch_size = getattr(
+            config, "job_prefetch_size", max(self._concurrency_limit * 4, 32)
+        )
+        self._prefetch_buffer: deque[Job] = deque()
+        # Idle polling backs off exponentially and resets once work shows up
+        self._idle_backoff = _IDLE_BACKOFF_MIN
+        self._fast_job_types: set[str] = set()
+        self._fast_contexts: OrderedDict[int | None, WispContext] = OrderedDict()
 
     async def startup(self) -> None:
         """Start up the job runner."""
@@ -52,6 +70,7 @@ class JobRunner(BaseService):
     async def shutdown(self) -> None:
         """Shut down the job runner."""
         self._running = False
+        self._prefetch_buffer.clear()
         if self._task:
             self._task.cancel()
             try:
@@ -60,16 +79,39 @@ class JobRunner(BaseService):
                 pass
         logger.info("Job runner shut down")
 
+    @property
+    def inflight(self) -> int:
+        """Number of jobs currently being processed by this runner."""
+        return self._inflight
+
+    def _set_inflight(self, value: int) -> None:
+        """Update the in-flight job count and its gauge metric."""
+        self._inflight = value
+        metrics = self._services.get("metrics") if self._services else None
+        if metrics:
+            metrics.gauge("wisp.jobs.inflight", value)
+
     def register_handler(
-        self, job_type: str, handler: Callable[[WispContext, dict[str, Any]], Any]
+        self,
+        job_type: str,
+        handler: Callable[[WispContext, dict[str, Any]], Any],
+        *,
+        fast: bool = False,
     ) -> None:
         """Register a job handler.
 
         Args:
             job_type: Job type name
             handler: Handler function that takes (ctx, payload) and returns result
+            fast: Run on the lightweight path, which skips per-job log lines and
+                reuses a context per guild for recently seen guilds (so
+                ``ctx.request_id`` is not the job ID)
         """
         self._job_handlers[job_type] = handler
+        if fast:
+            self._fast_job_types.add(job_type)
+        else:
+            self._fast_job_types.discard(job_type)
         logger.info(f"Registered job handler for type '{job_type}'")
 
     async def _run_loop(self) -> None:
@@ -77,27 +119,37 @@ class JobRunner(BaseService):
         while self._running:
             try:
                 # Check concurrency limit
-                if len(self._running_jobs) >= self._concurrency_limit:
+                if self._inflight >= self._concurrency_limit:
                     await asyncio.sleep(1)
                     continue
 
-                # Get pending jobs
-                pending_jobs = await self._job_queue.get_pending_jobs(
-                    limit=self._concurrency_limit - len(self._running_jobs)
-                )
-
-                if not pending_jobs:
-                    await asyncio.sleep(1)
+                # Refill the prefetch buffer only when it can't cover a full round
+                buffer = self._prefetch_buffer
+                if len(buffer) < self._concurrency_limit:
+                    buffered_ids = {job.id for job in buffer}
+                    # Clear before querying so an enqueue during the query
+                    # still wakes _wait_idle instead of being lost
+                    self._job_queue.job_available.clear()
+                    pending_jobs = await self._job_queue.get_pending_jobs(
+                        limit=self._prefetch_size,
+                        now=datetime.now(UTC),
+                    )
+                    buffer.extend(job for job in pending_jobs if job.id not in buffered_ids)
+
+                if not buffer:
+                    await self._wait_idle()
                     continue
 
+                self._idle_backoff = _IDLE_BACKOFF_MIN
+
                 # Process jobs
-                for job in pending_jobs:
-                    if len(self._running_jobs) >= self._concurrency_limit:
-                        break
+                while buffer and self._inflight < self._concurrency_limit:
+                    job = buffer.popleft()
 
-                    # Mark as running
-                    await self._job_queue.mark_running(job, self._worker_id)
-                    self._running_jobs.add(job.id)
+                    # Mark as running; skip jobs another worker claimed meanwhile
+                    if not await self._job_queue.mark_running(job, self._worker_id):
+                        continue
+                    self._set_inflight(self._inflight + 1)
 
                     # Process in background
                     asyncio.create_task(self._process_job(job))
@@ -106,6 +158,17 @@ class JobRunner(BaseService):
                 logger.error(f"Error in job runner loop: {e}", exc_info=True)
                 await asyncio.sleep(5)
 
+    async def _wait_idle(self) -> None:
+        """Sleep for the current idle backoff, waking early on a local enqueue."""
+        try:
+            await asyncio.wait_for(
+                self._job_queue.job_available.wait(), timeout=self._idle_backoff
+            )
+        except TimeoutError:
+            self._idle_backoff = min(self._idle_backoff * 2, _IDLE_BACKOFF_MAX)
+        else:
+            self._idle_backoff = _IDLE_BACKOFF_MIN
+
     async def _process_job(self, job: Job) -> None:
         """Process a single job.
 
@@ -118,12 +181,9 @@ class JobRunner(BaseService):
             if not handler:
                 logger.warning(f"No handler registered for job type '{job.job_type}'")
                 await self._job_queue.mark_failed(job, f"No handler for job type '{job.job_type}'")
-                self._running_jobs.discard(job.id)
                 return
 
             # Create WispContext for job execution
-            from wisp_framework.config import AppConfig
-
             # Get services
             config = self.config if isinstance(self.config, AppConfig) else AppConfig()
             services = self._services
@@ -131,14 +191,36 @@ class JobRunner(BaseService):
             if not services:
                 logger.error("Services not available for job execution")
                 await self._job_queue.mark_failed(job, "Services not available")
-                self._running_jobs.discard(job.id)
+                return
+
+            guild_id = job.payload.get("guild_id") if isinstance(job.payload, dict) else None
+
+            if job.job_type in self._fast_job_types:
+                # Lightweight handlers share a context per guild and skip log ceremony
+                fast_contexts = self._fast_contexts
+                ctx = fast_contexts.get(guild_id)
+                if ctx is None:
+                    ctx = WispContext.from_job(
+                        config=config,
+                        services=services,
+                        job_id=f"fast-{self._worker_id}",
+                        guild_id=guild_id,
+                    )
+                    fast_contexts[guild_id] = ctx
+                    if len(fast_contexts) > _FAST_CONTEXTS_MAX:
+                        fast_contexts.popitem(last=False)
+                else:
+                    fast_contexts.move_to_end(guild_id)
+                await handler(ctx, job.payload)
+                await self._job_queue.mark_completed(job)
+                record_job_metric(ctx.metrics, job.job_type, "completed")
                 return
 
             ctx = WispContext.from_job(
                 config=config,
                 services=services,
                 job_id=str(job.id),
-                guild_id=job.payload.get("guild_id") if isinstance(job.payload, dict) else None,
+                guild_id=guild_id,
             )
 
             # Execute handler
@@ -151,8 +233,6 @@ class JobRunner(BaseService):
 
             # Record metrics
             if ctx.metrics:
-                from wisp_framework.observability.metrics import record_job_metric
-
                 record_job_metric(ctx.metrics, job.job_type, "completed")
 
         except Exception as e:
@@ -165,4 +245,4 @@ class JobRunner(BaseService):
                 pass
 
         finally:
-            self._running_jobs.discard(job.id)
+            self._set_inflight(self._inflight - 1)
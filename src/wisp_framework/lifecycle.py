@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import signal
+from collections.abc import Callable
 
 from wisp_framework.bot import WispBot
 from wisp_framework.config import AppConfig
@@ -22,6 +23,23 @@ from wisp_framework.utils.embeds import EmbedBuilder
 logger = logging.getLogger(__name__)
 
 
+def event_loop_factory(config: AppConfig) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the event loop factory to run the bot on.
+
+    Returns uvloop's loop factory when uvloop is installed and enabled, for fewer
+    syscalls per socket operation; otherwise None (the default asyncio loop).
+    Pass the result to ``asyncio.run(..., loop_factory=...)``.
+    """
+    if not config.use_uvloop:
+        return None
+    try:
+        import uvloop
+    except ImportError:  # Optional: not available on Windows
+        return None
+    logger.info("Using uvloop event loop")
+    return uvloop.new_event_loop
+
+
 class LifecycleManager:
     """Manages bot lifecycle (startup, shutdown, graceful cleanup)."""
 
@@ -149,9 +167,10 @@ def create_services(config: AppConfig) -> ServiceContainer:
 
 
 def create_feature_flags(services: ServiceContainer) -> FeatureFlags:
-    """Create feature flags with database service if available."""
+    """Create feature flags with database and cache services if available."""
     db_service = services.get_typed("db", DatabaseService)
-    return FeatureFlags(db_service)
+    cache_service = services.get_typed("cache", CacheService)
+    return FeatureFlags(db_service, cache_service)
 
 
 def create_bot_context(
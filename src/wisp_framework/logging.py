@@ -1,12 +1,29 @@
 """Structured logging setup with module awareness and correlation IDs."""
 
+import atexit
 import contextvars
+import copy
+import json
 import logging
+import os
+import queue
+import random
+import re
 import sys
-import uuid
-from typing import TYPE_CHECKING
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any
 
 from wisp_framework.config import AppConfig
+from wisp_framework.observability.logging import _request_id_var
+from wisp_framework.observability.logging import get_logger as _get_bound_logger
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib encoder
+    orjson = None
 
 if TYPE_CHECKING:
     from wisp_framework.context import WispContext
@@ -14,22 +31,309 @@ if TYPE_CHECKING:
 # Context variable for correlation_id in async contexts
 _correlation_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar("correlation_id", default=None)
 
+# Placeholders logged when no correlation/request ID is bound
+_NO_CORRELATION_ID = "no-correlation-id"
+_NO_REQUEST_ID = "no-request-id"
+
+_LEVELS: dict[str, int] = {
+    name: logging.getLevelName(name)
+    for name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET")
+}
+
+# Background listener that owns the real output handler, fed by _queue_handler
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    Records never leave the process, so only the message is frozen here (args may
+    be mutated after the call returns); exc_info is kept for the real formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Freeze the rendered message on a copy of the record."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchedStreamHandler(logging.StreamHandler):
+    """StreamHandler that batches writes instead of writing and flushing per record.
+
+    Records are buffered and written together when the flush interval elapses or
+    the buffer grows past ``max_buffer`` characters. WARNING and above flush
+    immediately (along with anything buffered before them), so problems are
+    never held back.
+    """
+
+    def __init__(
+        self,
+        stream: Any | None = None,
+        flush_interval: float = 0.1,
+        max_buffer: int = 65536,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            stream: Output stream (defaults to sys.stderr, like StreamHandler)
+            flush_interval: Seconds a record may wait in the buffer
+            max_buffer: Buffered characters that trigger an immediate flush
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: list[str] = []
+        self._buffered_chars = 0
+        self._timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a formatted record, flushing if it is urgent or the buffer is full."""
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+
+        # Handler.handle() holds self.lock around emit()
+        self._buffer.append(msg)
+        self._buffered_chars += len(msg)
+        if record.levelno >= logging.WARNING or self._buffered_chars >= self.max_buffer:
+            self.flush()
+        elif self._timer is None:
+            timer = threading.Timer(self.flush_interval, self.flush)
+            timer.daemon = True
+            self._timer = timer
+            timer.start()
+
+    def flush(self) -> None:
+        """Write out everything buffered and flush the stream."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer or not self.stream:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered_chars = 0
+            try:
+                self.stream.write(data)
+                if hasattr(self.stream, "flush"):
+                    self.stream.flush()
+            except Exception:
+                if logging.raiseExceptions:
+                    import traceback
+
+                    traceback.print_exc(file=sys.stderr)
+
+    def close(self) -> None:
+        """Flush pending records before closing."""
+        self.flush()
+        super().close()
+
+
+def _install_record_factory() -> None:
+    """Stamp correlation and request IDs onto records as they are created.
+
+    Records are created in the caller's context, so the IDs are read once there
+    instead of by a filter on every handler. The previous factory is wrapped, and
+    calling this again is a no-op.
+    """
+    old_factory = logging.getLogRecordFactory()
+    if getattr(old_factory, "_wisp_correlation", False):
+        return
+
+    get_correlation_id = _correlation_id_var.get
+    get_request_id = _request_id_var.get
+
+    def factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record = old_factory(*args, **kwargs)
+        record.correlation_id = get_correlation_id() or _NO_CORRELATION_ID
+        record.request_id = get_request_id() or _NO_REQUEST_ID
+        return record
+
+    factory._wisp_correlation = True  # type: ignore[attr-defined]
+    logging.setLogRecordFactory(factory)
+
+
+def _default_context_ids(record: logging.LogRecord) -> None:
+    """Fill in the ID attributes for records not built by our record factory.
+
+    Records from ``logging.makeLogRecord``, a ``SocketHandler`` peer, or a
+    factory installed after ours won't have them.
+    """
+    attrs = record.__dict__
+    attrs.setdefault("correlation_id", _NO_CORRELATION_ID)
+    attrs.setdefault("request_id", _NO_REQUEST_ID)
+
+
+def _stop_listener() -> None:
+    """Detach the queue handler, then flush and stop the background listener."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        # May already be stopped by a later setup after a module reload
+        if getattr(_listener, "_thread", None) is not None:
+            _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def _remove_installed_handlers(logger: logging.Logger) -> None:
+    """Remove handlers left by an earlier setup_logging call (e.g. before a reload).
 
-class CorrelationFilter(logging.Filter):
-    """Logging filter that adds correlation ID and request_id to log records."""
+    Handlers we install are tagged with ``_wisp_installed``; their listener is
+    stopped too so its thread doesn't outlive the handler.
+    """
+    for existing in logger.handlers[:]:
+        if not getattr(existing, "_wisp_installed", False):
+            continue
+        logger.removeHandler(existing)
+        listener = getattr(existing, "_wisp_listener", None)
+        if listener is not None and getattr(listener, "_thread", None) is not None:
+            listener.stop()
+
+
+def _dumps_json_line(payload: dict[str, Any]) -> str:
+    """Serialize a log payload to a single JSON line (without trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str).decode()
+    return json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter emitting one compact JSON object per record.
+
+    Uses short CLEF-style keys (``@t``, ``@l``, ``@m``, ``@x``) and is backed by
+    orjson when installed, falling back to the stdlib ``json`` module.
+    """
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Add correlation ID and request_id if not already present."""
-        if not hasattr(record, "correlation_id"):
-            correlation_id = _correlation_id_var.get()
-            record.correlation_id = correlation_id or "no-correlation-id"
-        if not hasattr(record, "request_id"):
-            # Try to get request_id from context variable (set by observability.logging)
-            from wisp_framework.observability.logging import _request_id_var
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record as a JSON line."""
+        _default_context_ids(record)
+        payload: dict[str, Any] = {
+            "@t": datetime.fromtimestamp(record.created, UTC),
+            "@l": record.levelname,
+            "name": record.name,
+            "cid": record.correlation_id,
+            "rid": record.request_id,
+            "@m": record.getMessage(),
+        }
+        if orjson is None:
+            payload["@t"] = payload["@t"].isoformat()
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["@x"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return _dumps_json_line(payload)
+
+
+# %(name)s fields with an optional width, e.g. %(levelname)8s or %(name)-20s
+_PATTERN_FIELD_RE = re.compile(r"%\((\w+)\)(-?\d*)s")
+
+DEFAULT_TEXT_FORMAT = (
+    "%(asctime)s [%(levelname)8s] [%(name)s] [%(correlation_id)s] [%(request_id)s] %(message)s"
+)
+DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class FastPatternFormatter(logging.Formatter):
+    """Text formatter that parses its %-style pattern once at construction.
+
+    The pattern is split into literal strings and ``(attribute, width)`` fields,
+    so formatting a record is a lookup and join per piece rather than a
+    ``%``-interpolation of the whole pattern. The rendered timestamp is reused
+    for records logged within the same second. Patterns with fields other than
+    ``%(name)s``-style strings fall back to the stdlib implementation.
+    """
 
-            request_id = _request_id_var.get()
-            record.request_id = request_id or "no-request-id"
-        return True
+    def __init__(self, fmt: str = DEFAULT_TEXT_FORMAT, datefmt: str | None = None) -> None:
+        """Initialize the formatter and precompile the pattern."""
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        pieces: list[str | tuple[str, int]] = []
+        compiled = True
+        for literal, match in self._split_pattern(fmt):
+            if literal:
+                # Any other %-directive is something we don't compile
+                compiled = compiled and "%" not in literal.replace("%%", "")
+                pieces.append(literal.replace("%%", "%"))
+            if match is not None:
+                width = match.group(2)
+                pieces.append((match.group(1), int(width) if width else 0))
+
+        self._pieces: tuple[str | tuple[str, int], ...] | None = tuple(pieces) if compiled else None
+        self._uses_time = self.usesTime()
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    @staticmethod
+    def _split_pattern(fmt: str) -> list[tuple[str, re.Match[str] | None]]:
+        """Split a pattern into (preceding literal, field match) pairs."""
+        result: list[tuple[str, re.Match[str] | None]] = []
+        pos = 0
+        for match in _PATTERN_FIELD_RE.finditer(fmt):
+            result.append((fmt[pos : match.start()], match))
+            pos = match.end()
+        result.append((fmt[pos:], None))
+        return result
+
+    def _cached_asctime(self, record: logging.LogRecord) -> str:
+        """Render the record timestamp, reusing the text for the current second."""
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if cached_second != second:
+            text = time.strftime(self.datefmt or self.default_time_format, self.converter(second))
+            self._time_cache = (second, text)
+        if self.datefmt:
+            return text
+        return f"{text},{int(record.msecs):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record using the precompiled pattern."""
+        _default_context_ids(record)
+        pieces = self._pieces
+        if pieces is None:
+            return super().format(record)
+
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self._cached_asctime(record)
+
+        attrs = record.__dict__
+        parts = []
+        for piece in pieces:
+            if piece.__class__ is str:
+                parts.append(piece)
+                continue
+            name, width = piece
+            value = str(attrs[name])
+            if width > 0:
+                value = value.rjust(width)
+            elif width < 0:
+                value = value.ljust(-width)
+            parts.append(value)
+        s = "".join(parts)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
 
 
 def setup_logging(
@@ -42,54 +346,104 @@ def setup_logging(
     Args:
         config: Application configuration
         formatter: Optional custom formatter. If not provided, uses default structured formatter.
-        handler: Optional custom handler. If not provided, uses StreamHandler to stdout.
+        handler: Optional custom handler. If not provided, uses BatchedStreamHandler to stdout.
 
     Log levels can be controlled via environment variables:
     - LOG_LEVEL: Root log level (default: INFO)
     - LOG_LEVEL_WISP_FRAMEWORK: Wisp Framework log level (default: same as LOG_LEVEL)
-    """
-    import os
 
+    The default formatter is chosen by LOG_FORMAT: ``text`` (default) or ``json``.
+
+    Every record gets ``correlation_id`` and ``request_id`` attributes when it is
+    created, taken from CorrelationContext and the WispContext logger. They can't
+    be passed via ``extra=`` (the stdlib refuses to overwrite record attributes).
+    """
     # Get root log level
     root_log_level_str = config.log_level
-    root_log_level = getattr(logging, root_log_level_str, logging.INFO)
+    root_log_level = _LEVELS.get(root_log_level_str, logging.INFO)
 
     # Get Wisp Framework specific log level (if set)
     wisp_log_level_str = os.getenv("LOG_LEVEL_WISP_FRAMEWORK", root_log_level_str).upper()
-    wisp_log_level = getattr(logging, wisp_log_level_str, root_log_level)
+    wisp_log_level = _LEVELS.get(wisp_log_level_str, root_log_level)
 
     # Create formatter if not provided
-    if formatter is None:
-        formatter = logging.Formatter(
-            fmt="%(asctime)s [%(levelname)8s] [%(name)s] [%(correlation_id)s] [%(request_id)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+    if formatter is None and config.log_format == "json":
+        formatter = JsonFormatter()
+    elif formatter is None:
+        formatter = FastPatternFormatter(DEFAULT_TEXT_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
 
     # Create handler if not provided
     if handler is None:
-        handler = logging.StreamHandler(sys.stdout)
+        handler = BatchedStreamHandler(sys.stdout)
         handler.setLevel(root_log_level)
         handler.setFormatter(formatter)
-        handler.addFilter(CorrelationFilter())
 
-    # Ensure handler has formatter and filter
+    # Ensure handler has formatter
     if handler.formatter is None:
         handler.setFormatter(formatter)
-    # handler.filters is a list, not a dict, so iterate directly
-    if not any(isinstance(f, CorrelationFilter) for f in handler.filters):
-        handler.addFilter(CorrelationFilter())
 
-    # Root logger
+    # Correlation/request IDs must be captured where the record is created, since
+    # contextvars are not visible from the listener thread
+    _install_record_factory()
+
+    # Hand records to a background thread so formatting and writes stay off the
+    # event loop
+    global _listener, _queue_handler
+    _stop_listener()
     root_logger = logging.getLogger()
+    wisp_logger = logging.getLogger("wisp_framework")
+    _remove_installed_handlers(root_logger)
+    _remove_installed_handlers(wisp_logger)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _InProcessQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_handler._wisp_installed = True  # type: ignore[attr-defined]
+    _queue_handler._wisp_listener = _listener  # type: ignore[attr-defined]
+    _listener.start()
+
+    # Root logger
     root_logger.setLevel(root_log_level)
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_queue_handler)
 
     # Suppress noisy loggers
     logging.getLogger("discord").setLevel(logging.WARNING)
     logging.getLogger("discord.http").setLevel(logging.WARNING)
 
     # Set Wisp Framework logger level (allows suppressing WF logs separately)
-    logging.getLogger("wisp_framework").setLevel(wisp_log_level)
+    wisp_logger.setLevel(wisp_log_level)
+
+
+# Correlation IDs only need to be unique, not unpredictable, so they come from a
+# per-thread PRNG seeded once from os.urandom instead of a syscall per ID.
+_id_rng_state = threading.local()
+_id_rng_generation = 0
+
+
+def _bump_id_rng_generation() -> None:
+    """Force every thread to reseed after fork so processes don't share IDs."""
+    global _id_rng_generation
+    _id_rng_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_bump_id_rng_generation)
+
+
+def _new_correlation_id() -> str:
+    """Generate a random version-4 UUID string."""
+    state = _id_rng_state.__dict__
+    rng = state.get("rng")
+    if rng is None or state.get("generation") != _id_rng_generation:
+        rng = state["rng"] = random.Random(os.urandom(32))
+        state["generation"] = _id_rng_generation
+
+    bits = rng.getrandbits(128)
+    # Set the RFC 4122 variant and version 4 bits (as uuid.UUID(version=4) does)
+    bits = (bits & ~(0xC000 << 48)) | (0x8000 << 48)
+    bits = (bits & ~(0xF000 << 64)) | (4 << 76)
+    h = f"{bits:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -100,9 +454,11 @@ def get_logger(name: str) -> logging.Logger:
 class CorrelationContext:
     """Context manager for correlation IDs using contextvars for async safety."""
 
+    __slots__ = ("correlation_id", "_token")
+
     def __init__(self, correlation_id: str | None = None) -> None:
         """Initialize with optional correlation ID."""
-        self.correlation_id = correlation_id or str(uuid.uuid4())
+        self.correlation_id = correlation_id or _new_correlation_id()
         self._token: contextvars.Token[str | None] | None = None
 
     def __enter__(self) -> "CorrelationContext":
@@ -127,6 +483,4 @@ def get_context_logger(ctx: "WispContext") -> logging.Logger:
     Returns:
         Logger instance with request_id in context
     """
-    from wisp_framework.observability.logging import get_logger as _get_logger
-
-    return _get_logger(ctx)
+    return _get_bound_logger(ctx)
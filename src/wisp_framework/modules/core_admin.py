@@ -1,5 +1,10 @@
 """Core admin module - module management and bot info commands."""
 
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from itertools import batched, count
 from typing import Any
 
 import discord
@@ -7,6 +12,8 @@ from discord import app_commands
 from discord.ext import commands
 
 from wisp_framework.module import Module
+from wisp_framework.observability.metrics import record_command_metric
+from wisp_framework.utils.confirmations import confirm_action
 from wisp_framework.utils.context_helpers import (
     get_wisp_context_from_command_context,
     get_wisp_context_from_interaction,
@@ -17,10 +24,115 @@ from wisp_framework.utils.decorators import (
     require_owner,
 )
 from wisp_framework.utils.embeds import EmbedBuilder
-from wisp_framework.utils.pagination import paginate_embeds
-from wisp_framework.utils.responses import respond_error, respond_success
+from wisp_framework.utils.pagination import paginate_embeds_lazy
+from wisp_framework.utils.permissions import is_admin
+from wisp_framework.utils.responses import ResponseHelper, respond_error, respond_success
 from wisp_framework.utils.time import format_uptime
 
+_MODULES_PER_PAGE = 10
+
+
+# Last formatted uptime as (computed at, bot start time, text); reused for 1 second
+_UPTIME_CACHE_TTL = 1.0
+_uptime_cache: tuple[float, datetime, str] | None = None
+
+
+def _cached_uptime(started_at: datetime) -> str:
+    """Format uptime, reusing the last string for up to a second."""
+    global _uptime_cache
+    now = time.monotonic()
+    cached = _uptime_cache
+    if cached is not None and cached[1] == started_at and now - cached[0] < _UPTIME_CACHE_TTL:
+        return cached[2]
+    text = format_uptime(started_at)
+    _uptime_cache = (now, started_at, text)
+    return text
+
+
+# Short-lived per-guild module states for /modules list (guild_id -> (fetched at,
+# module names, states)), least recently used first; dropped locally on
+# enable/disable and bounded so it doesn't grow with every guild ever seen
+_FLAG_CACHE_TTL = 5.0
+_FLAG_CACHE_MAX = 1_000
+_flag_cache: OrderedDict[int, tuple[float, tuple[str, ...], dict[str, bool]]] = OrderedDict()
+# Locks for refreshes in flight; an entry only lives while its refresh runs
+_flag_locks: dict[int, asyncio.Lock] = {}
+# Per-guild generation bumped on enable/disable, so a refresh that read states
+# before a toggle doesn't cache them after it; values are never reused
+_flag_generations: OrderedDict[int, int] = OrderedDict()
+_flag_generation_counter = count(1)
+
+
+def _fresh_module_states(guild_id: int, modules: tuple[str, ...]) -> dict[str, bool] | None:
+    """Return cached module states if they are recent and for the same modules."""
+    entry = _flag_cache.get(guild_id)
+    if entry is None or entry[1] != modules or time.monotonic() - entry[0] >= _FLAG_CACHE_TTL:
+        return None
+    _flag_cache.move_to_end(guild_id)
+    return entry[2]
+
+
+def _invalidate_module_states(guild_id: int) -> None:
+    """Drop a guild's cached module states after one of them changed."""
+    _flag_cache.pop(guild_id, None)
+    _flag_generations[guild_id] = next(_flag_generation_counter)
+    _flag_generations.move_to_end(guild_id)
+    if len(_flag_generations) > _FLAG_CACHE_MAX:
+        _flag_generations.popitem(last=False)
+
+
+async def _get_module_states(
+    feature_flags: Any, guild_id: int, modules: tuple[str, ...]
+) -> dict[str, bool]:
+    """Get module states for a guild, reusing a recent lookup when possible."""
+    states = _fresh_module_states(guild_id, modules)
+    if states is not None:
+        return states
+
+    lock = _flag_locks.get(guild_id)
+    if lock is None:
+        lock = _flag_locks[guild_id] = asyncio.Lock()
+    try:
+        async with lock:
+            # Another invocation may have refreshed the entry while we waited
+            states = _fresh_module_states(guild_id, modules)
+            if states is not None:
+                return states
+            generation = _flag_generations.get(guild_id)
+            states = await feature_flags.get_all_enabled(guild_id, modules)
+            # A toggle during the lookup makes these states stale; don't cache them
+            if _flag_generations.get(guild_id) == generation:
+                _flag_cache[guild_id] = (time.monotonic(), modules, states)
+                _flag_cache.move_to_end(guild_id)
+                if len(_flag_cache) > _FLAG_CACHE_MAX:
+                    _flag_cache.popitem(last=False)
+            return states
+    finally:
+        if not lock.locked() and _flag_locks.get(guild_id) is lock:
+            del _flag_locks[guild_id]
+
+
+# Guild/user/module counts for /botinfo, refreshed at most every 30 seconds
+_STATS_CACHE_TTL = 30.0
+_stats_cache: dict[int, tuple[float, tuple[int, int, int]]] = {}
+
+
+def _get_bot_stats(bot: Any) -> tuple[int, int, int]:
+    """Get (guild count, user count, module count), reusing recent values."""
+    now = time.monotonic()
+    entry = _stats_cache.get(id(bot))
+    if entry is not None and now - entry[0] < _STATS_CACHE_TTL:
+        return entry[1]
+    stats = (len(bot.guilds), bot.user_count, bot.module_registry.module_count)
+    _stats_cache[id(bot)] = (now, stats)
+    return stats
+
+
+def _module_lines(modules: tuple[str, ...], enabled: dict[str, bool]) -> list[str]:
+    """Render one status line per module."""
+    enabled_get = enabled.get
+    return [("✅ " if enabled_get(name, True) else "❌ ") + name for name in modules]
+
 
 class CoreAdminModule(Module):
     """Core admin module for managing modules and bot info."""
@@ -33,6 +145,10 @@ class CoreAdminModule(Module):
     async def setup(self, bot: Any, ctx: Any) -> None:
         """Set up the core admin module."""
         tree = bot.tree
+        # Resolved once; config.owner_ids re-reads the environment on every access
+        owner_ids: frozenset[int] = frozenset(bot.owner_ids or ())
+        # Services are singletons for the bot's lifetime; look them up once
+        policy_service = ctx.services.get("policy")
 
         @tree.command(name="modules", description="Manage modules")
         @require_guild
@@ -56,56 +172,51 @@ class CoreAdminModule(Module):
             """Module management command."""
             # Create WispContext for this command execution
             wisp_ctx = get_wisp_context_from_interaction(bot, interaction, "slash")
-            wisp_ctx.bound_logger.debug(f"Executing modules command: {action.value}")
+            wisp_ctx.bound_logger.debug("Executing modules command: %s", action.value)
 
             if action.value == "list":
+                # Flag lookups can hit the database; don't race the 3s response deadline
+                await ResponseHelper.defer(interaction, ephemeral=True)
                 modules = bot.module_registry.list_modules()
-                enabled = await bot.module_registry._feature_flags.get_all_enabled(
-                    interaction.guild.id
+                enabled = await _get_module_states(
+                    bot.module_registry._feature_flags, interaction.guild.id, modules
                 )
 
-                module_list = []
-                for mod_name in modules:
-                    status = "✅" if enabled.get(mod_name, True) else "❌"
-                    module_list.append(f"{status} {mod_name}")
-
-                # Use pagination if many modules
-                if len(module_list) > 10:
-                    embeds = []
-                    items_per_page = 10
-                    for i in range(0, len(module_list), items_per_page):
-                        page_items = module_list[i : i + items_per_page]
-                        embed = EmbedBuilder.list_embed(
+                # Use pagination if many modules, rendering only the page being shown
+                if len(modules) > _MODULES_PER_PAGE:
+                    page_names = list(batched(modules, _MODULES_PER_PAGE, strict=False))
+                    await paginate_embeds_lazy(
+                        interaction,
+                        len(page_names),
+                        lambda p: EmbedBuilder.list_embed(
                             title="Modules",
-                            items=page_items,
-                            page=(i // items_per_page) + 1,
-                            items_per_page=items_per_page,
-                        )
-                        embeds.append(embed)
-                    await paginate_embeds(interaction, embeds, ephemeral=True)
+                            items=_module_lines(page_names[p], enabled),
+                            page=p + 1,
+                            items_per_page=_MODULES_PER_PAGE,
+                            total_items=len(modules),
+                        ),
+                        ephemeral=True,
+                    )
                 else:
                     embed = EmbedBuilder.info(
                         title="Modules",
-                        description="\n".join(module_list) or "No modules available",
+                        description="\n".join(_module_lines(modules, enabled))
+                        or "No modules available",
                     )
                     await respond_success(interaction, "Module list:", embed=embed)
 
                 # Record metrics
                 if wisp_ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(wisp_ctx.metrics, "modules", "success")
 
             elif action.value == "enable":
                 # Check permissions - simplified for now
                 # Full implementation would use policy engine
-                if interaction.user.id not in (bot.owner_ids or []):
+                if not (is_admin(interaction) or interaction.user.id in owner_ids):
                     await respond_error(
                         interaction, "You don't have permission to enable modules."
                     )
                     if wisp_ctx.metrics:
-                        from wisp_framework.observability.metrics import record_command_metric
-
                         record_command_metric(wisp_ctx.metrics, "modules", "permission_denied")
                     return
 
@@ -116,7 +227,10 @@ class CoreAdminModule(Module):
                 await bot.module_registry._feature_flags.set_enabled(
                     interaction.guild.id, module_name, True
                 )
-                wisp_ctx.bound_logger.info(f"Enabled module '{module_name}' for guild {interaction.guild.id}")
+                _invalidate_module_states(interaction.guild.id)
+                wisp_ctx.bound_logger.info(
+                    "Enabled module '%s' for guild %s", module_name, interaction.guild.id
+                )
 
                 embed = EmbedBuilder.success(
                     title="Module Enabled",
@@ -126,19 +240,15 @@ class CoreAdminModule(Module):
 
                 # Record metrics
                 if wisp_ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(wisp_ctx.metrics, "modules", "success")
 
             elif action.value == "disable":
                 # Check permissions - simplified for now
-                if interaction.user.id not in (bot.owner_ids or []):
+                if not (is_admin(interaction) or interaction.user.id in owner_ids):
                     await respond_error(
                         interaction, "You don't have permission to disable modules."
                     )
                     if wisp_ctx.metrics:
-                        from wisp_framework.observability.metrics import record_command_metric
-
                         record_command_metric(wisp_ctx.metrics, "modules", "permission_denied")
                     return
 
@@ -147,15 +257,16 @@ class CoreAdminModule(Module):
                     return
 
                 # Use confirmation for disable
-                from wisp_framework.utils.confirmations import confirm_action
-
                 async def on_confirm(i: discord.Interaction) -> None:
                     # Create context for confirmation handler
                     confirm_ctx = get_wisp_context_from_interaction(bot, i, "slash")
                     await bot.module_registry._feature_flags.set_enabled(
                         i.guild.id, module_name, False
                     )
-                    confirm_ctx.bound_logger.info(f"Disabled module '{module_name}' for guild {i.guild.id}")
+                    _invalidate_module_states(i.guild.id)
+                    confirm_ctx.bound_logger.info(
+                        "Disabled module '%s' for guild %s", module_name, i.guild.id
+                    )
 
                     embed = EmbedBuilder.success(
                         title="Module Disabled",
@@ -165,8 +276,6 @@ class CoreAdminModule(Module):
 
                     # Record metrics
                     if confirm_ctx.metrics:
-                        from wisp_framework.observability.metrics import record_command_metric
-
                         record_command_metric(confirm_ctx.metrics, "modules", "success")
 
                 await confirm_action(
@@ -185,12 +294,10 @@ class CoreAdminModule(Module):
             wisp_ctx = get_wisp_context_from_interaction(bot, interaction, "slash")
             wisp_ctx.bound_logger.info("Executing sync command")
 
-            from wisp_framework.utils.responses import ResponseHelper
-
             await ResponseHelper.defer(interaction, ephemeral=True)
             synced = await bot.sync_commands()
 
-            wisp_ctx.bound_logger.info(f"Synced {len(synced)} command(s)")
+            wisp_ctx.bound_logger.info("Synced %d command(s)", len(synced))
 
             embed = EmbedBuilder.success(
                 title="Commands Synced",
@@ -201,8 +308,6 @@ class CoreAdminModule(Module):
 
             # Record metrics
             if wisp_ctx.metrics:
-                from wisp_framework.observability.metrics import record_command_metric
-
                 record_command_metric(wisp_ctx.metrics, "sync", "success")
 
         # Prefixed sync command
@@ -214,7 +319,7 @@ class CoreAdminModule(Module):
 
             try:
                 synced = await bot.sync_commands()
-                wisp_ctx.bound_logger.info(f"Synced {len(synced)} command(s)")
+                wisp_ctx.bound_logger.info("Synced %d command(s)", len(synced))
 
                 embed = EmbedBuilder.success(
                     title="Commands Synced",
@@ -225,11 +330,9 @@ class CoreAdminModule(Module):
 
                 # Record metrics
                 if wisp_ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(wisp_ctx.metrics, "sync", "success")
             except Exception as e:
-                wisp_ctx.bound_logger.error(f"Failed to sync commands: {e}", exc_info=True)
+                wisp_ctx.bound_logger.error("Failed to sync commands: %s", e, exc_info=True)
                 embed = EmbedBuilder.error(
                     title="Sync Failed",
                     description=f"Failed to sync commands: {str(e)}"
@@ -238,8 +341,6 @@ class CoreAdminModule(Module):
 
                 # Record metrics
                 if wisp_ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(wisp_ctx.metrics, "sync", "error")
 
         # Register prefixed command explicitly
@@ -262,12 +363,10 @@ class CoreAdminModule(Module):
             if not bot.started_at:
                 uptime_str = "Unknown"
             else:
-                uptime_str = format_uptime(bot.started_at)
+                uptime_str = _cached_uptime(bot.started_at)
 
             latency = round(bot.latency * 1000)
-            guild_count = len(bot.guilds)
-            user_count = len(bot.users)
-            module_count = len(bot.module_registry.list_modules())
+            guild_count, user_count, module_count = _get_bot_stats(bot)
 
             embed = EmbedBuilder.info(
                 title="Bot Information",
@@ -285,8 +384,6 @@ class CoreAdminModule(Module):
 
             # Record metrics
             if wisp_ctx.metrics:
-                from wisp_framework.observability.metrics import record_command_metric
-
                 record_command_metric(wisp_ctx.metrics, "botinfo", "success")
 
         @tree.command(name="uptime", description="Show bot uptime")
@@ -301,7 +398,7 @@ class CoreAdminModule(Module):
                 await respond_error(interaction, "Uptime not available.")
                 return
 
-            uptime_str = format_uptime(bot.started_at)
+            uptime_str = _cached_uptime(bot.started_at)
             embed = EmbedBuilder.info(
                 title="Bot Uptime",
                 description=f"The bot has been running for **{uptime_str}**",
@@ -311,8 +408,6 @@ class CoreAdminModule(Module):
 
             # Record metrics
             if wisp_ctx.metrics:
-                from wisp_framework.observability.metrics import record_command_metric
-
                 record_command_metric(wisp_ctx.metrics, "uptime", "success")
 
         # Policy commands
@@ -341,10 +436,12 @@ class CoreAdminModule(Module):
             """Policy management command."""
             # Create WispContext for this command execution
             wisp_ctx = get_wisp_context_from_interaction(bot, interaction, "slash")
-            wisp_ctx.bound_logger.debug(f"Executing policy command: {action.value}")
+            wisp_ctx.bound_logger.debug("Executing policy command: %s", action.value)
 
-            policy_service = wisp_ctx.services.get("policy")
-            if not policy_service:
+            # Every action queries the policy store; don't race the 3s response deadline
+            await ResponseHelper.defer(interaction, ephemeral=True)
+
+            if policy_service is None:
                 await respond_error(interaction, "Policy service not available.")
                 return
 
@@ -367,7 +464,11 @@ class CoreAdminModule(Module):
                         action=action_type,
                     )
                     wisp_ctx.bound_logger.info(
-                        f"Added policy rule {rule.id}: {action_type} {capability} at {scope_type} scope"
+                        "Added policy rule %s: %s %s at %s scope",
+                        rule.id,
+                        action_type,
+                        capability,
+                        scope_type,
                     )
                     embed = EmbedBuilder.success(
                         title="Policy Rule Added",
@@ -377,17 +478,13 @@ class CoreAdminModule(Module):
 
                     # Record metrics
                     if wisp_ctx.metrics:
-                        from wisp_framework.observability.metrics import record_command_metric
-
                         record_command_metric(wisp_ctx.metrics, "policy", "success")
                 except Exception as e:
-                    wisp_ctx.bound_logger.error(f"Failed to add policy rule: {e}", exc_info=True)
+                    wisp_ctx.bound_logger.error("Failed to add policy rule: %s", e, exc_info=True)
                     await respond_error(interaction, f"Failed to add rule: {str(e)}")
 
                     # Record metrics
                     if wisp_ctx.metrics:
-                        from wisp_framework.observability.metrics import record_command_metric
-
                         record_command_metric(wisp_ctx.metrics, "policy", "error")
 
             elif action.value == "list":
@@ -401,7 +498,7 @@ class CoreAdminModule(Module):
                     scope = f"{rule.scope_type}:{rule.scope_id}" if rule.scope_id else rule.scope_type
                     rule_list.append(f"{rule.action.upper()} {rule.capability} @ {scope}")
 
-                wisp_ctx.bound_logger.debug(f"Listed {len(rules)} policy rules")
+                wisp_ctx.bound_logger.debug("Listed %d policy rules", len(rules))
 
                 embed = EmbedBuilder.info(
                     title="Policy Rules",
@@ -411,8 +508,6 @@ class CoreAdminModule(Module):
 
                 # Record metrics
                 if wisp_ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(wisp_ctx.metrics, "policy", "success")
 
             elif action.value == "explain":
@@ -422,7 +517,9 @@ class CoreAdminModule(Module):
 
                 result = await policy_service.check(capability, wisp_ctx)
                 wisp_ctx.bound_logger.debug(
-                    f"Policy explanation for {capability}: {'allowed' if result.allowed else 'denied'}"
+                    "Policy explanation for %s: %s",
+                    capability,
+                    "allowed" if result.allowed else "denied",
                 )
 
                 embed = EmbedBuilder.info(
@@ -437,6 +534,4 @@ class CoreAdminModule(Module):
 
                 # Record metrics
                 if wisp_ctx.metrics:
-                    from wisp_framework.observability.metrics import record_command_metric
-
                     record_command_metric(wisp_ctx.metrics, "policy", "success")
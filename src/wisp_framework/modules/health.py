@@ -10,10 +10,36 @@ from wisp_framework.utils.decorators import handle_errors
 from wisp_framework.utils.embeds import EmbedBuilder
 from wisp_framework.utils.responses import respond_error, respond_success
 
+# Per-command success counters are named wisp.commands.<command>.success
+_COMMAND_METRIC_PREFIX = "wisp.commands."
+_SUCCESS_METRIC_SUFFIX = ".success"
+
+# How often the database health probe runs, in seconds
+_DB_PROBE_INTERVAL = 10.0
+
+# Last rendered service list, keyed by the (name, healthy) pairs it was built from
+_services_render_cache: tuple[tuple[tuple[str, bool], ...], str] | None = None
+
+
+def _render_services(services: dict[str, dict[str, Any]]) -> str:
+    """Render service statuses, reusing the last text while nothing has changed."""
+    global _services_render_cache
+    key = tuple((name, status["healthy"]) for name, status in services.items())
+    cached = _services_render_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    text = "\n".join(("✅ " if healthy else "❌ ") + name for name, healthy in key)
+    text = text or "No services registered"
+    _services_render_cache = (key, text)
+    return text
+
 
 class HealthModule(Module):
     """Health check module."""
 
+    # Latest database probe result, refreshed in the background
+    _db_healthy: bool = True
+
     @property
     def name(self) -> str:
         """Module name."""
@@ -22,6 +48,23 @@ class HealthModule(Module):
     async def setup(self, bot: Any, ctx: Any) -> None:
         """Set up the health module."""
         tree = bot.tree
+        # Services are singletons for the bot's lifetime; look them up once
+        health_service = ctx.services.get("health")
+        db_service = ctx.services.get("db")
+
+        async def _probe_db() -> None:
+            """Refresh the cached database health status."""
+            if db_service is None:
+                return
+            self._db_healthy = db_service.engine is not None and db_service.initialized
+            if health_service is not None:
+                health_service.register_service("db", {"healthy": self._db_healthy})
+
+        # Probe once now so /health is accurate before the first scheduled run
+        await _probe_db()
+        scheduler = ctx.services.get("scheduler")
+        if scheduler:
+            scheduler.register(_probe_db, interval=_DB_PROBE_INTERVAL, name="health_db_probe")
 
         @tree.command(name="health", description="Check bot health status")
         @handle_errors
@@ -31,51 +74,36 @@ class HealthModule(Module):
             wisp_ctx = get_wisp_context_from_interaction(bot, interaction, "slash")
             wisp_ctx.bound_logger.debug("Executing health command")
 
-            health_service = wisp_ctx.services.get("health")
-
-            if not health_service:
+            if health_service is None:
                 await respond_error(interaction, "Health service not available.")
                 return
 
-            # Get health status
+            # Get health status (database health is kept current by _probe_db)
             health_status = health_service.get_health()
-
-            # Check database health dynamically
-            db_service = wisp_ctx.services.get("db")
-            if db_service:
-                db_healthy = db_service.engine is not None and db_service.initialized
-                health_status["services"]["db"] = {"healthy": db_healthy}
-
-            # Recalculate overall health
-            all_healthy = all(
-                status.get("healthy", False) for status in health_status["services"].values()
-            )
-            health_status["healthy"] = all_healthy
+            all_healthy = health_status["healthy"]
 
             # Build fields for embed
             fields = []
 
             # Add service statuses
             if health_status["services"]:
-                service_text = []
-                for service_name, status in health_status["services"].items():
-                    status_icon = "✅" if status.get("healthy", False) else "❌"
-                    service_text.append(f"{status_icon} {service_name}")
                 fields.append({
                     "name": "Services",
-                    "value": "\n".join(service_text) or "No services registered",
+                    "value": _render_services(health_status["services"]),
                     "inline": False
                 })
 
             # Add bot metrics if available (using WispContext)
             if wisp_ctx.metrics:
-                metrics = wisp_ctx.metrics.get_metrics()
-                if metrics["counters"]:
-                    # Use normalized metric names
-                    from wisp_framework.observability.metrics import normalize_metric_name
-
-                    total_commands = metrics["counters"].get(
-                        normalize_metric_name("commands", "success"), 0
+                # Counters only; get_metrics() would also summarize every timing series
+                counters = wisp_ctx.metrics.get_counters()
+                if counters:
+                    # Sum the per-command success counters (there is no aggregate one)
+                    total_commands = sum(
+                        count
+                        for name, count in counters.items()
+                        if name.startswith(_COMMAND_METRIC_PREFIX)
+                        and name.endswith(_SUCCESS_METRIC_SUFFIX)
                     )
                     fields.append({
                         "name": "Commands Executed",
@@ -85,7 +113,7 @@ class HealthModule(Module):
 
             # Log health check with request_id
             wisp_ctx.bound_logger.info(
-                f"Health check completed: {'healthy' if all_healthy else 'unhealthy'}"
+                "Health check completed: %s", "healthy" if all_healthy else "unhealthy"
             )
 
             # Create appropriate embed based on health
@@ -1,8 +1,19 @@
 """Insights module - stub module demonstrating scheduler usage."""
 
+import asyncio
 from typing import Any
 
+from wisp_framework.context import WispContext
 from wisp_framework.module import Module
+from wisp_framework.observability.metrics import normalize_metric_name
+
+_ROLLUPS_METRIC = normalize_metric_name("insights", "rollups")
+_ROLLUP_GUILDS_METRIC = normalize_metric_name("insights", "rollup_guilds")
+_ROLLUP_COUNT_MAX_METRIC = normalize_metric_name("insights", "rollup_count_max")
+_ROLLUP_COUNT_TOTAL_METRIC = normalize_metric_name("insights", "rollup_count_total")
+
+# Upper bound on the rollup write so a stuck connection can't hold the job forever
+_ROLLUP_TIMEOUT = 30.0
 
 
 class InsightsModule(Module):
@@ -25,8 +36,6 @@ class InsightsModule(Module):
         async def periodic_rollup() -> None:
             """Periodic task for insights aggregation."""
             # Create WispContext for job execution
-            from wisp_framework.context import WispContext
-
             wisp_ctx = WispContext.from_job(
                 config=bot.config,
                 services=bot.services,
@@ -35,34 +44,29 @@ class InsightsModule(Module):
             wisp_ctx.bound_logger.info("Running insights rollup...")
 
             if ctx.guild_data:
-                # Aggregate stats per guild
-                for guild in bot.guilds:
-                    try:
-                        # Get current rollup count
-                        current = await ctx.guild_data.get(
-                            guild.id, "rollup_count", module_name="insights"
-                        ) or 0
-
-                        # Increment and store
-                        await ctx.guild_data.set(
-                            guild.id,
-                            "rollup_count",
-                            current + 1,
-                            module_name="insights",
+                # Bump every guild's counter in a single statement
+                guild_ids = [guild.id for guild in bot.guilds]
+                try:
+                    async with asyncio.timeout(_ROLLUP_TIMEOUT):
+                        counts = await ctx.guild_data.bulk_increment(
+                            guild_ids, "rollup_count", module_name="insights"
                         )
 
-                        # Update metrics using WispContext
-                        if wisp_ctx.metrics:
-                            from wisp_framework.observability.metrics import normalize_metric_name
-
-                            wisp_ctx.metrics.increment(normalize_metric_name("insights", "rollups"))
-                            wisp_ctx.metrics.gauge(
-                                normalize_metric_name("insights", f"guild_{guild.id}_rollup_count"),
-                                current + 1,
-                            )
-
-                    except Exception as e:
-                        wisp_ctx.bound_logger.error(f"Error in rollup for guild {guild.id}: {e}", exc_info=True)
+                    # Update metrics using WispContext
+                    # (aggregates only; a gauge per guild would grow without bound)
+                    if wisp_ctx.metrics and counts:
+                        metrics = wisp_ctx.metrics
+                        metrics.increment(_ROLLUPS_METRIC, len(counts))
+                        metrics.gauge(_ROLLUP_GUILDS_METRIC, len(counts))
+                        metrics.gauge(_ROLLUP_COUNT_MAX_METRIC, max(counts.values()))
+                        metrics.gauge(_ROLLUP_COUNT_TOTAL_METRIC, sum(counts.values()))
+
+                except TimeoutError:
+                    wisp_ctx.bound_logger.error(
+                        "Insights rollup timed out after %ss", _ROLLUP_TIMEOUT
+                    )
+                except Exception as e:
+                    wisp_ctx.bound_logger.error("Error in insights rollup: %s", e, exc_info=True)
 
             wisp_ctx.bound_logger.info("Insights rollup completed")
 
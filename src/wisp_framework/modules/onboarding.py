@@ -1,14 +1,105 @@
 """Onboarding module - welcome messages for new members."""
 
+import contextlib
+import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import discord
+from sqlalchemy import bindparam, select
 
-from wisp_framework.context import WispContext
+from wisp_framework.context import WispContext, current_event_session
+from wisp_framework.db.models import GuildConfig
 from wisp_framework.module import Module
 from wisp_framework.utils.context_helpers import get_wisp_context_from_event
+from wisp_framework.utils.embeds import EmbedBuilder
 from wisp_framework.utils.event_helpers import register_event_handler
 
+logger = logging.getLogger(__name__)
+
+# Built once so SQLAlchemy's compiled cache is hit on every join; only the
+# channel column is fetched, no ORM instance is materialized
+_WELCOME_CHANNEL_STMT = select(GuildConfig.welcome_channel_id).where(
+    GuildConfig.guild_id == bindparam("guild_id")
+)
+_WELCOME_CHANNELS_BY_GUILDS_STMT = select(
+    GuildConfig.guild_id, GuildConfig.welcome_channel_id
+).where(GuildConfig.guild_id.in_(bindparam("guild_ids", expanding=True)))
+
+# Per-guild welcome channel from GuildConfig (guild_id -> (channel ID or None,
+# fetched at)), least recently used first; bounded so join floods across many
+# guilds can't grow it without limit
+_WELCOME_CACHE_TTL = 300.0
+_WELCOME_CACHE_MAX = 10_000
+_welcome_channel_cache: OrderedDict[int, tuple[int | None, float]] = OrderedDict()
+
+
+def invalidate_welcome_channel(guild_id: int | None = None) -> None:
+    """Drop cached welcome channels after a guild's config changes.
+
+    Args:
+        guild_id: Guild to invalidate, or None to clear every guild
+    """
+    if guild_id is None:
+        _welcome_channel_cache.clear()
+    else:
+        _welcome_channel_cache.pop(guild_id, None)
+
+
+def _get_cached_welcome_channel(guild_id: int) -> tuple[bool, int | None]:
+    """Look up a cached welcome channel, returning (hit, channel ID)."""
+    entry = _welcome_channel_cache.get(guild_id)
+    if entry is None:
+        return False, None
+    if time.monotonic() - entry[1] >= _WELCOME_CACHE_TTL:
+        del _welcome_channel_cache[guild_id]
+        return False, None
+    _welcome_channel_cache.move_to_end(guild_id)
+    return True, entry[0]
+
+
+def _cache_welcome_channel(guild_id: int, channel_id: int | None) -> None:
+    """Remember a guild's welcome channel, evicting the least recently used."""
+    _welcome_channel_cache[guild_id] = (channel_id, time.monotonic())
+    _welcome_channel_cache.move_to_end(guild_id)
+    if len(_welcome_channel_cache) > _WELCOME_CACHE_MAX:
+        _welcome_channel_cache.popitem(last=False)
+
+
+async def _warm_welcome_channels(db_service: Any, guild_ids: list[int]) -> None:
+    """Cache the welcome channel of every given guild with a single query."""
+    guild_ids = guild_ids[:_WELCOME_CACHE_MAX]
+    if not guild_ids or not db_service or not db_service.session_factory:
+        return
+    try:
+        async with db_service.session_factory() as session:
+            result = await session.execute(
+                _WELCOME_CHANNELS_BY_GUILDS_STMT, {"guild_ids": guild_ids}
+            )
+            channels = dict(result.all())
+    except Exception as e:
+        logger.warning("Failed to warm welcome channel cache: %s", e)
+        return
+    for guild_id in guild_ids:
+        _cache_welcome_channel(guild_id, channels.get(guild_id))
+
+
+def _welcome_embed(skeleton: dict[str, Any], member: discord.Member) -> discord.Embed:
+    """Fill the prebuilt welcome embed in for a member."""
+    embed = discord.Embed.from_dict(dict(skeleton))
+    embed.title = skeleton["title"].format(guild_name=member.guild.name)
+    mention = member.mention  # property; formatted on every access
+    embed.description = f"{mention} has joined the server."
+    embed.add_field(name="Member", value=f"{mention}\n{member.name}", inline=True)
+    embed.add_field(
+        name="Account Created",
+        value=f"<t:{int(member.created_at.timestamp())}:R>",
+        inline=True,
+    )
+    embed.set_thumbnail(url=member.display_avatar.url)
+    return embed
+
 
 class OnboardingModule(Module):
     """Onboarding module for welcoming new members."""
@@ -20,6 +111,11 @@ class OnboardingModule(Module):
 
     async def setup(self, bot: Any, ctx: Any) -> None:
         """Set up the onboarding module."""
+        # Color and branding are the same for every join; build them once
+        welcome_skeleton = EmbedBuilder.success(title="Welcome to {guild_name}! 🎉").to_dict()
+        default_welcome_channel_id = bot.config.welcome_channel_id
+        per_guild_welcome = bot.config.welcome_channel_per_guild
+
         # Register event handler with EventRouter for pipeline benefits
         # This provides: request_id tracking, rate limiting, metrics, error handling
 
@@ -32,51 +128,53 @@ class OnboardingModule(Module):
             if not member.guild:
                 return
 
-            wisp_ctx.bound_logger.info(f"Member joined: {member.name} (ID: {member.id})")
+            wisp_ctx.bound_logger.info("Member joined: %s (ID: %s)", member.name, member.id)
 
             # Get welcome channel
-            welcome_channel_id = wisp_ctx.config.welcome_channel_id
-
-            # Try to get from database if available
-            db_service = wisp_ctx.services.get("db")
-            if db_service and db_service.session_factory:
-                try:
-                    from sqlalchemy import select
-
-                    from wisp_framework.db.models import GuildConfig
-
-                    async with db_service.session_factory() as session:
-                        stmt = select(GuildConfig).where(
-                            GuildConfig.guild_id == member.guild.id
-                        )
-                        result = await session.execute(stmt)
-                        guild_config = result.scalar_one_or_none()
-                        if guild_config and guild_config.welcome_channel_id:
-                            welcome_channel_id = guild_config.welcome_channel_id
-                except Exception as e:
-                    wisp_ctx.bound_logger.warning(f"Failed to get guild config: {e}")
+            welcome_channel_id = default_welcome_channel_id
+
+            # Try to get from database if available (cached per guild), unless the
+            # configured default applies to every guild
+            if per_guild_welcome or not welcome_channel_id:
+                hit, guild_channel_id = _get_cached_welcome_channel(member.guild.id)
+                db_service = wisp_ctx.services.get("db")
+                if not hit and db_service and db_service.session_factory:
+                    try:
+                        # Reuse the routed event's session; open one only in fallback mode
+                        async with contextlib.AsyncExitStack() as stack:
+                            session = current_event_session() or await stack.enter_async_context(
+                                db_service.session_factory()
+                            )
+                            result = await session.execute(
+                                _WELCOME_CHANNEL_STMT, {"guild_id": member.guild.id}
+                            )
+                            guild_channel_id = result.scalar_one_or_none()
+                            # Read-only; hand the connection back before talking to Discord
+                            await session.rollback()
+                        _cache_welcome_channel(member.guild.id, guild_channel_id)
+                    except Exception as e:
+                        wisp_ctx.bound_logger.warning("Failed to get guild config: %s", e)
+                if guild_channel_id:
+                    welcome_channel_id = guild_channel_id
 
             if welcome_channel_id:
                 channel = member.guild.get_channel(welcome_channel_id)
                 if channel and isinstance(channel, discord.TextChannel):
-                    # Use embed builder for nicer welcome message
-                    from wisp_framework.utils.embeds import EmbedBuilder
-
-                    embed = EmbedBuilder.success(
-                        title=f"Welcome to {member.guild.name}! 🎉",
-                        description=f"{member.mention} has joined the server.",
-                        fields=[
-                            {"name": "Member", "value": f"{member.mention}\n{member.name}", "inline": True},
-                            {"name": "Account Created", "value": f"<t:{int(member.created_at.timestamp())}:R>", "inline": True},
-                        ]
-                    )
-                    embed.set_thumbnail(url=member.display_avatar.url)
-
+                    embed = _welcome_embed(welcome_skeleton, member)
                     await channel.send(embed=embed)
 
                     # Metrics are automatically recorded by pipeline!
                     # But we can also record custom metrics if needed
-                    wisp_ctx.bound_logger.info(f"Sent welcome message for {member.name}")
+                    wisp_ctx.bound_logger.info("Sent welcome message for %s", member.name)
+
+        if per_guild_welcome or not default_welcome_channel_id:
+            # Fill the cache up front so the first join in each guild skips the query
+            async def warm_welcome_channels() -> None:
+                await _warm_welcome_channels(
+                    ctx.services.get("db"), [guild.id for guild in bot.guilds]
+                )
+
+            bot.add_listener(warm_welcome_channels, "on_ready")
 
         # Register with EventRouter using helper function
         # Falls back to @bot.event if EventRouter not available
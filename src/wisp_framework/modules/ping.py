@@ -1,11 +1,13 @@
 """Ping module - simple ping command."""
 
+from bisect import bisect_right
 from typing import Any
 
 import discord
 from discord.ext import commands
 
 from wisp_framework.module import Module
+from wisp_framework.observability.metrics import record_command_metric
 from wisp_framework.utils.context_helpers import (
     get_wisp_context_from_command_context,
     get_wisp_context_from_interaction,
@@ -14,6 +16,27 @@ from wisp_framework.utils.decorators import handle_errors
 from wisp_framework.utils.embeds import EmbedBuilder
 from wisp_framework.utils.responses import respond_success
 
+# Latency bucket boundaries in ms and the (status, embed builder) for each bucket;
+# a latency of exactly a boundary falls into the next bucket up
+_LATENCY_THRESHOLDS = (100, 200, 500)
+_LATENCY_BUCKETS = (
+    ("Excellent", EmbedBuilder.success),
+    ("Good", EmbedBuilder.info),
+    ("Fair", EmbedBuilder.warning),
+    ("Poor", EmbedBuilder.error),
+)
+
+
+def _ping_embed(latency: int) -> discord.Embed:
+    """Build the pong embed, colored by latency bucket."""
+    status, build = _LATENCY_BUCKETS[bisect_right(_LATENCY_THRESHOLDS, latency)]
+    latency_text = f"{latency}ms"
+    return build(
+        title="Pong! 🏓",
+        description=f"Latency: **{latency_text}**\nStatus: {status}",
+        fields=[{"name": "Response Time", "value": latency_text, "inline": True}],
+    )
+
 
 class PingModule(Module):
     """Simple ping command module."""
@@ -36,51 +59,10 @@ class PingModule(Module):
             wisp_ctx.bound_logger.debug("Executing ping command")
 
             latency = round(bot.latency * 1000)
-
-            # Determine status color based on latency
-            if latency < 100:
-                status = "Excellent"
-                color_type = "success"
-            elif latency < 200:
-                status = "Good"
-                color_type = "info"
-            elif latency < 500:
-                status = "Fair"
-                color_type = "warning"
-            else:
-                status = "Poor"
-                color_type = "error"
-
-            # Create appropriate embed
-            if color_type == "success":
-                embed = EmbedBuilder.success(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
-            elif color_type == "info":
-                embed = EmbedBuilder.info(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
-            elif color_type == "warning":
-                embed = EmbedBuilder.warning(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
-            else:
-                embed = EmbedBuilder.error(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
+            embed = _ping_embed(latency)
 
             # Record metrics using WispContext
             if wisp_ctx.metrics:
-                from wisp_framework.observability.metrics import record_command_metric
-
                 record_command_metric(wisp_ctx.metrics, "ping", "success")
 
             await respond_success(interaction, f"Pong! Latency: {latency}ms", embed=embed)
@@ -93,51 +75,10 @@ class PingModule(Module):
             wisp_ctx.bound_logger.debug("Executing ping command (prefix)")
 
             latency = round(bot.latency * 1000)
-
-            # Determine status color based on latency
-            if latency < 100:
-                status = "Excellent"
-                color_type = "success"
-            elif latency < 200:
-                status = "Good"
-                color_type = "info"
-            elif latency < 500:
-                status = "Fair"
-                color_type = "warning"
-            else:
-                status = "Poor"
-                color_type = "error"
-
-            # Create appropriate embed
-            if color_type == "success":
-                embed = EmbedBuilder.success(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
-            elif color_type == "info":
-                embed = EmbedBuilder.info(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
-            elif color_type == "warning":
-                embed = EmbedBuilder.warning(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
-            else:
-                embed = EmbedBuilder.error(
-                    title="Pong! 🏓",
-                    description=f"Latency: **{latency}ms**\nStatus: {status}",
-                    fields=[{"name": "Response Time", "value": f"{latency}ms", "inline": True}]
-                )
+            embed = _ping_embed(latency)
 
             # Record metrics using WispContext
             if wisp_ctx.metrics:
-                from wisp_framework.observability.metrics import record_command_metric
-
                 record_command_metric(wisp_ctx.metrics, "ping", "success")
 
             await ctx.send(embed=embed)
@@ -3,5 +3,6 @@
 from wisp_framework.observability.logging import get_logger
 from wisp_framework.observability.metrics import normalize_metric_name
 from wisp_framework.observability.sentry import init_sentry
+from wisp_framework.observability.tracing import start_span
 
-__all__ = ["get_logger", "normalize_metric_name", "init_sentry"]
+__all__ = ["get_logger", "normalize_metric_name", "init_sentry", "start_span"]
@@ -10,34 +10,31 @@ if TYPE_CHECKING:
 # Context variable for request_id in async contexts
 _request_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_id", default=None)
 
-
-class RequestIdFilter(logging.Filter):
-    """Logging filter that adds request_id from context variable."""
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Add request_id if not already present."""
-        if not hasattr(record, "request_id"):
-            request_id = _request_id_var.get()
-            record.request_id = request_id or "no-request-id"
-        return True
+# Loggers handed out by get_logger, by module name
+_loggers: dict[str, logging.Logger] = {}
 
 
 def get_logger(ctx: "WispContext") -> logging.Logger:
     """Get a logger bound to the WispContext with request_id.
 
+    The request_id is published through a context variable and stamped onto
+    each record by the record factory, so the logger needs no filter.
+
     Args:
         ctx: WispContext instance
 
     Returns:
         Logger instance with request_id in context
     """
-    logger = logging.getLogger(ctx.__class__.__module__)
-
     # Set request_id in context variable for this async context
     _request_id_var.set(ctx.request_id)
 
-    # Ensure logger has RequestIdFilter
-    if not any(isinstance(f, RequestIdFilter) for f in logger.filters):
-        logger.addFilter(RequestIdFilter())
+    module_name = ctx.__class__.__module__
+    logger = _loggers.get(module_name)
+    if logger is None:
+        # Imported here; wisp_framework.logging imports this module
+        from wisp_framework.logging import _install_record_factory
 
+        _install_record_factory()
+        logger = _loggers[module_name] = logging.getLogger(module_name)
     return logger
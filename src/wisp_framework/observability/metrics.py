@@ -22,10 +22,26 @@ def normalize_metric_name(prefix: str, name: str, status: str | None = None) ->
         >>> normalize_metric_name("jobs", "sync_data", "failed")
         'wisp.jobs.sync_data.failed'
     """
-    parts = ["wisp", prefix, name]
     if status:
-        parts.append(status)
-    return ".".join(parts)
+        return f"wisp.{prefix}.{name}.{status}"
+    return f"wisp.{prefix}.{name}"
+
+
+# Names built by the record_* helpers, which see the same few combinations over
+# and over; capped so unexpected names (e.g. arbitrary job types) can't grow it
+_METRIC_NAME_CACHE_MAX = 4096
+_metric_names: dict[tuple[str, str, str | None], str] = {}
+
+
+def _metric_name(prefix: str, name: str, status: str | None) -> str:
+    """Return the normalized metric name, reusing a previously built string."""
+    key = (prefix, name, status)
+    metric_name = _metric_names.get(key)
+    if metric_name is None:
+        metric_name = normalize_metric_name(prefix, name, status)
+        if len(_metric_names) < _METRIC_NAME_CACHE_MAX:
+            _metric_names[key] = metric_name
+    return metric_name
 
 
 def record_command_metric(metrics_service: Any, command_name: str, status: str = "executed") -> None:
@@ -37,7 +53,7 @@ def record_command_metric(metrics_service: Any, command_name: str, status: str =
         status: Status of the command (executed, success, error, etc.)
     """
     if metrics_service:
-        metric_name = normalize_metric_name("commands", command_name, status)
+        metric_name = _metric_name("commands", command_name, status)
         metrics_service.increment(metric_name)
 
 
@@ -50,7 +66,7 @@ def record_event_metric(metrics_service: Any, event_name: str, status: str = "pr
         status: Status of the event (processed, filtered, error, etc.)
     """
     if metrics_service:
-        metric_name = normalize_metric_name("events", event_name, status)
+        metric_name = _metric_name("events", event_name, status)
         metrics_service.increment(metric_name)
 
 
@@ -63,5 +79,5 @@ def record_job_metric(metrics_service: Any, job_type: str, status: str) -> None:
         status: Status of the job (enqueued, completed, failed, dead_letter, etc.)
     """
     if metrics_service:
-        metric_name = normalize_metric_name("jobs", job_type, status)
+        metric_name = _metric_name("jobs", job_type, status)
         metrics_service.increment(metric_name)
@@ -0,0 +1,44 @@
+"""OpenTelemetry span helpers."""
+
+import contextlib
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+from wisp_framework.config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+# Resolved on first use: the tracer, or False when tracing is unavailable
+_tracer: Any | None = None
+
+
+def _get_tracer(config: AppConfig) -> Any | None:
+    """Get the framework tracer if OpenTelemetry is enabled and installed."""
+    global _tracer
+    if _tracer is None:
+        _tracer = False
+        if config.otel_enabled:
+            try:
+                from opentelemetry import trace
+
+                _tracer = trace.get_tracer("wisp_framework")
+            except ImportError:
+                logger.warning("opentelemetry-api not installed, skipping tracing")
+    return _tracer or None
+
+
+@contextlib.contextmanager
+def start_span(config: AppConfig, name: str) -> Iterator[None]:
+    """Run the enclosed block in an OpenTelemetry span, if tracing is enabled.
+
+    Args:
+        config: Application configuration
+        name: Span name (e.g., "startup.module.ping")
+    """
+    tracer = _get_tracer(config)
+    if tracer is None:
+        yield
+        return
+    with tracer.start_as_current_span(name):
+        yield
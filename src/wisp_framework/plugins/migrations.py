@@ -1,6 +1,8 @@
 """Plugin migration support."""
 
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -8,28 +10,86 @@ from alembic.config import Config
 
 logger = logging.getLogger(__name__)
 
+MIGRATIONS_MANIFEST_NAME = "migrations_manifest.json"
+
+
+def _scan_plugin_migrations(plugin_dir: Path) -> list[Path]:
+    """Find plugin migration directories by walking ``plugin_dir``."""
+    migrations = []
+    for plugin_path in sorted(plugin_dir.iterdir()):
+        if not plugin_path.is_dir():
+            continue
+
+        migrations_path = plugin_path / "migrations" / "versions"
+        if migrations_path.is_dir():
+            migrations.append(migrations_path)
+
+    return migrations
+
+
+def _read_migrations_manifest(plugin_dir: Path) -> list[Path] | None:
+    """Read the pre-generated migrations manifest, if present and current.
+
+    Returns None when there is no manifest, it predates the last change to
+    ``plugin_dir``, or it cannot be parsed.
+    """
+    manifest_path = plugin_dir / MIGRATIONS_MANIFEST_NAME
+    try:
+        if manifest_path.stat().st_mtime_ns < plugin_dir.stat().st_mtime_ns:
+            logger.debug("Ignoring stale migrations manifest: %s", manifest_path)
+            return None
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        return [plugin_dir / p for p in manifest["dirs"]]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable migrations manifest %s: %s", manifest_path, e)
+        return None
+
+
+def write_plugin_migrations_manifest(plugin_dir: Path) -> Path:
+    """Write a migrations manifest for the plugins in ``plugin_dir``.
+
+    Intended for the plugin packaging/install step, so that
+    :func:`discover_plugin_migrations` can skip walking every plugin at startup.
+
+    Args:
+        plugin_dir: Directory containing plugins
+
+    Returns:
+        Path of the written manifest
+    """
+    manifest_path = plugin_dir / MIGRATIONS_MANIFEST_NAME
+    dirs = [str(p.relative_to(plugin_dir)) for p in _scan_plugin_migrations(plugin_dir)]
+    tmp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    tmp_path.write_text(json.dumps({"dirs": dirs}, indent=2), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+    # The rename bumps the directory mtime; touch the manifest so it is not
+    # considered stale straight away.
+    os.utime(manifest_path)
+    return manifest_path
+
 
 def discover_plugin_migrations(plugin_dir: Path) -> list[Path]:
     """Discover migration directories for plugins.
 
+    Uses ``migrations_manifest.json`` in ``plugin_dir`` when it is newer than
+    the directory itself, and falls back to scanning the plugins otherwise.
+    Adding or removing a plugin invalidates the manifest, but updating one in
+    place does not, so regenerate it whenever plugins are installed.
+
     Args:
         plugin_dir: Directory containing plugins
 
     Returns:
         List of migration directory paths
     """
-    migrations = []
     if not plugin_dir.exists():
-        return migrations
-
-    for plugin_path in plugin_dir.iterdir():
-        if not plugin_path.is_dir():
-            continue
-
-        migrations_path = plugin_path / "migrations" / "versions"
-        if migrations_path.exists() and migrations_path.is_dir():
-            migrations.append(migrations_path)
+        return []
 
+    migrations = _read_migrations_manifest(plugin_dir)
+    if migrations is None:
+        migrations = _scan_plugin_migrations(plugin_dir)
     return migrations
 
 
@@ -50,9 +110,9 @@ def merge_plugin_migrations_into_alembic(
     # by including their migrations in the main migrations directory
     # with a naming convention like: {plugin_name}_{revision}.py
 
-    logger.info(f"Found {len(plugin_migration_dirs)} plugin migration directories")
+    logger.info("Found %s plugin migration directories", len(plugin_migration_dirs))
     for migration_dir in plugin_migration_dirs:
-        logger.debug(f"Plugin migration directory: {migration_dir}")
+        logger.debug("Plugin migration directory: %s", migration_dir)
 
 
 def apply_plugin_migrations(
@@ -75,7 +135,7 @@ def apply_plugin_migrations(
 
     logger.info("Applying plugin migrations...")
     for migration_dir in plugin_migration_dirs:
-        logger.debug(f"Processing plugin migrations from: {migration_dir}")
+        logger.debug("Processing plugin migrations from: %s", migration_dir)
         # In a full implementation, this would:
         # 1. Load migration scripts from the directory
         # 2. Resolve dependencies
@@ -1,10 +1,44 @@
 """Plugin base class."""
 
+import inspect
+import threading
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any
 
 from wisp_framework.plugins.manifest import PluginManifest
 
+# Concrete Plugin subclasses, keyed by "<module>:<qualname>", filled in as
+# plugin modules are imported
+_plugin_classes: dict[str, type["Plugin"]] = {}
+# Plugin modules may be imported from worker threads while the loop searches
+# the registry, so both sides hold this lock
+_plugin_classes_lock = threading.Lock()
+
+
+def find_plugin_class(entrypoint: str) -> type["Plugin"] | None:
+    """Find the Plugin subclass defined by an imported plugin entrypoint.
+
+    Args:
+        entrypoint: Module path the plugin was imported from
+
+    Returns:
+        Plugin class, or None if the entrypoint defines none
+    """
+    # Prefer a class defined in the entrypoint module itself, then one from
+    # a submodule (for packages that re-export their plugin class)
+    package_prefix = f"{entrypoint}."
+    fallback = None
+    with _plugin_classes_lock:
+        plugin_classes = list(_plugin_classes.values())
+    for plugin_class in plugin_classes:
+        module = plugin_class.__module__
+        if module == entrypoint:
+            return plugin_class
+        if fallback is None and module.startswith(package_prefix):
+            fallback = plugin_class
+    return fallback
+
 
 class Plugin(ABC):
     """Abstract base class for framework plugins.
@@ -13,43 +47,54 @@ class Plugin(ABC):
     They have a manifest, lifecycle hooks, and can provide capabilities.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record concrete subclasses so discovery can find them by module."""
+        super().__init_subclass__(**kwargs)
+        if not inspect.isabstract(cls):
+            with _plugin_classes_lock:
+                _plugin_classes[f"{cls.__module__}:{cls.__qualname__}"] = cls
+
     @property
     @abstractmethod
     def manifest(self) -> PluginManifest:
-        """Plugin manifest."""
+        """Plugin manifest.
+
+        The manifest is treated as fixed for the plugin's lifetime: the
+        properties derived from it below are cached on first read.
+        """
         pass
 
-    @property
+    @cached_property
     def name(self) -> str:
         """Plugin name (from manifest)."""
         return self.manifest.name
 
-    @property
+    @cached_property
     def version(self) -> str:
         """Plugin version (from manifest)."""
         return self.manifest.version
 
-    @property
+    @cached_property
     def default_enabled(self) -> bool:
         """Whether the plugin is enabled by default."""
         return self.manifest.default_enabled
 
-    @property
+    @cached_property
     def guild_scoped(self) -> bool:
         """Whether the plugin is guild-scoped."""
         return self.manifest.guild_scoped
 
-    @property
+    @cached_property
     def capabilities_provided(self) -> list[str]:
         """Capabilities provided by this plugin."""
         return self.manifest.capabilities_provided
 
-    @property
+    @cached_property
     def capabilities_required(self) -> list[str]:
         """Capabilities required by this plugin."""
         return self.manifest.capabilities_required
 
-    @property
+    @cached_property
     def dependencies(self) -> list[str]:
         """Plugin dependencies (other plugin names)."""
         return self.manifest.dependencies
@@ -1,20 +1,70 @@
 """Plugin registry for managing plugin lifecycle and state."""
 
+import asyncio
 import importlib
+import json
 import logging
+import os
+import sys
+import time
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from wisp_framework.db.models import PluginState
 from wisp_framework.feature_flags import FeatureFlags
 from wisp_framework.plugins.manifest import PluginManifest
-from wisp_framework.plugins.plugin import Plugin
+from wisp_framework.plugins.plugin import Plugin, find_plugin_class
 from wisp_framework.services.db import DatabaseService
 
 logger = logging.getLogger(__name__)
 
+# How long a plugin's degraded flag is trusted before re-reading it, in seconds
+_DEGRADED_CACHE_TTL = 30.0
+
+# Conflict target matching the uq_plugin_states_plugin_guild unique index
+_PLUGIN_STATE_KEY = ["plugin_name", text("coalesce(guild_id, 0)")]
+
+# Bump when the layout of the discovery cache changes
+_DISCOVERY_CACHE_VERSION = 2
+
+
+def _discovery_cache_path(plugin_dir: Path, cache_dir: Path | None = None) -> Path:
+    """Path of the discovery cache for a plugin directory.
+
+    By default the cache lives next to the directory rather than inside it,
+    so that rewriting it doesn't touch the directory's own mtime.
+    """
+    return (cache_dir or plugin_dir.parent) / f".{plugin_dir.name}_discovery_cache.json"
+
+
+def _load_discovery_cache(path: Path) -> dict[str, Any]:
+    """Read cached discovery entries, or an empty mapping if unusable."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _DISCOVERY_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_discovery_cache(path: Path, entries: dict[str, Any]) -> None:
+    """Atomically replace the discovery cache."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_text(json.dumps({"version": _DISCOVERY_CACHE_VERSION, "entries": entries}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Could not write plugin discovery cache %s: %s", path, e)
+
 
 class PluginRegistry:
     """Registry for managing framework plugins with lifecycle and state."""
@@ -31,13 +81,23 @@ class PluginRegistry:
             db_service: Optional database service for plugin state persistence
         """
         self._plugins: dict[str, Plugin] = {}
+        # Discovered plugins whose entrypoint hasn't been imported yet
+        self._pending: dict[str, PluginManifest] = {}
+        # Manifest of every known plugin, captured once so it is never rebuilt
+        self._manifests: dict[str, PluginManifest] = {}
+        # Cached dependency load order, reset whenever plugins are added
+        self._topo_order: list[str] | None = None
+        # The same order grouped into dependency levels, computed alongside it
+        self._topo_levels: list[list[str]] = []
         self._feature_flags = feature_flags
         self._db_service = db_service
         # Track which plugins have been set up per guild_id
-        # Key: (plugin_name, guild_id) where guild_id can be None for global
-        self._setup_complete: set[tuple[str, int | None]] = set()
+        # plugin_name -> guild_ids set up, where None means set up globally
+        self._setup_complete: defaultdict[str, set[int | None]] = defaultdict(set)
         # Track loaded plugins (on_load called)
         self._loaded_plugins: set[str] = set()
+        # plugin_name -> (degraded, expiry on the monotonic clock)
+        self._degraded_cache: dict[str, tuple[bool, float]] = {}
 
     def register(self, plugin: Plugin) -> None:
         """Register a plugin.
@@ -48,63 +108,206 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin is already registered
         """
-        if plugin.name in self._plugins:
+        if plugin.name in self._plugins or plugin.name in self._pending:
             raise ValueError(f"Plugin '{plugin.name}' is already registered")
         self._plugins[plugin.name] = plugin
-        logger.info(f"Registered plugin: {plugin.name} v{plugin.version}")
+        self._manifests[plugin.name] = plugin.manifest
+        self._topo_order = None
+        logger.info("Registered plugin: %s v%s", plugin.name, plugin.version)
 
-    def discover_plugins(self, plugin_dir: Path) -> None:
+    def unregister(self, name: str) -> bool:
+        """Unregister a plugin and drop everything tracked for it.
+
+        Releases the plugin instance (and anything it captured during setup)
+        so long-running bots don't accumulate plugins across reloads.
+        ``unload_plugin`` already unregisters a plugin once it unloads
+        cleanly, so call this directly only for plugins that were never
+        loaded; it does not run ``on_unload``.
+
+        Args:
+            name: Plugin name
+
+        Returns:
+            True if the plugin was registered or discovered
+        """
+        found = (
+            self._plugins.pop(name, None) is not None
+            or self._pending.pop(name, None) is not None
+        )
+        self._manifests.pop(name, None)
+        self._loaded_plugins.discard(name)
+        self._setup_complete.pop(name, None)
+        self._degraded_cache.pop(name, None)
+        if found:
+            self._topo_order = None
+            logger.info("Unregistered plugin: %s", name)
+        return found
+
+    def discover_plugins(self, plugin_dir: Path, cache_dir: Path | None = None) -> None:
         """Discover plugins from a directory.
 
-        Looks for plugin.toml files and loads plugins.
+        Looks for plugin.toml files and records their manifests. Entrypoints
+        are not imported here; each plugin is imported the first time it is
+        actually needed (see ``_materialize``), so disabled plugins never pay
+        for their imports. Parsed manifests are cached in
+        ``.<plugin_dir name>_discovery_cache.json``, keyed by each
+        plugin.toml's mtime, so unchanged plugins skip TOML parsing on later
+        startups. If the cache can't be written discovery still works, it
+        just parses every manifest.
 
         Args:
             plugin_dir: Directory containing plugins
+            cache_dir: Directory for the discovery cache (defaults to the
+                parent of ``plugin_dir``)
         """
         if not plugin_dir.exists():
-            logger.warning(f"Plugin directory does not exist: {plugin_dir}")
+            logger.warning("Plugin directory does not exist: %s", plugin_dir)
             return
 
+        cache_path = _discovery_cache_path(plugin_dir, cache_dir)
+        cached_entries = _load_discovery_cache(cache_path)
+        entries: dict[str, Any] = {}
+
         for plugin_path in plugin_dir.iterdir():
             if not plugin_path.is_dir():
                 continue
 
             manifest_path = plugin_path / "plugin.toml"
-            if not manifest_path.exists():
+            try:
+                toml_mtime = manifest_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 continue
 
             try:
-                manifest = PluginManifest.from_toml(manifest_path)
-                # Load plugin entrypoint
-                plugin_module = importlib.import_module(manifest.entrypoint)
-                # Find Plugin subclass
-                plugin_class = None
-                for attr_name in dir(plugin_module):
-                    attr = getattr(plugin_module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, Plugin)
-                        and attr is not Plugin
-                    ):
-                        plugin_class = attr
-                        break
+                entry = cached_entries.get(plugin_path.name)
+                if isinstance(entry, dict) and entry.get("toml_mtime") == toml_mtime:
+                    manifest = PluginManifest.from_dict(entry["manifest"])
+                else:
+                    manifest = PluginManifest.from_toml(manifest_path)
+
+                if manifest.name in self._plugins or manifest.name in self._pending:
+                    raise ValueError(f"Plugin '{manifest.name}' is already registered")
+                self._pending[manifest.name] = manifest
+                self._manifests[manifest.name] = manifest
+                self._topo_order = None
+                entries[plugin_path.name] = {
+                    "toml_mtime": toml_mtime,
+                    "manifest": manifest.to_dict(),
+                }
+                logger.info("Discovered plugin: %s from %s", manifest.name, plugin_path)
+            except (OSError, ValueError) as e:
+                # Unreadable or invalid manifest, or a duplicate name; the message says it all
+                logger.warning("Failed to discover plugin from %s: %s", plugin_path, e)
+            except Exception as e:
+                logger.error("Failed to discover plugin from %s: %s", plugin_path, e, exc_info=True)
 
-                if not plugin_class:
-                    logger.warning(f"No Plugin class found in {manifest.entrypoint}")
-                    continue
+        if entries != cached_entries:
+            _write_discovery_cache(cache_path, entries)
 
-                plugin_instance = plugin_class()
-                # Verify manifest matches
-                if plugin_instance.manifest.name != manifest.name:
-                    logger.warning(
-                        f"Plugin manifest name mismatch: {manifest.name} != {plugin_instance.manifest.name}"
-                    )
-                    continue
+    def _materialize(self, name: str) -> Plugin | None:
+        """Import and register a discovered plugin on first use.
 
-                self.register(plugin_instance)
-                logger.info(f"Discovered plugin: {manifest.name} from {plugin_path}")
+        Args:
+            name: Plugin name
+
+        Returns:
+            Plugin instance, or None if unknown or its entrypoint failed to load
+        """
+        plugin = self._plugins.get(name)
+        if plugin is not None:
+            return plugin
+        manifest = self._pending.pop(name, None)
+        if manifest is None:
+            return None
+
+        plugin = self._import_plugin(manifest)
+        if plugin is None:
+            self._forget_manifest(name)
+            return None
+
+        self.register(plugin)
+        return plugin
+
+    async def _materialize_async(self, name: str) -> Plugin | None:
+        """Like ``_materialize``, but import the entrypoint in a worker thread.
+
+        Module imports are mostly file reads and unmarshalling, so plugins set
+        up concurrently import in parallel without blocking the event loop.
+        Finding, instantiating and registering the class still happens here,
+        on the loop, since the registry isn't thread-safe.
+        """
+        manifest = self._pending.get(name)
+        if manifest is not None and manifest.entrypoint not in sys.modules:
+            try:
+                await asyncio.to_thread(importlib.import_module, manifest.entrypoint)
             except Exception as e:
-                logger.error(f"Failed to discover plugin from {plugin_path}: {e}", exc_info=True)
+                # Don't retry on the loop: that would block it and repeat the
+                # module's side effects
+                if self._pending.pop(name, None) is not None:
+                    self._log_import_failure(manifest, e)
+                    self._forget_manifest(name)
+                return None
+        return self._materialize(name)
+
+    def _forget_manifest(self, name: str) -> None:
+        """Forget a discovered plugin whose entrypoint can't be loaded."""
+        self._manifests.pop(name, None)
+        self._topo_order = None
+
+    def _import_plugin(self, manifest: PluginManifest) -> Plugin | None:
+        """Import a plugin's entrypoint and instantiate its Plugin class.
+
+        Args:
+            manifest: Manifest the plugin was discovered with
+
+        Returns:
+            Plugin instance, or None if its entrypoint failed to load
+        """
+        try:
+            # Load plugin entrypoint; Plugin subclasses register themselves
+            importlib.import_module(manifest.entrypoint)
+            plugin_class = find_plugin_class(manifest.entrypoint)
+
+            if not plugin_class:
+                logger.warning("No Plugin class found in %s", manifest.entrypoint)
+                return None
+
+            plugin = plugin_class()
+            # Verify manifest matches
+            if plugin.manifest.name != manifest.name:
+                logger.warning(
+                    "Plugin manifest name mismatch: %s != %s", manifest.name, plugin.manifest.name
+                )
+                return None
+        except Exception as e:
+            self._log_import_failure(manifest, e)
+            return None
+
+        return plugin
+
+    @staticmethod
+    def _log_import_failure(manifest: PluginManifest, error: Exception) -> None:
+        """Log why a plugin's entrypoint failed to load."""
+        if isinstance(error, ImportError):
+            # Typically an optional plugin whose dependencies aren't installed
+            logger.warning(
+                "Failed to import plugin '%s' from %s: %s",
+                manifest.name,
+                manifest.entrypoint,
+                error,
+            )
+        else:
+            logger.error(
+                "Failed to load plugin '%s' from %s: %s",
+                manifest.name,
+                manifest.entrypoint,
+                error,
+                exc_info=error,
+            )
+
+    def _get_manifest(self, name: str) -> PluginManifest | None:
+        """Get a plugin's manifest without importing it."""
+        return self._manifests.get(name)
 
     def list_plugins(self) -> list[str]:
         """List all registered plugin names.
@@ -112,7 +315,7 @@ class PluginRegistry:
         Returns:
             List of plugin names
         """
-        return list(self._plugins.keys())
+        return [*self._plugins, *self._pending]
 
     def get_plugin(self, name: str) -> Plugin | None:
         """Get a plugin by name.
@@ -123,7 +326,7 @@ class PluginRegistry:
         Returns:
             Plugin instance or None if not found
         """
-        return self._plugins.get(name)
+        return self._materialize(name)
 
     async def load_plugin(self, plugin_name: str, app: Any, services: Any) -> None:
         """Load a plugin (call on_load).
@@ -133,69 +336,79 @@ class PluginRegistry:
             app: Application instance
             services: Service container
         """
-        plugin = self._plugins.get(plugin_name)
+        plugin = self._materialize(plugin_name)
         if not plugin:
             raise ValueError(f"Plugin '{plugin_name}' not found")
 
         if plugin_name in self._loaded_plugins:
-            logger.debug(f"Plugin '{plugin_name}' already loaded")
+            logger.debug("Plugin '%s' already loaded", plugin_name)
             return
 
         try:
             await plugin.on_load(app, services)
             self._loaded_plugins.add(plugin_name)
-            logger.info(f"Loaded plugin: {plugin_name}")
+            logger.info("Loaded plugin: %s", plugin_name)
         except Exception as e:
-            logger.error(f"Failed to load plugin '{plugin_name}': {e}", exc_info=True)
-            await self._mark_plugin_degraded(plugin_name, str(e))
+            logger.error("Failed to load plugin '%s': %s", plugin_name, e, exc_info=True)
+            await self._mark_plugin_degraded(plugin, str(e))
             raise
 
     async def enable_plugin(
-        self, plugin_name: str, guild_id: int | None = None
+        self, plugin_name: str, guild_id: int | None = None, force: bool = False
     ) -> None:
         """Enable a plugin for a guild or globally.
 
+        Does nothing if the plugin is already enabled, unless ``force`` is set.
+
         Args:
             plugin_name: Plugin name
             guild_id: Guild ID (None for global)
+            force: Write the state and call on_enable even if it is unchanged
         """
-        plugin = self._plugins.get(plugin_name)
+        plugin = self._materialize(plugin_name)
         if not plugin:
             raise ValueError(f"Plugin '{plugin_name}' not found")
 
-        # Update database state
-        await self._set_plugin_enabled(plugin_name, guild_id, True)
+        # Update database state; skip the hook when the state didn't change
+        if not await self._set_plugin_enabled(plugin, guild_id, True, force=force):
+            logger.debug("Plugin '%s' already enabled for guild %s", plugin_name, guild_id)
+            return
 
         # Call on_enable hook
         try:
             await plugin.on_enable(guild_id)
-            logger.info(f"Enabled plugin '{plugin_name}' for guild {guild_id}")
+            logger.info("Enabled plugin '%s' for guild %s", plugin_name, guild_id)
         except Exception as e:
-            logger.error(f"Error in on_enable for plugin '{plugin_name}': {e}", exc_info=True)
-            await self._mark_plugin_degraded(plugin_name, str(e))
+            logger.error("Error in on_enable for plugin '%s': %s", plugin_name, e, exc_info=True)
+            await self._mark_plugin_degraded(plugin, str(e))
 
     async def disable_plugin(
-        self, plugin_name: str, guild_id: int | None = None
+        self, plugin_name: str, guild_id: int | None = None, force: bool = False
     ) -> None:
         """Disable a plugin for a guild or globally.
 
+        Does nothing if the plugin is already disabled, unless ``force`` is set.
+
         Args:
             plugin_name: Plugin name
             guild_id: Guild ID (None for global)
+            force: Write the state and call on_disable even if it is unchanged
         """
-        plugin = self._plugins.get(plugin_name)
+        plugin = self._materialize(plugin_name)
         if not plugin:
             raise ValueError(f"Plugin '{plugin_name}' not found")
 
-        # Update database state
-        await self._set_plugin_enabled(plugin_name, guild_id, False)
+        # Update database state; skip the hook when the state didn't change
+        if not await self._set_plugin_enabled(plugin, guild_id, False, force=force):
+            logger.debug("Plugin '%s' already disabled for guild %s", plugin_name, guild_id)
+            return
 
         # Call on_disable hook
         try:
             await plugin.on_disable(guild_id)
-            logger.info(f"Disabled plugin '{plugin_name}' for guild {guild_id}")
+            logger.info("Disabled plugin '%s' for guild %s", plugin_name, guild_id)
         except Exception as e:
-            logger.error(f"Error in on_disable for plugin '{plugin_name}': {e}", exc_info=True)
+            logger.error("Error in on_disable for plugin '%s': %s", plugin_name, e, exc_info=True)
 
     async def load_enabled_plugins(
         self, bot: Any, ctx: Any, guild_id: int | None = None
@@ -210,51 +423,125 @@ class PluginRegistry:
         # Resolve dependencies
         plugins_to_load = self._resolve_dependencies()
 
-        for plugin_name in plugins_to_load:
-            plugin = self._plugins[plugin_name]
+        if not self._db_service or not self._db_service.session_factory:
+            await self._setup_levels(bot, ctx, guild_id, None, None)
+            return
 
-            # Check if enabled for this guild
-            if guild_id is not None and plugin.guild_scoped:
-                enabled = await self._is_plugin_enabled(plugin_name, guild_id)
-                if not enabled:
-                    logger.debug(
-                        f"Plugin '{plugin_name}' is disabled for guild {guild_id}"
-                    )
-                    continue
-
-            # Check if plugin is degraded
-            if await self._is_plugin_degraded(plugin_name):
-                logger.warning(f"Plugin '{plugin_name}' is degraded, skipping")
-                continue
+        # One private session for the whole pass. Not the routed event's: its
+        # transaction belongs to the handler, and the rollback below would
+        # discard the handler's pending writes
+        async with self._session_scope() as session:
+            # Fetch every plugin's state row in one query
+            states = await self._prefetch_plugin_states(
+                plugins_to_load, guild_id, session=session
+            )
+            # Read-only so far; hand the connection back while plugins set up
+            if session.in_transaction():
+                await session.rollback()
+            await self._setup_levels(bot, ctx, guild_id, states, session)
+
+    async def _setup_levels(
+        self,
+        bot: Any,
+        ctx: Any,
+        guild_id: int | None,
+        states: dict[tuple[str, int | None], PluginState] | None,
+        session: AsyncSession | None,
+    ) -> None:
+        """Set up plugins level by level, marking failed ones degraded."""
+        # Bound once; these run for every plugin on every guild load
+        setup_one = self._setup_one
+        mark_degraded = self._mark_plugin_degraded
+        plugins = self._plugins
+
+        for level in self._dependency_levels():
+            # Plugins in a level only depend on earlier levels, so they can be
+            # set up concurrently
+            errors = await asyncio.gather(
+                *(setup_one(name, bot, ctx, guild_id, states) for name in level)
+            )
+            # A session can't be shared by concurrent tasks, so record failures
+            # one at a time once the level has finished
+            for plugin_name, error in zip(level, errors, strict=True):
+                if error is not None:
+                    # Setup only fails after the plugin has been materialized
+                    await mark_degraded(plugins[plugin_name], str(error), session=session)
+
+    async def _setup_one(
+        self,
+        plugin_name: str,
+        bot: Any,
+        ctx: Any,
+        guild_id: int | None,
+        states: dict[tuple[str, int | None], PluginState] | None,
+    ) -> Exception | None:
+        """Set up one plugin for a guild if it is enabled, healthy and not yet set up.
+
+        Args:
+            plugin_name: Plugin name
+            bot: The Discord bot instance
+            ctx: Bot context with services and config
+            guild_id: Guild ID (None for global plugins)
+            states: Prefetched plugin state rows (None without a database)
+
+        Returns:
+            The exception raised by the plugin's setup, if it failed
+        """
+        manifest = self._get_manifest(plugin_name)
+        if manifest is None:
+            return None
 
-            # Check if already set up
-            if guild_id is None:
-                setup_key = (plugin_name, None)
+        # Check if enabled for this guild
+        if guild_id is not None and manifest.guild_scoped:
+            if states is None:
+                enabled = await self._is_plugin_enabled(plugin_name, guild_id)
             else:
-                global_setup_key = (plugin_name, None)
-                if global_setup_key in self._setup_complete:
-                    logger.debug(
-                        f"Plugin '{plugin_name}' already set up globally, skipping guild {guild_id} setup"
-                    )
-                    continue
-                setup_key = (plugin_name, guild_id)
-
-            if setup_key in self._setup_complete:
-                logger.debug(
-                    f"Plugin '{plugin_name}' already set up for guild {guild_id}, skipping"
-                )
-                continue
+                row = states.get((plugin_name, guild_id))
+                enabled = row.enabled if row else manifest.default_enabled
+            if not enabled:
+                logger.debug("Plugin '%s' is disabled for guild %s", plugin_name, guild_id)
+                return None
+
+        # Check if plugin is degraded (served from the cache the prefetch filled)
+        if await self._is_plugin_degraded(plugin_name):
+            logger.warning("Plugin '%s' is degraded, skipping", plugin_name)
+            return None
+
+        # Check if already set up
+        set_up_guilds = self._setup_complete[plugin_name]
+        if guild_id is not None and None in set_up_guilds:
+            logger.debug(
+                "Plugin '%s' already set up globally, skipping guild %s setup",
+                plugin_name,
+                guild_id,
+            )
+            return None
 
-            try:
-                logger.info(f"Loading plugin: {plugin_name} (guild: {guild_id})")
-                await plugin.setup(bot, ctx)
-                self._setup_complete.add(setup_key)
-            except Exception as e:
-                logger.error(f"Failed to load plugin '{plugin_name}': {e}", exc_info=True)
-                await self._mark_plugin_degraded(plugin_name, str(e))
+        if guild_id in set_up_guilds:
+            logger.debug(
+                "Plugin '%s' already set up for guild %s, skipping", plugin_name, guild_id
+            )
+            return None
+
+        # Import the plugin only now that it is known to be needed
+        plugin = await self._materialize_async(plugin_name)
+        if plugin is None:
+            return None
+
+        try:
+            logger.info("Loading plugin: %s (guild: %s)", plugin_name, guild_id)
+            await plugin.setup(bot, ctx)
+            set_up_guilds.add(guild_id)
+        except Exception as e:
+            logger.error("Failed to load plugin '%s': %s", plugin_name, e, exc_info=True)
+            return e
+        return None
 
     async def unload_plugin(self, plugin_name: str) -> None:
-        """Unload a plugin (call on_unload).
+        """Unload a plugin (call on_unload) and unregister it.
+
+        The plugin can't be loaded again until it is re-registered or
+        rediscovered. If ``on_unload`` raises, it stays registered and loaded.
 
         Args:
             plugin_name: Plugin name
@@ -269,44 +556,165 @@ class PluginRegistry:
         try:
             await plugin.on_unload()
             self._loaded_plugins.discard(plugin_name)
-            logger.info(f"Unloaded plugin: {plugin_name}")
+            logger.info("Unloaded plugin: %s", plugin_name)
+            # Release the instance and its per-guild bookkeeping
+            self.unregister(plugin_name)
         except Exception as e:
-            logger.error(f"Error unloading plugin '{plugin_name}': {e}", exc_info=True)
+            logger.error("Error unloading plugin '%s': %s", plugin_name, e, exc_info=True)
 
     def _resolve_dependencies(self) -> list[str]:
-        """Resolve plugin dependencies and return load order."""
-        visited = set()
-        result = []
-
-        def visit(name: str) -> None:
-            if name in visited:
-                return
-            visited.add(name)
-            plugin = self._plugins.get(name)
-            if plugin:
-                for dep in plugin.dependencies:
-                    if dep not in self._plugins:
+        """Resolve plugin dependencies and return load order.
+
+        The order is cached until the set of plugins changes. Dependencies are
+        walked depth-first with an explicit stack, so long chains can't hit the
+        recursion limit; dependency cycles are logged and broken.
+        """
+        if self._topo_order is not None:
+            return self._topo_order
+
+        names = self.list_plugins()
+        known = set(names)
+        done: set[str] = set()
+        # Plugins on the current DFS path, for cycle detection
+        visiting: set[str] = set()
+        result: list[str] = []
+
+        def dependencies_of(name: str) -> Iterator[str]:
+            manifest = self._get_manifest(name)
+            return iter(manifest.dependencies if manifest else ())
+
+        for root in names:
+            if root in done:
+                continue
+            visiting.add(root)
+            stack: list[tuple[str, Iterator[str]]] = [(root, dependencies_of(root))]
+            while stack:
+                name, deps = stack[-1]
+                for dep in deps:
+                    if dep in done:
+                        continue
+                    if dep not in known:
+                        logger.warning(
+                            "Plugin '%s' depends on '%s' which is not registered", name, dep
+                        )
+                    elif dep in visiting:
                         logger.warning(
-                            f"Plugin '{name}' depends on '{dep}' which is not registered"
+                            "Plugin '%s' has a circular dependency on '%s', ignoring it", name, dep
                         )
                     else:
-                        visit(dep)
-            result.append(name)
+                        visiting.add(dep)
+                        stack.append((dep, dependencies_of(dep)))
+                        break
+                else:
+                    # All dependencies are ordered; emit the plugin itself
+                    stack.pop()
+                    visiting.discard(name)
+                    done.add(name)
+                    result.append(name)
+
+        # Place each plugin one level after its deepest dependency; edges
+        # dropped above (unknown or circular) are ignored here as well
+        level_of: dict[str, int] = {}
+        levels: list[list[str]] = []
+        for name in result:
+            manifest = self._get_manifest(name)
+            deps = manifest.dependencies if manifest else ()
+            level = max((level_of[dep] + 1 for dep in deps if dep in level_of), default=0)
+            level_of[name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(name)
+
+        self._topo_order = result
+        self._topo_levels = levels
+        return result
 
-        for plugin_name in self._plugins:
-            if plugin_name not in visited:
-                visit(plugin_name)
+    def _dependency_levels(self) -> list[list[str]]:
+        """Group the load order into levels whose dependencies are all in earlier levels."""
+        self._resolve_dependencies()
+        return self._topo_levels
 
-        return result
+    @asynccontextmanager
+    async def _session_scope(
+        self, session: AsyncSession | None = None
+    ) -> AsyncGenerator[AsyncSession]:
+        """Use the caller's session if given, otherwise open a new one.
+
+        A borrowed session is rolled back if the block fails, so the caller
+        can keep using it. Callers must check that a database is configured.
+        """
+        if session is None:
+            async with self._db_service.session_factory() as new_session:
+                yield new_session
+            return
+
+        try:
+            yield session
+        except Exception:
+            if session.in_transaction():
+                await session.rollback()
+            raise
+
+    async def _prefetch_plugin_states(
+        self,
+        names: list[str],
+        guild_id: int | None = None,
+        *,
+        session: AsyncSession | None = None,
+    ) -> dict[tuple[str, int | None], PluginState] | None:
+        """Fetch the guild and global state rows for several plugins at once.
+
+        Args:
+            names: Plugin names
+            guild_id: Guild ID (None for global rows only)
+            session: Optional session to run on instead of opening one
+
+        Returns:
+            Mapping of (plugin_name, guild_id) to state row, or None if there
+            is no database to read from
+        """
+        if not self._db_service or not self._db_service.session_factory:
+            return None
+        if not names:
+            return {}
+
+        guild_filter = PluginState.guild_id.is_(None)
+        if guild_id is not None:
+            guild_filter = or_(PluginState.guild_id == guild_id, guild_filter)
+
+        try:
+            async with self._session_scope(session) as session:
+                stmt = select(PluginState).where(
+                    PluginState.plugin_name.in_(names),
+                    guild_filter,
+                )
+                result = await session.execute(stmt)
+                states = {(row.plugin_name, row.guild_id): row for row in result.scalars()}
+        except Exception as e:
+            logger.warning("Database check failed: %s, using defaults", e)
+            return {}
+
+        # The global rows carry the degraded flag; refresh its cache while here
+        expires_at = time.monotonic() + _DEGRADED_CACHE_TTL
+        degraded_cache = self._degraded_cache
+        for name in names:
+            row = states.get((name, None))
+            degraded_cache[name] = (row.degraded if row else False, expires_at)
+        return states
 
     async def _is_plugin_enabled(
-        self, plugin_name: str, guild_id: int | None = None
+        self,
+        plugin_name: str,
+        guild_id: int | None = None,
+        *,
+        session: AsyncSession | None = None,
     ) -> bool:
         """Check if plugin is enabled for a guild.
 
         Args:
             plugin_name: Plugin name
             guild_id: Guild ID (None for global)
+            session: Optional session to run on instead of opening one
 
         Returns:
             True if enabled, False otherwise
@@ -318,7 +726,7 @@ class PluginRegistry:
             )
 
         try:
-            async with self._db_service.session_factory() as session:
+            async with self._session_scope(session) as session:
                 stmt = select(PluginState).where(
                     PluginState.plugin_name == plugin_name,
                     PluginState.guild_id == guild_id,
@@ -328,58 +736,82 @@ class PluginRegistry:
                 if row:
                     return row.enabled
                 # Default to plugin's default_enabled
-                plugin = self._plugins.get(plugin_name)
-                return plugin.default_enabled if plugin else True
+                manifest = self._get_manifest(plugin_name)
+                return manifest.default_enabled if manifest else True
         except Exception as e:
-            logger.warning(f"Database check failed: {e}, using default")
-            plugin = self._plugins.get(plugin_name)
-            return plugin.default_enabled if plugin else True
+            logger.warning("Database check failed: %s, using default", e)
+            manifest = self._get_manifest(plugin_name)
+            return manifest.default_enabled if manifest else True
 
     async def _set_plugin_enabled(
-        self, plugin_name: str, guild_id: int | None, enabled: bool
-    ) -> None:
+        self,
+        plugin: Plugin,
+        guild_id: int | None,
+        enabled: bool,
+        *,
+        force: bool = False,
+        session: AsyncSession | None = None,
+    ) -> bool:
         """Set plugin enabled state in database.
 
         Args:
-            plugin_name: Plugin name
+            plugin: Plugin instance
             guild_id: Guild ID (None for global)
             enabled: Whether to enable
+            force: Write the state even if it is unchanged
+            session: Optional session to run on instead of opening one
+
+        Returns:
+            True if the effective state changed (always True with ``force``)
         """
         if not self._db_service or not self._db_service.session_factory:
-            # Fallback to feature flags
-            await self._feature_flags.set_enabled(guild_id or 0, plugin_name, enabled)
-            return
+            # Fallback to feature flags; read-then-write, so concurrent calls
+            # may both see a change
+            fallback_key = (guild_id or 0, plugin.name)
+            if not force and await self._feature_flags.is_enabled(*fallback_key, True) == enabled:
+                return False
+            await self._feature_flags.set_enabled(*fallback_key, enabled)
+            return True
 
         try:
-            async with self._db_service.session_factory() as session:
-                stmt = select(PluginState).where(
-                    PluginState.plugin_name == plugin_name,
-                    PluginState.guild_id == guild_id,
+            async with self._session_scope(session) as session:
+                # Single conditional upsert: of several concurrent calls only
+                # one gets a row back, so only one runs the plugin's hook
+                stmt = pg_insert(PluginState).values(
+                    plugin_name=plugin.name,
+                    version=plugin.version,
+                    guild_id=guild_id,
+                    enabled=enabled,
                 )
-                result = await session.execute(stmt)
-                row = result.scalar_one_or_none()
-
-                plugin = self._plugins.get(plugin_name)
-                if row:
-                    row.enabled = enabled
-                else:
-                    row = PluginState(
-                        plugin_name=plugin_name,
-                        version=plugin.version if plugin else "0.0.0",
-                        guild_id=guild_id,
-                        enabled=enabled,
-                    )
-                    session.add(row)
-
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=_PLUGIN_STATE_KEY,
+                    set_={"enabled": enabled, "updated_at": func.now()},
+                    where=None if force else PluginState.enabled.is_distinct_from(enabled),
+                ).returning(literal_column("xmax = 0"))
+                # xmax is 0 only on freshly inserted rows
+                inserted = (await session.execute(stmt)).scalar_one_or_none()
                 await session.commit()
         except Exception as e:
-            logger.warning(f"Database set failed: {e}")
+            logger.warning("Database set failed: %s", e)
+            return True
 
-    async def _is_plugin_degraded(self, plugin_name: str) -> bool:
+        if inserted is None:
+            # The row already held this state
+            return False
+        # Without a row the plugin was at its default state
+        return force or not inserted or enabled != plugin.default_enabled
+
+    async def _is_plugin_degraded(
+        self, plugin_name: str, *, session: AsyncSession | None = None
+    ) -> bool:
         """Check if plugin is degraded.
 
+        Results are cached for ``_DEGRADED_CACHE_TTL`` seconds since the flag
+        rarely changes.
+
         Args:
             plugin_name: Plugin name
+            session: Optional session to run on instead of opening one
 
         Returns:
             True if degraded, False otherwise
@@ -387,53 +819,59 @@ class PluginRegistry:
         if not self._db_service or not self._db_service.session_factory:
             return False
 
+        cached = self._degraded_cache.get(plugin_name)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
         try:
-            async with self._db_service.session_factory() as session:
+            async with self._session_scope(session) as session:
                 stmt = select(PluginState).where(
                     PluginState.plugin_name == plugin_name,
                     PluginState.guild_id.is_(None),  # Check global state
                 )
                 result = await session.execute(stmt)
                 row = result.scalar_one_or_none()
-                return row.degraded if row else False
+                degraded = row.degraded if row else False
         except Exception as e:
-            logger.warning(f"Database check failed: {e}")
+            logger.warning("Database check failed: %s", e)
             return False
 
-    async def _mark_plugin_degraded(self, plugin_name: str, error: str) -> None:
+        self._degraded_cache[plugin_name] = (degraded, now + _DEGRADED_CACHE_TTL)
+        return degraded
+
+    async def _mark_plugin_degraded(
+        self, plugin: Plugin, error: str, *, session: AsyncSession | None = None
+    ) -> None:
         """Mark plugin as degraded with error.
 
         Args:
-            plugin_name: Plugin name
+            plugin: Plugin instance
             error: Error message
+            session: Optional session to run on instead of opening one
         """
         if not self._db_service or not self._db_service.session_factory:
             return
 
+        last_error = error[:1000]  # Truncate if too long
         try:
-            async with self._db_service.session_factory() as session:
-                stmt = select(PluginState).where(
-                    PluginState.plugin_name == plugin_name,
-                    PluginState.guild_id.is_(None),  # Update global state
+            async with self._session_scope(session) as session:
+                # Upsert the global state row
+                stmt = pg_insert(PluginState).values(
+                    plugin_name=plugin.name,
+                    version=plugin.version,
+                    guild_id=None,
+                    enabled=False,
+                    degraded=True,
+                    last_error=last_error,
                 )
-                result = await session.execute(stmt)
-                row = result.scalar_one_or_none()
-
-                plugin = self._plugins.get(plugin_name)
-                if row:
-                    row.degraded = True
-                    row.last_error = error[:1000]  # Truncate if too long
-                else:
-                    row = PluginState(
-                        plugin_name=plugin_name,
-                        version=plugin.version if plugin else "0.0.0",
-                        guild_id=None,
-                        enabled=False,
-                        degraded=True,
-                        last_error=error[:1000],
-                    )
-                    session.add(row)
-
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=_PLUGIN_STATE_KEY,
+                    set_={"degraded": True, "last_error": last_error, "updated_at": func.now()},
+                )
+                await session.execute(stmt)
                 await session.commit()
+            # Make the new state visible without waiting for the cache to expire
+            self._degraded_cache[plugin.name] = (True, time.monotonic() + _DEGRADED_CACHE_TTL)
         except Exception as e:
-            logger.warning(f"Failed to mark plugin degraded: {e}")
+            logger.warning("Failed to mark plugin degraded: %s", e)
@@ -1,7 +1,12 @@
 """Policy engine for capability-based access control."""
 
 from wisp_framework.policy.capabilities import CapabilityRegistry
-from wisp_framework.policy.decorators import requires_capability
+from wisp_framework.policy.decorators import get_required_capability, requires_capability
 from wisp_framework.policy.engine import PolicyEngine
 
-__all__ = ["PolicyEngine", "CapabilityRegistry", "requires_capability"]
+__all__ = [
+    "PolicyEngine",
+    "CapabilityRegistry",
+    "get_required_capability",
+    "requires_capability",
+]
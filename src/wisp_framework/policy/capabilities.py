@@ -1,5 +1,10 @@
 """Capability definitions and registry."""
 
+import re
+
+# Two or more dot-separated segments of letters, digits and underscores
+_CAPABILITY_RE = re.compile(r"[A-Za-z0-9_]+(?:\.[A-Za-z0-9_]+)+")
+
 
 class CapabilityRegistry:
     """Registry for capability strings."""
@@ -35,7 +40,14 @@ class CapabilityRegistry:
         Returns:
             True if valid format
         """
-        if not capability or not isinstance(capability, str):
+        if not isinstance(capability, str):
             return False
-        parts = capability.split(".")
-        return len(parts) >= 2 and all(part.isalnum() or "_" in part for part in parts)
+        return capability in _KNOWN_CAPABILITIES or _CAPABILITY_RE.fullmatch(capability) is not None
+
+
+# Built-in capability strings, checked before falling back to the pattern
+_KNOWN_CAPABILITIES = frozenset(
+    value
+    for name, value in vars(CapabilityRegistry).items()
+    if name.isupper() and isinstance(value, str)
+)
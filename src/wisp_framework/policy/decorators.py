@@ -4,43 +4,86 @@ import functools
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-import discord
-from discord.ext import commands
+# Attribute the required capability is stored under on decorated commands
+_CAPABILITY_ATTR = "_wisp_capability"
 
 
-def requires_capability(capability: str):
+def requires_capability(capability: str, eager: bool = False):
     """Decorator to require a capability for command execution.
 
+    By default the capability is only recorded on the command function,
+    with no wrapper and so no extra call per invocation. Nothing reads it
+    implicitly: whatever runs the command enforces it, typically with
+    ``PolicyMiddleware(get_required_capability(command))`` in its pipeline.
+
+    With ``eager=True`` the command is wrapped and checked on every call
+    instead, for commands that don't run through such a pipeline.
+
     Args:
         capability: Capability string (e.g., "moderation.kick")
+        eager: Wrap the command and enforce the capability before each call
 
     Returns:
         Decorator function
     """
     def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        setattr(func, _CAPABILITY_ATTR, capability)
+        if not eager:
+            return func
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Extract context from args
-            # For slash commands, first arg is Interaction
-            # For prefix commands, first arg is commands.Context
-            interaction_or_ctx = args[0] if args else None
-
-            # Get WispContext - this would be provided by the pipeline in Phase 2
-            # For now, we'll need to create it or get it from somewhere
-            # This is a simplified version - full implementation would use pipeline
-
-            if isinstance(interaction_or_ctx, discord.Interaction):
-                # Slash command
-                # In full implementation, WispContext would be available via pipeline
-                # For now, we'll skip the check and let it be handled by pipeline
-                return await func(*args, **kwargs)
-            elif isinstance(interaction_or_ctx, commands.Context):
-                # Prefix command
-                # Similar - would use pipeline in full implementation
-                return await func(*args, **kwargs)
-            else:
-                # Unknown - execute anyway
-                return await func(*args, **kwargs)
+            await _enforce_capability(capability, args, kwargs)
+            return await func(*args, **kwargs)
 
         return wrapper
     return decorator
+
+
+async def _enforce_capability(
+    capability: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> None:
+    """Check a capability against the context of a command invocation.
+
+    Raises:
+        PermissionError: If the policy denies the capability
+    """
+    # Imported here so tagging commands doesn't pull in discord
+    import discord
+    from discord.ext import commands
+
+    from wisp_framework.context import WispContext
+    from wisp_framework.core.pipeline import PolicyMiddleware
+    from wisp_framework.utils.context_helpers import (
+        get_wisp_context_from_command_context,
+        get_wisp_context_from_interaction,
+    )
+
+    # Cog commands get self first, so look past it for the invocation
+    wisp_ctx = None
+    for arg in (*args, *kwargs.values()):
+        if isinstance(arg, WispContext):
+            wisp_ctx = arg
+        elif isinstance(arg, discord.Interaction):
+            wisp_ctx = get_wisp_context_from_interaction(arg.client, arg, "slash")
+        elif isinstance(arg, commands.Context):
+            wisp_ctx = get_wisp_context_from_command_context(arg.bot, arg)
+        else:
+            continue
+        break
+
+    if wisp_ctx is None:
+        raise TypeError(f"Cannot check capability '{capability}': no invocation context")
+    await PolicyMiddleware(capability).before(wisp_ctx)
+
+
+def get_required_capability(func: Any) -> str | None:
+    """Get the capability a command was decorated with.
+
+    Args:
+        func: Command callback
+
+    Returns:
+        Capability string, or None if the command doesn't require one
+    """
+    return getattr(func, _CAPABILITY_ATTR, None)
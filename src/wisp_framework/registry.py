@@ -3,10 +3,13 @@
 import importlib
 import logging
 import pkgutil
+import time
 from typing import Any
 
 from wisp_framework.feature_flags import FeatureFlags
 from wisp_framework.module import Module
+from wisp_framework.observability.metrics import normalize_metric_name
+from wisp_framework.observability.tracing import start_span
 
 logger = logging.getLogger(__name__)
 
@@ -21,12 +24,15 @@ class ModuleRegistry:
         # Track which modules have been set up per guild_id
         # Key: (module_name, guild_id) where guild_id can be None for global
         self._setup_complete: set[tuple[str, int | None]] = set()
+        # Module names in registration order, rebuilt lazily after register()
+        self._module_names: tuple[str, ...] | None = None
 
     def register(self, module: Module) -> None:
         """Register a module."""
         if module.name in self._modules:
             raise ValueError(f"Module '{module.name}' is already registered")
         self._modules[module.name] = module
+        self._module_names = None
         logger.info(f"Registered module: {module.name}")
 
     def discover_modules(self, package_path: str) -> None:
@@ -58,9 +64,17 @@ class ModuleRegistry:
         except Exception as e:
             logger.error(f"Failed to discover modules from {package_path}: {e}")
 
-    def list_modules(self) -> list[str]:
+    def list_modules(self) -> tuple[str, ...]:
         """List all registered module names."""
-        return list(self._modules.keys())
+        names = self._module_names
+        if names is None:
+            names = self._module_names = tuple(self._modules)
+        return names
+
+    @property
+    def module_count(self) -> int:
+        """Number of registered modules."""
+        return len(self._modules)
 
     def get_module(self, name: str) -> Module | None:
         """Get a module by name."""
@@ -144,7 +158,14 @@ class ModuleRegistry:
 
             try:
                 logger.info(f"Loading module: {module_name} (guild: {guild_id})")
-                await module.setup(bot, ctx)
+                started = time.perf_counter()
+                with start_span(ctx.config, f"startup.module.{module_name}"):
+                    await module.setup(bot, ctx)
+                duration = time.perf_counter() - started
+                logger.debug(f"Module '{module_name}' set up in {duration * 1000:.1f}ms")
+                metrics = ctx.services.get("metrics")
+                if metrics:
+                    metrics.timing(normalize_metric_name("modules", module_name, "setup"), duration)
                 # Mark module as set up for this guild
                 self._setup_complete.add(setup_key)
             except Exception as e:
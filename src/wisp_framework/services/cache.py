@@ -1,6 +1,8 @@
 """Cache service with in-memory and optional Redis support."""
 
+import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from wisp_framework.services.base import BaseService
@@ -17,6 +19,7 @@ class CacheService(BaseService):
         self._memory_cache: dict[str, tuple[Any, float | None]] = {}
         self._redis_client: Any | None = None
         self._use_redis = False
+        self._subscriber_tasks: list[asyncio.Task] = []
 
     async def startup(self) -> None:
         """Start up the cache service."""
@@ -46,6 +49,9 @@ class CacheService(BaseService):
 
     async def shutdown(self) -> None:
         """Shut down the cache service."""
+        for task in self._subscriber_tasks:
+            task.cancel()
+        self._subscriber_tasks.clear()
         if self._redis_client:
             await self._redis_client.aclose()
             self._redis_client = None
@@ -98,6 +104,53 @@ class CacheService(BaseService):
 
         self._memory_cache.clear()
 
+    async def publish(self, channel: str, message: str) -> None:
+        """Publish a message on a channel (no-op with the in-memory backend)."""
+        if self._use_redis and self._redis_client:
+            try:
+                await self._redis_client.publish(channel, message)
+            except Exception as e:
+                logger.warning(f"Redis publish failed: {e}")
+
+    async def subscribe(self, channel: str, handler: Callable[[str], None]) -> bool:
+        """Subscribe to a channel, calling handler for each message in the background.
+
+        Returns:
+            True if the subscription is active (False with the in-memory backend)
+        """
+        if not (self._use_redis and self._redis_client):
+            return False
+
+        try:
+            pubsub = self._redis_client.pubsub()
+            await pubsub.subscribe(channel)
+        except Exception as e:
+            logger.warning(f"Redis subscribe to '{channel}' failed: {e}")
+            return False
+
+        self._subscriber_tasks.append(asyncio.create_task(self._listen(pubsub, handler)))
+        return True
+
+    async def _listen(self, pubsub: Any, handler: Callable[[str], None]) -> None:
+        """Dispatch pub/sub messages to a handler until cancelled."""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    handler(message["data"])
+                except Exception as e:
+                    logger.warning(f"Pub/sub handler failed: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis pub/sub listener stopped: {e}")
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
     def _memory_get(self, key: str) -> Any | None:
         """Get from memory cache."""
         if key not in self._memory_cache:
@@ -31,18 +31,23 @@ class DatabaseService(BaseService):
             async_sessionmaker,
             create_async_engine,
         )
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
 
         try:
 
-            # Create async engine with connection pooling
+            # Create async engine with connection pooling. The pool class is pinned to
+            # the asyncio-aware queue pool so concurrent sessions never serialize on a
+            # single connection; NullPool/StaticPool are only suitable for tests.
             self._engine = create_async_engine(
                 database_url,
+                poolclass=AsyncAdaptedQueuePool,
                 pool_size=self.config.db_pool_size,
                 max_overflow=self.config.db_max_overflow,
                 pool_timeout=self.config.db_pool_timeout,
                 pool_recycle=self.config.db_pool_recycle,
                 pool_pre_ping=True,
-                echo=False,
+                query_cache_size=self.config.db_query_cache_size,
+                echo=self.config.db_echo_sql,
             )
 
             # Create session factory
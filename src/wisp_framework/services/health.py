@@ -27,13 +27,16 @@ class HealthService(BaseService):
         logger.info("Health service shut down")
 
     def register_service(self, name: str, status: dict[str, Any]) -> None:
-        """Register a service status."""
-        self._service_statuses[name] = status
+        """Register a service status.
+
+        The status always carries a boolean ``healthy`` key (False if missing).
+        """
+        self._service_statuses[name] = {**status, "healthy": bool(status.get("healthy", False))}
 
     def get_health(self) -> dict[str, Any]:
         """Get overall health status."""
         all_healthy = all(
-            status.get("healthy", False) for status in self._service_statuses.values()
+            status["healthy"] for status in self._service_statuses.values()
         )
         return {
             "healthy": all_healthy,
@@ -51,6 +51,10 @@ class MetricsService(BaseService):
         """Set a gauge value."""
         self._gauges[name] = value
 
+    def get_counters(self) -> dict[str, int]:
+        """Get a copy of all counters, without computing timing stats."""
+        return dict(self._counters)
+
     def get_metrics(self) -> dict[str, Any]:
         """Get all metrics."""
         timing_stats = {}
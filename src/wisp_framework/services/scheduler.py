@@ -1,6 +1,8 @@
 """Async scheduler service for periodic tasks."""
 
 import asyncio
+import heapq
+import itertools
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -10,13 +12,35 @@ from wisp_framework.services.base import BaseService
 logger = logging.getLogger(__name__)
 
 
+class _ScheduledJob:
+    """A registered periodic job."""
+
+    __slots__ = ("coro", "interval", "name")
+
+    def __init__(self, coro: Callable[[], Awaitable[None]], interval: float, name: str) -> None:
+        self.coro = coro
+        self.interval = interval
+        self.name = name
+
+
 class SchedulerService(BaseService):
-    """Service for scheduling periodic async tasks."""
+    """Service for scheduling periodic async tasks.
+
+    A single dispatcher task sleeps until the earliest due job instead of
+    keeping one sleeping task per job. Each run executes in its own short-lived
+    task so a slow job doesn't delay the others; the next run of a job is
+    scheduled ``interval`` seconds after its previous run finishes.
+    """
 
     def __init__(self, config: Any) -> None:
         """Initialize the scheduler service."""
         super().__init__(config)
-        self._tasks: list[asyncio.Task] = []
+        # Min-heap of (due time, sequence, job); the sequence breaks ties
+        self._queue: list[tuple[float, int, _ScheduledJob]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._dispatcher: asyncio.Task | None = None
+        self._runs: set[asyncio.Task] = set()
         self._running = False
 
     async def startup(self) -> None:
@@ -28,14 +52,19 @@ class SchedulerService(BaseService):
     async def shutdown(self) -> None:
         """Shut down the scheduler service."""
         self._running = False
-        # Cancel all tasks
-        for task in self._tasks:
+        # Cancel the dispatcher and any runs in progress
+        tasks = list(self._runs)
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+        for task in tasks:
             if not task.done():
                 task.cancel()
         # Wait for tasks to complete cancellation
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
-        self._tasks.clear()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._runs.clear()
+        self._queue.clear()
         logger.info("Scheduler service shut down")
 
     def register(
@@ -46,6 +75,8 @@ class SchedulerService(BaseService):
     ) -> None:
         """Register a periodic task.
 
+        The first run happens immediately.
+
         Args:
             coro: Coroutine function to run periodically
             interval: Interval in seconds between runs
@@ -55,17 +86,43 @@ class SchedulerService(BaseService):
             raise RuntimeError("Scheduler is not running")
 
         task_name = name or coro.__name__
+        job = _ScheduledJob(coro, interval, task_name)
+        self._schedule(job, asyncio.get_running_loop().time())
 
-        async def run_periodic() -> None:
-            while self._running:
-                try:
-                    await coro()
-                except Exception as e:
-                    logger.error(
-                        f"Error in scheduled task '{task_name}': {e}", exc_info=True
-                    )
-                await asyncio.sleep(interval)
-
-        task = asyncio.create_task(run_periodic())
-        self._tasks.append(task)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
         logger.info(f"Registered scheduled task '{task_name}' with interval {interval}s")
+
+    def _schedule(self, job: _ScheduledJob, due: float) -> None:
+        """Queue the next run of a job and wake the dispatcher."""
+        heapq.heappush(self._queue, (due, next(self._seq), job))
+        self._wakeup.set()
+
+    async def _dispatch(self) -> None:
+        """Start jobs as they come due."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while self._running:
+            self._wakeup.clear()
+            delay = queue[0][0] - loop.time() if queue else None
+            if delay is None or delay > 0:
+                # Sleep until the next job is due or a new one is queued
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except TimeoutError:
+                    pass
+                continue
+
+            _, _, job = heapq.heappop(queue)
+            task = asyncio.create_task(self._run(job))
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+
+    async def _run(self, job: _ScheduledJob) -> None:
+        """Run a job once and schedule its next run."""
+        try:
+            await job.coro()
+        except Exception as e:
+            logger.error(f"Error in scheduled task '{job.name}': {e}", exc_info=True)
+        if self._running:
+            self._schedule(job, asyncio.get_running_loop().time() + job.interval)
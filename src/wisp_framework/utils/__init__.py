@@ -17,7 +17,12 @@ from wisp_framework.utils.embeds import (
     create_success_embed,
     create_warning_embed,
 )
-from wisp_framework.utils.pagination import Paginator, paginate_embeds
+from wisp_framework.utils.pagination import (
+    LazyPages,
+    Paginator,
+    paginate_embeds,
+    paginate_embeds_lazy,
+)
 from wisp_framework.utils.permissions import is_admin, is_owner
 from wisp_framework.utils.responses import (
     ResponseHelper,
@@ -53,8 +58,10 @@ __all__ = [
     "create_info_embed",
     "create_warning_embed",
     # Pagination
+    "LazyPages",
     "Paginator",
     "paginate_embeds",
+    "paginate_embeds_lazy",
     # Permissions
     "is_owner",
     "is_admin",
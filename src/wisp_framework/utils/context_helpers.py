@@ -7,6 +7,9 @@ from discord.ext import commands
 
 from wisp_framework.context import WispContext
 
+# Key under which the interaction's WispContext is memoized in Interaction.extras
+_WISP_CTX_KEY = "wisp_ctx"
+
 
 def get_wisp_context_from_interaction(
     bot: Any,
@@ -16,6 +19,8 @@ def get_wisp_context_from_interaction(
     """Get WispContext from an interaction.
 
     Helper function for modules to create WispContext in command handlers.
+    The context is memoized on the interaction, so repeated calls while
+    handling the same interaction share one request_id and bound logger.
 
     Args:
         bot: Bot instance (must have config, services, module_registry)
@@ -25,13 +30,22 @@ def get_wisp_context_from_interaction(
     Returns:
         WispContext instance
     """
-    return WispContext.from_interaction(
+    extras = getattr(interaction, "extras", None)
+    if extras is not None:
+        wisp_ctx = extras.get(_WISP_CTX_KEY)
+        if wisp_ctx is not None and wisp_ctx.invocation_type == invocation_type:
+            return wisp_ctx
+
+    wisp_ctx = WispContext.from_interaction(
         config=bot.config,
         services=bot.services,
         interaction=interaction,
         invocation_type=invocation_type,
         feature_flags=bot.module_registry._feature_flags,
     )
+    if extras is not None:
+        extras[_WISP_CTX_KEY] = wisp_ctx
+    return wisp_ctx
 
 
 def get_wisp_context_from_command_context(
@@ -41,6 +55,7 @@ def get_wisp_context_from_command_context(
     """Get WispContext from a commands.Context.
 
     Helper function for modules to create WispContext in prefix command handlers.
+    The context is memoized on the commands.Context.
 
     Args:
         bot: Bot instance (must have config, services, module_registry)
@@ -49,13 +64,16 @@ def get_wisp_context_from_command_context(
     Returns:
         WispContext instance
     """
-    return WispContext.from_interaction(
-        config=bot.config,
-        services=bot.services,
-        interaction=ctx,
-        invocation_type="prefix",
-        feature_flags=bot.module_registry._feature_flags,
-    )
+    wisp_ctx = getattr(ctx, "_wisp_ctx", None)
+    if wisp_ctx is None:
+        wisp_ctx = ctx._wisp_ctx = WispContext.from_interaction(
+            config=bot.config,
+            services=bot.services,
+            interaction=ctx,
+            invocation_type="prefix",
+            feature_flags=bot.module_registry._feature_flags,
+        )
+    return wisp_ctx
 
 
 def get_wisp_context_from_event(
@@ -1,6 +1,7 @@
 """Decorators for commands and modules."""
 
 import functools
+import logging
 from collections.abc import Callable
 from typing import Any
 
@@ -96,8 +97,6 @@ def handle_errors(func: Callable) -> Callable:
         try:
             return await func(interaction, *args, **kwargs)
         except Exception as e:
-            import logging
-
             logger = logging.getLogger(func.__module__)
             logger.error(f"Error in {func.__name__}: {e}", exc_info=True)
 
@@ -225,6 +225,7 @@ class EmbedBuilder:
         footer: str | None = None,
         config: AppConfig | None = None,
         use_branding: bool = True,
+        total_items: int | None = None,
     ) -> discord.Embed:
         """Create a paginated list embed.
 
@@ -235,14 +236,19 @@ class EmbedBuilder:
             items_per_page: Number of items per page
             page: Current page (1-indexed)
             footer: Footer text (page info will be appended)
+            total_items: Size of the full list when ``items`` holds only the
+                current page (lets callers render just the page being shown)
 
         Returns:
             Discord embed
         """
-        total_pages = (len(items) + items_per_page - 1) // items_per_page
         start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_items = items[start_idx:end_idx]
+        if total_items is None:
+            total_items = len(items)
+            page_items = items[start_idx : start_idx + items_per_page]
+        else:
+            page_items = items
+        total_pages = (total_items + items_per_page - 1) // items_per_page
 
         embed = discord.Embed(
             title=title,
@@ -1,17 +1,46 @@
 """Pagination utilities for Discord embeds and messages."""
 
+from collections.abc import Callable, Sequence
 
 import discord
 from discord import Interaction
 
 
+class LazyPages(Sequence[discord.Embed]):
+    """Sequence of embeds built on first access and kept for later views."""
+
+    def __init__(self, page_count: int, build_page: Callable[[int], discord.Embed]) -> None:
+        """Initialize lazy pages.
+
+        Args:
+            page_count: Total number of pages
+            build_page: Function that builds the embed for a 0-indexed page
+        """
+        self._page_count = page_count
+        self._build_page = build_page
+        self._built: dict[int, discord.Embed] = {}
+
+    def __len__(self) -> int:
+        return self._page_count
+
+    def __getitem__(self, index: int) -> discord.Embed:  # type: ignore[override]
+        if index < 0:
+            index += self._page_count
+        if not 0 <= index < self._page_count:
+            raise IndexError("page index out of range")
+        embed = self._built.get(index)
+        if embed is None:
+            embed = self._built[index] = self._build_page(index)
+        return embed
+
+
 class Paginator:
     """Paginator for Discord embeds with button navigation."""
 
     def __init__(
         self,
         interaction: Interaction,
-        pages: list[discord.Embed],
+        pages: Sequence[discord.Embed],
         timeout: float = 300.0,
         ephemeral: bool = False,
     ) -> None:
@@ -19,7 +48,7 @@ class Paginator:
 
         Args:
             interaction: Discord interaction
-            pages: List of embeds (one per page)
+            pages: Embeds (one per page), e.g. a list or LazyPages
             timeout: Button timeout in seconds
             ephemeral: Whether response is ephemeral
         """
@@ -32,16 +61,18 @@ class Paginator:
 
     async def start(self) -> None:
         """Start the paginator."""
+        # Deferred interactions must be answered with a followup
+        send = (
+            self.interaction.followup.send
+            if self.interaction.response.is_done()
+            else self.interaction.response.send_message
+        )
         if not self.pages:
-            await self.interaction.response.send_message(
-                "No pages to display.", ephemeral=True
-            )
+            await send("No pages to display.", ephemeral=True)
             return
 
         self.view = PaginatorView(self, self.timeout)
-        await self.interaction.response.send_message(
-            embed=self.pages[0], view=self.view, ephemeral=self.ephemeral
-        )
+        await send(embed=self.pages[0], view=self.view, ephemeral=self.ephemeral)
 
     async def update_page(self, page: int) -> None:
         """Update to a specific page."""
@@ -174,3 +205,23 @@ async def paginate_embeds(
     """
     paginator = Paginator(interaction, embeds, timeout, ephemeral)
     await paginator.start()
+
+
+async def paginate_embeds_lazy(
+    interaction: Interaction,
+    page_count: int,
+    build_page: Callable[[int], discord.Embed],
+    timeout: float = 300.0,
+    ephemeral: bool = False,
+) -> None:
+    """Paginate embeds that are only built when their page is shown.
+
+    Args:
+        interaction: Discord interaction
+        page_count: Total number of pages
+        build_page: Function that builds the embed for a 0-indexed page
+        timeout: Button timeout in seconds
+        ephemeral: Whether response is ephemeral
+    """
+    paginator = Paginator(interaction, LazyPages(page_count, build_page), timeout, ephemeral)
+    await paginator.start()
@@ -17,9 +17,7 @@ def is_owner(interaction: Interaction, config: AppConfig) -> bool:
     Returns:
         True if user is owner, False otherwise
     """
-    if not config.owner_id:
-        return False
-    return interaction.user.id == config.owner_id
+    return interaction.user.id in config.owner_ids
 
 
 def is_admin(interaction: Interaction) -> bool:
@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def discord_token(monkeypatch):
+    """Provide the token AppConfig requires, unless the environment has one."""
+    if not os.getenv("DISCORD_TOKEN"):
+        monkeypatch.setenv("DISCORD_TOKEN", "test-token")
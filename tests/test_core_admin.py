@@ -0,0 +1,56 @@
+"""Tests for the core admin module helpers."""
+
+import asyncio
+
+import pytest
+
+from wisp_framework.modules import core_admin
+
+
+class SlowFlags:
+    """Feature flags whose lookup waits until released."""
+
+    def __init__(self, states: dict[str, bool]) -> None:
+        self.states = states
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def get_all_enabled(self, guild_id, modules):
+        self.calls += 1
+        states = dict(self.states)
+        await self.release.wait()
+        return states
+
+
+@pytest.mark.asyncio
+async def test_module_states_refresh_racing_a_toggle_is_not_cached():
+    """Test states read before an enable/disable are not cached after it."""
+    flags = SlowFlags({"ping": True})
+    modules = ("ping",)
+
+    refresh = asyncio.create_task(core_admin._get_module_states(flags, 1, modules))
+    await asyncio.sleep(0)
+    flags.states = {"ping": False}
+    core_admin._invalidate_module_states(1)
+    flags.release.set()
+
+    assert await refresh == {"ping": True}
+    assert 1 not in core_admin._flag_cache
+    assert 1 not in core_admin._flag_locks
+    assert await core_admin._get_module_states(flags, 1, modules) == {"ping": False}
+    assert flags.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_module_states_cache_is_bounded(monkeypatch):
+    """Test the least recently used guilds are evicted from the states cache."""
+    monkeypatch.setattr(core_admin, "_FLAG_CACHE_MAX", 2)
+    monkeypatch.setattr(core_admin, "_flag_cache", type(core_admin._flag_cache)())
+    flags = SlowFlags({})
+    flags.release.set()
+
+    for guild_id in (1, 2, 3):
+        await core_admin._get_module_states(flags, guild_id, ())
+
+    assert list(core_admin._flag_cache) == [2, 3]
+    assert core_admin._flag_locks == {}
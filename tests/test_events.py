@@ -0,0 +1,56 @@
+"""Tests for the event router."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from wisp_framework.config import AppConfig
+from wisp_framework.context import WispContext, current_event_session
+from wisp_framework.core.pipeline import Pipeline
+from wisp_framework.events.router import EventRouter
+from wisp_framework.services.base import ServiceContainer
+
+
+class FakeSession:
+    """Async session context that counts how often it is opened."""
+
+    opened = 0
+
+    async def __aenter__(self):
+        FakeSession.opened += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def in_transaction(self) -> bool:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_handlers_share_one_event_session():
+    """Test every handler of a routed event sees the same database session."""
+    config = AppConfig()
+    services = ServiceContainer(config)
+    services.register("db", MagicMock(session_factory=FakeSession))
+    ctx = WispContext(config=config, services=services, invocation_type="event", guild_id=1)
+    FakeSession.opened = 0
+    seen = []
+
+    async def first(handler_ctx, event):
+        seen.append(current_event_session())
+
+    async def second(handler_ctx, event):
+        seen.append(handler_ctx.db_session)
+
+    router = EventRouter(pipeline=Pipeline())
+    router.register("on_member_join", first)
+    router.register("on_member_join", second)
+    await router.route("on_member_join", SimpleNamespace(), ctx)
+
+    assert FakeSession.opened == 1
+    assert len(seen) == 2
+    assert isinstance(seen[0], FakeSession)
+    assert seen[0] is seen[1]
+    assert current_event_session() is None
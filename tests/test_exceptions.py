@@ -0,0 +1,43 @@
+"""Tests for exception mapping."""
+
+from wisp_framework.exceptions import (
+    ExternalServiceError,
+    NotFoundError,
+    PermissionError,
+    RateLimitedError,
+    UserError,
+    map_error_to_response,
+)
+
+
+def test_safe_message_is_used():
+    """Test a WispError's own safe message takes precedence."""
+    error = PermissionError(safe_message="Admins only.", internal_message="not admin")
+    assert map_error_to_response(error) == ("Admins only.", True)
+
+
+def test_default_responses_by_type():
+    """Test WispErrors without a safe message get their type's response."""
+    assert "permission" in map_error_to_response(PermissionError(""))[0]
+    assert "not found" in map_error_to_response(NotFoundError(""))[0]
+    assert "rate limited" in map_error_to_response(RateLimitedError(""))[0]
+    assert "external service" in map_error_to_response(ExternalServiceError(""))[0]
+
+
+def test_subclass_uses_parent_response():
+    """Test responses are resolved through the exception's base classes."""
+
+    class MissingGuildError(NotFoundError):
+        pass
+
+    assert map_error_to_response(MissingGuildError("")) == map_error_to_response(
+        NotFoundError("")
+    )
+
+
+def test_unexpected_errors_get_generic_response():
+    """Test errors without a mapping don't leak their message."""
+    message, ephemeral = map_error_to_response(ValueError("secret detail"))
+    assert "secret detail" not in message
+    assert ephemeral is True
+    assert map_error_to_response(UserError("")) == (message, ephemeral)
@@ -0,0 +1,109 @@
+"""Tests for feature flags."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from wisp_framework.db.models import ModuleState
+from wisp_framework.feature_flags import INVALIDATION_CHANNEL, FeatureFlags
+
+
+class FakeDatabase:
+    """Module states shared by several processes, counting reads."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[int, str], ModuleState] = {}
+        self.reads = 0
+
+    def session_factory(self) -> "FakeSession":
+        return FakeSession(self)
+
+
+class FakeSession:
+    """Session answering module state lookups from a FakeDatabase."""
+
+    def __init__(self, db: FakeDatabase) -> None:
+        self._db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt, params):
+        self._db.reads += 1
+        guild_id = params["guild_id"]
+        names = params["module_names"] if "module_names" in params else [params["module_name"]]
+        rows = [self._db.rows[guild_id, n] for n in names if (guild_id, n) in self._db.rows]
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = rows[0] if rows else None
+        result.scalars.return_value = rows
+        return result
+
+    def add(self, row: ModuleState) -> None:
+        self._db.rows[row.guild_id, row.module_name] = row
+
+    async def commit(self):
+        pass
+
+
+class FakeBus:
+    """Cache service whose pub/sub delivers messages to every subscriber at once."""
+
+    initialized = True
+
+    def __init__(self) -> None:
+        self.handlers: dict[str, list] = {}
+
+    async def subscribe(self, channel, handler) -> bool:
+        self.handlers.setdefault(channel, []).append(handler)
+        return True
+
+    async def publish(self, channel, message) -> None:
+        for handler in self.handlers.get(channel, []):
+            handler(message)
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_processes():
+    """Test a flag change in one process is seen by another's cached read."""
+    db, bus = FakeDatabase(), FakeBus()
+    first = FeatureFlags(db, bus)
+    second = FeatureFlags(db, bus)
+
+    assert await first.is_enabled(1, "ping") is True
+    assert await second.is_enabled(1, "ping") is True
+    assert await second.is_enabled(1, "ping") is True
+    assert db.reads == 2
+    assert len(bus.handlers[INVALIDATION_CHANNEL]) == 2
+
+    await first.set_enabled(1, "ping", False)
+
+    assert await second.is_enabled(1, "ping") is False
+    assert db.reads == 4
+    # The writer ignores its own message and keeps serving the value it wrote
+    assert await first.is_enabled(1, "ping") is False
+    assert db.reads == 4
+
+
+@pytest.mark.asyncio
+async def test_flags_are_read_each_time_without_invalidations():
+    """Test flags aren't served from memory when no invalidations can arrive."""
+    db = FakeDatabase()
+    flags = FeatureFlags(db)
+
+    await flags.is_enabled(1, "ping")
+    await flags.is_enabled(1, "ping")
+
+    assert db.reads == 2
+
+
+def test_malformed_invalidation_is_ignored():
+    """Test a message without a numeric guild ID leaves the cache alone."""
+    flags = FeatureFlags(None)
+    flags._memory_cache[1, "ping"] = False
+
+    flags._handle_invalidation("other:not-a-guild:ping")
+
+    assert flags._memory_cache == {(1, "ping"): False}
@@ -0,0 +1,90 @@
+"""Tests for the guild data service."""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from wisp_framework.db import guild_data
+from wisp_framework.db.guild_data import GuildDataService
+
+GUILD_ID_PARAM = re.compile(r"guild_id(_m\d+)?")
+
+
+class CounterSession:
+    """Session answering counter upserts with the value each guild ends up with."""
+
+    def __init__(self, counters: dict[int, int], delta: int = 1) -> None:
+        self.counters = counters
+        self.delta = delta
+        self.statements: list = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        rows = []
+        for name, value in stmt.compile().params.items():
+            # One guild_id per VALUES row: guild_id, guild_id_m1, guild_id_m2, ...
+            if GUILD_ID_PARAM.fullmatch(name):
+                self.counters[value] = self.counters.get(value, 0) + self.delta
+                rows.append((value, self.counters[value]))
+        result = MagicMock()
+        result.tuples.return_value = rows
+        return result
+
+    async def commit(self):
+        self.commits += 1
+
+
+def make_service(session) -> GuildDataService:
+    """Create a guild data service whose database hands out the given session."""
+    return GuildDataService(MagicMock(session_factory=lambda: session))
+
+
+@pytest.mark.asyncio
+async def test_bulk_increment_runs_in_one_transaction(monkeypatch):
+    """Test chunked upserts share one session and commit once."""
+    monkeypatch.setattr(guild_data, "_BULK_INSERT_ROWS", 2)
+    session = CounterSession({2: 5})
+    service = make_service(session)
+
+    counts = await service.bulk_increment([1, 2, 3], "rollups", module_name="insights")
+
+    assert counts == {1: 1, 2: 6, 3: 1}
+    assert len(session.statements) == 2
+    assert session.commits == 1
+    assert await service.increment(2, "rollups", module_name="insights") == 7
+
+
+@pytest.mark.asyncio
+async def test_bulk_increment_falls_back_to_memory():
+    """Test counters are kept in memory when the database fails."""
+    session = MagicMock()
+    session.__aenter__.side_effect = RuntimeError("database down")
+    service = make_service(session)
+
+    assert await service.bulk_increment([1, 2], "rollups", delta=2) == {1: 2, 2: 2}
+    assert await service.bulk_increment([1], "rollups", delta=2) == {1: 4}
+    assert await GuildDataService(None).increment(1, "rollups") == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_increment_is_a_single_upsert():
+    """Test each guild is incremented once by an atomic INSERT ... ON CONFLICT."""
+    session = CounterSession({}, delta=3)
+    service = make_service(session)
+
+    assert await service.bulk_increment([1, 1, 2], "rollups", delta=3) == {1: 3, 2: 3}
+
+    (stmt,) = session.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (guild_id, key, coalesce(module_name, '')) DO UPDATE" in sql
+    assert "RETURNING guild_data.guild_id, guild_data.value" in sql
+    assert "SELECT" not in sql
@@ -0,0 +1,268 @@
+"""Tests for the job queue and runner."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from wisp_framework.config import AppConfig
+from wisp_framework.db.models import Job
+from wisp_framework.jobs import runner as runner_module
+from wisp_framework.jobs.queue import JobQueue
+from wisp_framework.jobs.runner import JobRunner
+
+
+class FakeSession:
+    """Session returning queued scalar results and recording statements."""
+
+    def __init__(self, results: list, statements: list) -> None:
+        self._results = results
+        self._statements = statements
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self._statements.append(stmt)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = self._results.pop(0)
+        return result
+
+    async def commit(self):
+        pass
+
+
+def make_queue(results: list) -> tuple[JobQueue, list]:
+    """Create a job queue whose sessions return the given results in order."""
+    statements: list = []
+    queue = JobQueue(AppConfig())
+    queue._session_factory = lambda: FakeSession(results, statements)
+    return queue, statements
+
+
+@pytest.mark.asyncio
+async def test_enqueue_with_new_idempotency_key():
+    """Test a new idempotency key inserts the job in one statement."""
+    job = MagicMock(id=1)
+    queue, statements = make_queue([job])
+
+    assert await queue.enqueue("sync", {}, idempotency_key="key") is job
+    assert queue.job_available.is_set()
+
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (idempotency_key) WHERE status IN" in sql
+    assert "DO NOTHING" in sql
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_active_job_for_idempotency_key():
+    """Test a key held by an active job returns that job."""
+    existing = MagicMock(id=1, status="pending")
+    queue, statements = make_queue([None, existing])
+
+    assert await queue.enqueue("sync", {}, idempotency_key="key") is existing
+    assert len(statements) == 2
+    assert not queue.job_available.is_set()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_retries_when_conflicting_job_finished():
+    """Test a key whose active job finished before the lookup is inserted afresh."""
+    job = MagicMock(id=2)
+    queue, statements = make_queue([None, None, job])
+
+    assert await queue.enqueue("sync", {}, idempotency_key="key") is job
+    assert len(statements) == 3
+    assert queue.job_available.is_set()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_gives_up_after_repeated_conflicts():
+    """Test an idempotent enqueue that keeps conflicting raises instead of looping."""
+    queue, _ = make_queue([None] * 6)
+
+    with pytest.raises(RuntimeError):
+        await queue.enqueue("sync", {}, idempotency_key="key")
+
+
+class JobRowSession:
+    """Session applying job claim UPDATEs against a single in-memory row."""
+
+    def __init__(self, row: dict) -> None:
+        self._row = row
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt, params=None):
+        bound = stmt.compile().params
+        matches = (
+            self._row["status"] == bound["status_1"]
+            and self._row["attempts"] == bound["attempts_1"]
+            and self._row["next_run_at"] <= bound["next_run_at_1"]
+        )
+        if matches:
+            self._row.update(status=bound["status"], locked_by=bound["locked_by"])
+        return MagicMock(rowcount=int(matches))
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_runner_skips_requeued_job_in_prefetch_buffer():
+    """Test a buffered job another worker failed and requeued is not claimed early."""
+    now = datetime.now(UTC)
+    # Another worker ran the job, failed it and scheduled a retry
+    row = {"status": "pending", "attempts": 1, "next_run_at": now + timedelta(seconds=4)}
+    stale = Job(
+        id=1,
+        job_type="sync",
+        status="pending",
+        attempts=0,
+        max_attempts=3,
+        next_run_at=now - timedelta(seconds=1),
+        payload={},
+    )
+
+    queue = JobQueue(AppConfig())
+    queue._session_factory = lambda: JobRowSession(row)
+    handler = AsyncMock()
+    runner = JobRunner(AppConfig(), queue, services=MagicMock(), job_handlers={"sync": handler})
+    runner._prefetch_buffer.append(stale)
+
+    async def stop_after_poll(**kwargs):
+        runner._running = False
+        return []
+
+    claims = []
+    mark_running = queue.mark_running
+
+    async def record_claim(job, worker_id):
+        claims.append(await mark_running(job, worker_id))
+        return claims[-1]
+
+    queue.get_pending_jobs = stop_after_poll
+    queue.mark_running = record_claim
+    runner._running = True
+    await runner._run_loop()
+
+    assert claims == [False]
+    handler.assert_not_awaited()
+    assert runner.inflight == 0
+    assert row == {"status": "pending", "attempts": 1, "next_run_at": now + timedelta(seconds=4)}
+
+
+def make_runner(handlers: dict | None = None) -> tuple[JobRunner, MagicMock]:
+    """Create a runner over a mocked job queue."""
+    queue = MagicMock()
+    queue.job_available = asyncio.Event()
+    queue.mark_running = AsyncMock(return_value=True)
+    queue.mark_completed = AsyncMock()
+    queue.mark_failed = AsyncMock()
+    runner = JobRunner(AppConfig(), queue, services=MagicMock(), job_handlers=handlers)
+    return runner, queue
+
+
+@pytest.mark.asyncio
+async def test_runner_idle_backoff_grows_and_resets(monkeypatch):
+    """Test idle waits double up to the cap and reset when a job is enqueued."""
+    monkeypatch.setattr(runner_module, "_IDLE_BACKOFF_MIN", 0.01)
+    monkeypatch.setattr(runner_module, "_IDLE_BACKOFF_MAX", 0.03)
+    runner, queue = make_runner()
+    runner._idle_backoff = 0.01
+
+    await runner._wait_idle()
+    assert runner._idle_backoff == 0.02
+    await runner._wait_idle()
+    await runner._wait_idle()
+    assert runner._idle_backoff == 0.03
+
+    queue.job_available.set()
+    await runner._wait_idle()
+    assert runner._idle_backoff == 0.01
+
+
+@pytest.mark.asyncio
+async def test_runner_fast_contexts_are_bounded(monkeypatch):
+    """Test fast handlers reuse per-guild contexts without keeping every guild."""
+    monkeypatch.setattr(runner_module, "_FAST_CONTEXTS_MAX", 2)
+    seen = []
+
+    async def handler(ctx, payload):
+        seen.append(ctx)
+
+    runner, queue = make_runner()
+    runner.register_handler("ping", handler, fast=True)
+
+    for job_id, guild_id in enumerate((1, 2, 1, 3)):
+        job = Job(id=job_id, job_type="ping", payload={"guild_id": guild_id})
+        runner._set_inflight(runner.inflight + 1)
+        await runner._process_job(job)
+
+    assert seen[0] is seen[2]
+    assert list(runner._fast_contexts) == [1, 3]
+    assert queue.mark_completed.await_count == 4
+    assert runner.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_runner_fast_path_skips_per_job_context():
+    """Test fast handlers share a guild context while others get one per job."""
+    contexts = {"fast": [], "slow": []}
+
+    async def fast(ctx, payload):
+        contexts["fast"].append(ctx)
+
+    async def slow(ctx, payload):
+        contexts["slow"].append(ctx)
+
+    runner, queue = make_runner()
+    runner.register_handler("fast", fast, fast=True)
+    runner.register_handler("slow", slow)
+
+    for job_id, job_type in enumerate(("fast", "fast", "slow", "slow")):
+        job = Job(id=job_id, job_type=job_type, payload={"guild_id": 1})
+        runner._set_inflight(runner.inflight + 1)
+        await runner._process_job(job)
+
+    first, second = contexts["fast"]
+    assert first is second
+    assert first.guild_id == 1
+    assert [ctx.request_id for ctx in contexts["slow"]] == ["2", "3"]
+    assert queue.mark_completed.await_count == 4
+    queue.mark_failed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_runner_refills_prefetch_buffer_without_duplicates():
+    """Test a poll tops up the buffer, skipping jobs it already holds."""
+    runner, queue = make_runner()
+    queue.mark_running = AsyncMock(return_value=False)
+    buffered = Job(id=1, job_type="sync", payload={})
+    runner._prefetch_buffer.append(buffered)
+
+    limits = []
+
+    async def poll(limit, now):
+        runner._running = False
+        limits.append(limit)
+        return [Job(id=1, job_type="sync", payload={}), Job(id=2, job_type="sync", payload={})]
+
+    queue.get_pending_jobs = poll
+    runner._running = True
+    await runner._run_loop()
+
+    claimed = [call.args[0] for call in queue.mark_running.await_args_list]
+    assert limits == [runner._prefetch_size]
+    assert [job.id for job in claimed] == [1, 2]
+    assert claimed[0] is buffered
+    assert not runner._prefetch_buffer
@@ -0,0 +1,191 @@
+"""Tests for structured logging setup."""
+
+import copy
+import io
+import json
+import logging
+import sys
+import uuid
+
+from wisp_framework import logging as wisp_logging
+from wisp_framework.config import AppConfig
+from wisp_framework.logging import (
+    DEFAULT_DATE_FORMAT,
+    DEFAULT_TEXT_FORMAT,
+    BatchedStreamHandler,
+    CorrelationContext,
+    FastPatternFormatter,
+    JsonFormatter,
+    setup_logging,
+)
+
+
+def make_record(msg: str = "hello %s", args: tuple = ("world",), **attrs) -> logging.LogRecord:
+    """Create a log record with optional extra attributes."""
+    record = logging.LogRecord("wisp_framework.test", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(attrs)
+    return record
+
+
+def test_json_formatter():
+    """Test the JSON formatter emits one compact object per record."""
+    record = make_record(correlation_id="cid", request_id="rid")
+
+    line = JsonFormatter().format(record)
+    payload = json.loads(line)
+
+    assert "\n" not in line
+    assert payload["@l"] == "INFO"
+    assert payload["@m"] == "hello world"
+    assert payload["name"] == "wisp_framework.test"
+    assert payload["cid"] == "cid"
+    assert payload["rid"] == "rid"
+    assert "@t" in payload
+    assert "@x" not in payload
+
+
+def test_json_formatter_includes_exception():
+    """Test exception tracebacks are carried in the JSON payload."""
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record("failed", None)
+        record.exc_info = sys.exc_info()
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["@m"] == "failed"
+    assert "ValueError: boom" in payload["@x"]
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting the records it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def installed_handlers() -> list[logging.Handler]:
+    """Handlers setup_logging left on the root logger."""
+    return [h for h in logging.getLogger().handlers if getattr(h, "_wisp_installed", False)]
+
+
+def test_setup_logging_routes_through_listener():
+    """Test records reach the output handler via the background listener."""
+    handler = ListHandler()
+    setup_logging(AppConfig(), formatter=logging.Formatter("%(message)s"), handler=handler)
+    try:
+        logging.getLogger("wisp_framework.test").warning("queued %s", "message")
+        wisp_logging._listener.stop()
+
+        assert [r.getMessage() for r in handler.records] == ["queued message"]
+        assert handler.records[0].args is None
+    finally:
+        wisp_logging._stop_listener()
+
+
+def test_setup_logging_twice_keeps_one_handler():
+    """Test reconfiguring logging replaces the handler instead of adding another."""
+    try:
+        setup_logging(AppConfig(), handler=ListHandler())
+        setup_logging(AppConfig(), handler=ListHandler())
+
+        assert len(installed_handlers()) == 1
+    finally:
+        wisp_logging._stop_listener()
+
+    assert installed_handlers() == []
+
+
+def test_record_factory_stamps_ids():
+    """Test records carry the correlation ID of the context that created them."""
+    wisp_logging._install_record_factory()
+    logger = logging.getLogger("wisp_framework.test")
+
+    with CorrelationContext("abc") as context:
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 1, "inside", None, None)
+    outside = logger.makeRecord(logger.name, logging.INFO, __file__, 1, "outside", None, None)
+
+    assert context.correlation_id == "abc"
+    assert record.correlation_id == "abc"
+    assert record.request_id == "no-request-id"
+    assert outside.correlation_id == "no-correlation-id"
+
+
+def test_fast_pattern_formatter_matches_stdlib():
+    """Test the precompiled pattern renders exactly like logging.Formatter."""
+    record = make_record(correlation_id="cid", request_id="rid")
+    fmt = "%(asctime)s [%(levelname)8s] [%(name)-20s] 100%% %(message)s"
+
+    for datefmt in (DEFAULT_DATE_FORMAT, None):
+        expected = logging.Formatter(fmt, datefmt=datefmt).format(copy.copy(record))
+        assert FastPatternFormatter(fmt, datefmt=datefmt).format(record) == expected
+
+    default = FastPatternFormatter(DEFAULT_TEXT_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+    assert default.format(record).endswith("[cid] [rid] hello world")
+
+
+def test_formatters_default_missing_ids():
+    """Test records built without the record factory still format."""
+    record = logging.makeLogRecord({"msg": "hello", "levelno": logging.INFO, "levelname": "INFO"})
+
+    default = FastPatternFormatter(DEFAULT_TEXT_FORMAT, datefmt=DEFAULT_DATE_FORMAT)
+    assert default.format(record).endswith("[no-correlation-id] [no-request-id] hello")
+
+    payload = json.loads(JsonFormatter().format(logging.makeLogRecord({"msg": "hello"})))
+    assert payload["cid"] == "no-correlation-id"
+    assert payload["rid"] == "no-request-id"
+
+
+def test_fast_pattern_formatter_falls_back():
+    """Test patterns with non-string fields use the stdlib implementation."""
+    record = make_record()
+    fmt = "%(lineno)d %(message)s"
+
+    assert FastPatternFormatter(fmt).format(record) == "1 hello world"
+
+
+def test_batched_stream_handler():
+    """Test INFO records are buffered and a WARNING flushes them in order."""
+    stream = io.StringIO()
+    handler = BatchedStreamHandler(stream, flush_interval=60)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    try:
+        handler.handle(make_record("first", None))
+        assert stream.getvalue() == ""
+
+        warning = make_record("second", None)
+        warning.levelno, warning.levelname = logging.WARNING, "WARNING"
+        handler.handle(warning)
+        assert stream.getvalue() == "INFO first\nWARNING second\n"
+    finally:
+        handler.close()
+
+
+def test_batched_stream_handler_flushes_full_buffer():
+    """Test the buffer is written once it exceeds max_buffer characters."""
+    stream = io.StringIO()
+    handler = BatchedStreamHandler(stream, flush_interval=60, max_buffer=10)
+    try:
+        handler.handle(make_record("short", None))
+        assert stream.getvalue() == ""
+        handler.handle(make_record("long enough", None))
+        assert stream.getvalue() == "short\nlong enough\n"
+    finally:
+        handler.close()
+
+
+def test_correlation_ids_are_uuid4():
+    """Test generated correlation IDs are distinct, well-formed version-4 UUIDs."""
+    ids = {CorrelationContext().correlation_id for _ in range(100)}
+
+    assert len(ids) == 100
+    for value in ids:
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
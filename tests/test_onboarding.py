@@ -0,0 +1,98 @@
+"""Tests for the onboarding module's welcome channel cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from wisp_framework.modules import onboarding
+
+
+@pytest.fixture(autouse=True)
+def empty_welcome_cache():
+    """Start and end every test with an empty welcome channel cache."""
+    onboarding.invalidate_welcome_channel()
+    yield
+    onboarding.invalidate_welcome_channel()
+
+
+def test_welcome_channel_cache_hit_and_invalidate():
+    """Test cached channels, including 'no channel', are served until invalidated."""
+    assert onboarding._get_cached_welcome_channel(1) == (False, None)
+
+    onboarding._cache_welcome_channel(1, 100)
+    onboarding._cache_welcome_channel(2, None)
+    assert onboarding._get_cached_welcome_channel(1) == (True, 100)
+    assert onboarding._get_cached_welcome_channel(2) == (True, None)
+
+    onboarding.invalidate_welcome_channel(1)
+    assert onboarding._get_cached_welcome_channel(1) == (False, None)
+    assert onboarding._get_cached_welcome_channel(2) == (True, None)
+
+
+def test_welcome_channel_cache_expires(monkeypatch):
+    """Test entries older than the TTL are dropped on lookup."""
+    onboarding._cache_welcome_channel(1, 100)
+    monkeypatch.setattr(onboarding, "_WELCOME_CACHE_TTL", 0.0)
+
+    assert onboarding._get_cached_welcome_channel(1) == (False, None)
+    assert 1 not in onboarding._welcome_channel_cache
+
+
+def test_welcome_channel_cache_is_bounded(monkeypatch):
+    """Test the least recently used guild is evicted once the cache is full."""
+    monkeypatch.setattr(onboarding, "_WELCOME_CACHE_MAX", 2)
+    onboarding._cache_welcome_channel(1, 100)
+    onboarding._cache_welcome_channel(2, 200)
+    onboarding._get_cached_welcome_channel(1)
+    onboarding._cache_welcome_channel(3, 300)
+
+    assert list(onboarding._welcome_channel_cache) == [1, 3]
+
+
+class ChannelSession:
+    """Session answering the batched welcome channel query."""
+
+    def __init__(self, channels: dict[int, int]) -> None:
+        self.channels = channels
+        self.queries: list[list[int]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt, params):
+        self.queries.append(params["guild_ids"])
+        result = MagicMock()
+        result.all.return_value = [
+            (guild_id, self.channels[guild_id])
+            for guild_id in params["guild_ids"]
+            if guild_id in self.channels
+        ]
+        return result
+
+
+@pytest.mark.asyncio
+async def test_warm_welcome_channels_caches_every_guild():
+    """Test warming fetches all guilds in one query and caches misses as no channel."""
+    session = ChannelSession({1: 100})
+    db_service = MagicMock(session_factory=lambda: session)
+
+    await onboarding._warm_welcome_channels(db_service, [1, 2])
+
+    assert session.queries == [[1, 2]]
+    assert onboarding._get_cached_welcome_channel(1) == (True, 100)
+    assert onboarding._get_cached_welcome_channel(2) == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_warm_welcome_channels_leaves_cache_empty_on_failure():
+    """Test a failed warm-up query caches nothing, so joins still query."""
+    session = MagicMock()
+    session.__aenter__.side_effect = RuntimeError("database down")
+    db_service = MagicMock(session_factory=lambda: session)
+
+    await onboarding._warm_welcome_channels(db_service, [1])
+
+    assert onboarding._get_cached_welcome_channel(1) == (False, None)
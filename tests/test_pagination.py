@@ -0,0 +1,53 @@
+"""Tests for embed pagination."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from wisp_framework.utils.pagination import LazyPages, paginate_embeds_lazy
+
+
+def test_lazy_pages_build_on_first_access():
+    """Test pages are built when first read and reused afterwards."""
+    built = []
+
+    def build_page(index):
+        built.append(index)
+        return f"page {index}"
+
+    pages = LazyPages(3, build_page)
+
+    assert len(pages) == 3
+    assert built == []
+    assert pages[1] == "page 1"
+    assert pages[1] == "page 1"
+    assert pages[-1] == "page 2"
+    assert built == [1, 2]
+    assert list(pages) == ["page 0", "page 1", "page 2"]
+    assert built == [1, 2, 0]
+
+
+def test_lazy_pages_index_out_of_range():
+    """Test out-of-range pages raise IndexError without building anything."""
+    build_page = MagicMock()
+    pages = LazyPages(2, build_page)
+
+    with pytest.raises(IndexError):
+        pages[2]
+    with pytest.raises(IndexError):
+        pages[-3]
+    build_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_paginate_embeds_lazy_builds_only_first_page():
+    """Test starting a lazy paginator only builds the page it shows."""
+    interaction = MagicMock()
+    interaction.response.is_done.return_value = False
+    interaction.response.send_message = AsyncMock()
+    build_page = MagicMock(side_effect=lambda index: f"page {index}")
+
+    await paginate_embeds_lazy(interaction, 5, build_page)
+
+    build_page.assert_called_once_with(0)
+    assert interaction.response.send_message.await_args.kwargs["embed"] == "page 0"
@@ -0,0 +1,225 @@
+"""Tests for the plugin registry."""
+
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from wisp_framework.feature_flags import FeatureFlags
+from wisp_framework.plugins.manifest import PluginManifest
+from wisp_framework.plugins.migrations import (
+    MIGRATIONS_MANIFEST_NAME,
+    discover_plugin_migrations,
+    write_plugin_migrations_manifest,
+)
+from wisp_framework.plugins.plugin import Plugin
+from wisp_framework.plugins.registry import PluginRegistry, _discovery_cache_path
+
+
+class RecordingPlugin(Plugin):
+    """Plugin that records the lifecycle hooks it receives."""
+
+    def __init__(self, name: str) -> None:
+        self._manifest = PluginManifest(
+            name=name, version="1.0.0", description="", entrypoint=__name__
+        )
+        self.setup_calls = 0
+        self.unloaded = False
+
+    @property
+    def manifest(self) -> PluginManifest:
+        return self._manifest
+
+    async def setup(self, bot, ctx):
+        self.setup_calls += 1
+
+    async def on_unload(self):
+        self.unloaded = True
+
+
+def write_plugin(plugin_dir, name, dependencies=()):
+    """Write a plugin.toml for a plugin whose entrypoint is never imported."""
+    path = plugin_dir / name
+    path.mkdir()
+    deps = ", ".join(f'"{dep}"' for dep in dependencies)
+    manifest_path = path / "plugin.toml"
+    manifest_path.write_text(
+        f'[plugin]\nname = "{name}"\nentrypoint = "missing_{name}"\ndependencies = [{deps}]\n'
+    )
+    return manifest_path
+
+
+def discover(plugin_dir):
+    """Create a registry without a database and discover plugins into it."""
+    registry = PluginRegistry(FeatureFlags(None))
+    registry.discover_plugins(plugin_dir)
+    return registry
+
+
+def test_discover_plugins(tmp_path):
+    """Test discovery records manifests and writes the discovery cache."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha")
+    write_plugin(plugin_dir, "beta", ["alpha"])
+    (plugin_dir / "not_a_plugin").mkdir()
+
+    registry = discover(plugin_dir)
+
+    assert sorted(registry.list_plugins()) == ["alpha", "beta"]
+    assert _discovery_cache_path(plugin_dir).exists()
+
+
+def test_discover_plugins_reads_cache(tmp_path):
+    """Test unchanged manifests are served from the discovery cache."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    manifest_path = write_plugin(plugin_dir, "alpha")
+    discover(plugin_dir)
+
+    # Break the TOML but keep its mtime: only the cache can still name the plugin
+    mtime = manifest_path.stat().st_mtime_ns
+    manifest_path.write_text("not toml")
+    os.utime(manifest_path, ns=(mtime, mtime))
+    assert discover(plugin_dir).list_plugins() == ["alpha"]
+
+    # A changed mtime makes discovery parse the file again
+    os.utime(manifest_path, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+    assert discover(plugin_dir).list_plugins() == []
+
+
+def test_discovery_cache_dir(tmp_path):
+    """Test the discovery cache can be kept outside the plugin directory's parent."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    registry = PluginRegistry(FeatureFlags(None))
+    registry.discover_plugins(plugin_dir, cache_dir=cache_dir)
+
+    assert registry.list_plugins() == ["alpha"]
+    assert _discovery_cache_path(plugin_dir, cache_dir).exists()
+    assert not _discovery_cache_path(plugin_dir).exists()
+
+
+def test_dependency_levels(tmp_path):
+    """Test plugins are grouped after the levels of their dependencies."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha")
+    write_plugin(plugin_dir, "beta", ["alpha"])
+    write_plugin(plugin_dir, "gamma", ["alpha"])
+    write_plugin(plugin_dir, "delta", ["beta", "gamma", "unknown"])
+
+    registry = discover(plugin_dir)
+    order = registry._resolve_dependencies()
+
+    assert order.index("alpha") < order.index("beta") < order.index("delta")
+    assert order.index("gamma") < order.index("delta")
+    assert [sorted(level) for level in registry._dependency_levels()] == [
+        ["alpha"],
+        ["beta", "gamma"],
+        ["delta"],
+    ]
+
+
+def test_circular_dependencies_are_broken(tmp_path):
+    """Test a dependency cycle still yields every plugin exactly once."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha", ["beta"])
+    write_plugin(plugin_dir, "beta", ["alpha"])
+    write_plugin(plugin_dir, "gamma", ["alpha"])
+
+    registry = discover(plugin_dir)
+    order = registry._resolve_dependencies()
+    levels = registry._dependency_levels()
+
+    assert sorted(order) == ["alpha", "beta", "gamma"]
+    assert sorted(name for level in levels for name in level) == ["alpha", "beta", "gamma"]
+    assert order.index("alpha") < order.index("gamma")
+
+
+def test_discover_plugin_migrations(tmp_path):
+    """Test migration discovery scans plugins when there is no manifest."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha")
+    write_plugin(plugin_dir, "beta")
+    alpha_versions = plugin_dir / "alpha" / "migrations" / "versions"
+    alpha_versions.mkdir(parents=True)
+
+    assert discover_plugin_migrations(plugin_dir) == [alpha_versions]
+
+    beta_versions = plugin_dir / "beta" / "migrations" / "versions"
+    beta_versions.mkdir(parents=True)
+    assert discover_plugin_migrations(plugin_dir) == [alpha_versions, beta_versions]
+    assert not (plugin_dir / MIGRATIONS_MANIFEST_NAME).exists()
+    assert discover_plugin_migrations(tmp_path / "missing") == []
+
+
+def test_discover_plugin_migrations_uses_manifest(tmp_path):
+    """Test migration discovery reads a current manifest and ignores a stale one."""
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha")
+    alpha_versions = plugin_dir / "alpha" / "migrations" / "versions"
+    alpha_versions.mkdir(parents=True)
+
+    manifest_path = write_plugin_migrations_manifest(plugin_dir)
+    assert json.loads(manifest_path.read_text()) == {"dirs": ["alpha/migrations/versions"]}
+
+    # A current manifest is trusted without walking the plugins
+    (plugin_dir / "alpha" / "migrations" / "versions").rename(
+        plugin_dir / "alpha" / "migrations" / "moved"
+    )
+    assert discover_plugin_migrations(plugin_dir) == [alpha_versions]
+
+    # Adding a plugin after the manifest was written makes it stale
+    write_plugin(plugin_dir, "beta")
+    beta_versions = plugin_dir / "beta" / "migrations" / "versions"
+    beta_versions.mkdir(parents=True)
+    stat = plugin_dir.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1))
+    assert discover_plugin_migrations(plugin_dir) == [beta_versions]
+
+
+@pytest.mark.asyncio
+async def test_degraded_plugin_is_skipped():
+    """Test setup skips plugins flagged as degraded."""
+    registry = PluginRegistry(FeatureFlags(None))
+    plugin = RecordingPlugin("alpha")
+    registry.register(plugin)
+
+    # Degraded flags only come from the database; seed the cached flag instead
+    registry._db_service = MagicMock()
+    registry._degraded_cache["alpha"] = (True, float("inf"))
+    assert await registry._setup_one("alpha", None, None, None, {}) is None
+    assert plugin.setup_calls == 0
+
+    registry._degraded_cache["alpha"] = (False, float("inf"))
+    assert await registry._setup_one("alpha", None, None, None, {}) is None
+    assert plugin.setup_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_unload_plugin_unregisters_it():
+    """Test unloading a plugin releases it from the registry."""
+    registry = PluginRegistry(FeatureFlags(None))
+    plugin = RecordingPlugin("alpha")
+    registry.register(plugin)
+
+    await registry.load_plugin("alpha", None, None)
+    await registry.unload_plugin("alpha")
+
+    assert plugin.unloaded
+    assert registry.list_plugins() == []
+    assert registry.get_plugin("alpha") is None
+    assert registry.unregister("alpha") is False
+
+    # The name is free to register again
+    registry.register(RecordingPlugin("alpha"))
+    assert registry.list_plugins() == ["alpha"]
@@ -40,3 +40,21 @@ async def test_policy_result():
     assert result.allowed is True
     assert result.reason == "Test reason"
     assert len(result.explain_trace) == 1
+
+
+def test_capability_validate():
+    """Test capability string validation edge cases."""
+    from wisp_framework.policy.capabilities import CapabilityRegistry
+
+    assert CapabilityRegistry.validate(CapabilityRegistry.PLUGINS_DISABLE) is True
+    assert CapabilityRegistry.validate("moderation.kick") is True
+    assert CapabilityRegistry.validate("my_plugin.sub.action_2") is True
+
+    assert CapabilityRegistry.validate("") is False
+    assert CapabilityRegistry.validate("kick") is False
+    assert CapabilityRegistry.validate("moderation..kick") is False
+    assert CapabilityRegistry.validate(".kick") is False
+    assert CapabilityRegistry.validate("moderation.") is False
+    assert CapabilityRegistry.validate("a-_.b") is False
+    assert CapabilityRegistry.validate("moderation.kick\n") is False
+    assert CapabilityRegistry.validate(None) is False
@@ -0,0 +1,98 @@
+"""Tests for the scheduler service."""
+
+import asyncio
+
+import pytest
+
+from wisp_framework.services.scheduler import SchedulerService
+
+
+async def start_scheduler() -> SchedulerService:
+    """Create and start a scheduler service."""
+    scheduler = SchedulerService(None)
+    await scheduler.startup()
+    return scheduler
+
+
+@pytest.mark.asyncio
+async def test_jobs_share_one_dispatcher():
+    """Test jobs run immediately, then repeat on their own intervals."""
+    scheduler = await start_scheduler()
+    runs: list[str] = []
+
+    async def fast():
+        runs.append("fast")
+
+    async def slow():
+        runs.append("slow")
+
+    try:
+        scheduler.register(fast, 0.01)
+        dispatcher = scheduler._dispatcher
+        scheduler.register(slow, 10)
+        assert scheduler._dispatcher is dispatcher
+
+        await asyncio.sleep(0.1)
+    finally:
+        await scheduler.shutdown()
+
+    assert runs.count("slow") == 1
+    assert runs.count("fast") >= 3
+    assert dispatcher.done()
+
+
+@pytest.mark.asyncio
+async def test_failing_job_is_rescheduled():
+    """Test a job that raises keeps running on later ticks."""
+    scheduler = await start_scheduler()
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("boom")
+
+    try:
+        scheduler.register(flaky, 0.01)
+        await asyncio.sleep(0.1)
+    finally:
+        await scheduler.shutdown()
+
+    assert calls >= 2
+
+
+@pytest.mark.asyncio
+async def test_slow_run_does_not_delay_other_jobs():
+    """Test a long-running job doesn't hold up jobs that come due meanwhile."""
+    scheduler = await start_scheduler()
+    blocker = asyncio.Event()
+    ticks = 0
+
+    async def blocked():
+        await blocker.wait()
+
+    async def tick():
+        nonlocal ticks
+        ticks += 1
+
+    try:
+        scheduler.register(blocked, 0.01)
+        scheduler.register(tick, 0.01)
+        await asyncio.sleep(0.1)
+        assert ticks >= 3
+    finally:
+        await scheduler.shutdown()
+
+    assert scheduler._runs == set()
+    assert scheduler._queue == []
+
+
+@pytest.mark.asyncio
+async def test_register_requires_running_scheduler():
+    """Test registering before startup is rejected."""
+
+    async def job():
+        pass
+
+    with pytest.raises(RuntimeError):
+        SchedulerService(None).register(job, 1)